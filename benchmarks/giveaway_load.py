@@ -0,0 +1,262 @@
+"""
+Load test for the giveaway entry path.
+
+Creates a giveaway and fires a storm of simulated Enter/Leave button clicks at
+the real Giveaways cog, spread over a time window, with a throwaway SQLite
+database and stubbed Discord objects standing in for the HTTP layer. Reports
+click acknowledgement latency percentiles, database commits, giveaway message
+edits, winner draw time and peak memory, so changes to the entry path can be
+measured.
+
+Usage:
+    python benchmarks/giveaway_load.py [--clicks 20000] [--window 10] [--users 5000]
+        [--max-entries 3] [--leave-ratio 0.1] [--winners 10] [--trace-memory]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+import discord
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+GUILD_ID = 1000
+CHANNEL_ID = 2000
+MESSAGE_ID = 3000
+
+
+class StubUser:
+    def __init__(self, user_id: int):
+        self.id = user_id
+
+    def __str__(self) -> str:
+        return f"user{self.id}"
+
+
+class StubMember(discord.Member):
+    """A real discord.Member subclass (the cog checks isinstance) with no gateway state."""
+
+    def __init__(self, user_id: int, guild: "StubGuild"):
+        self._user = StubUser(user_id)
+        self._roles = discord.utils.SnowflakeList([])
+        self.guild = guild
+
+
+class StubChannel:
+    id = CHANNEL_ID
+
+    def __init__(self, message: "StubMessage"):
+        self.message = message
+
+    async def fetch_message(self, message_id: int) -> "StubMessage":
+        return self.message
+
+    async def send(self, *args, **kwargs) -> "StubMessage":
+        return self.message
+
+
+class StubMessage:
+    id = MESSAGE_ID
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.edits = 0
+        self.channel = StubChannel(self)
+
+    async def edit(self, **kwargs) -> "StubMessage":
+        await asyncio.sleep(self.latency)
+        self.edits += 1
+        return self
+
+
+class StubGuild:
+    id = GUILD_ID
+    name = "Load test"
+    filesize_limit = 25 * 1024 * 1024
+
+    def __init__(self, message: StubMessage):
+        self.message = message
+
+    def get_channel(self, channel_id: int) -> StubChannel:
+        return self.message.channel
+
+    async def fetch_channel(self, channel_id: int) -> StubChannel:
+        return self.message.channel
+
+    def get_member(self, user_id: int):
+        return None
+
+    def get_role(self, role_id: int):
+        return None
+
+
+class StubResponse:
+    def __init__(self, interaction: "StubInteraction"):
+        self.interaction = interaction
+
+    async def send_message(self, *args, **kwargs) -> None:
+        self.interaction.acked_at = time.perf_counter()
+
+
+class StubInteraction:
+    def __init__(self, guild: StubGuild, member: StubMember):
+        self.guild = guild
+        self.user = member
+        self.message = guild.message
+        self.response = StubResponse(self)
+        self.acked_at = 0.0
+
+
+class StubBot:
+    def add_dynamic_items(self, *items) -> None:
+        pass
+
+    def remove_dynamic_items(self, *items) -> None:
+        pass
+
+    def get_guild(self, guild_id: int):
+        return None
+
+    async def wait_until_ready(self) -> None:
+        # Keeps the cog's overdue sweep parked; it has nothing to do here.
+        await asyncio.Event().wait()
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run(args: argparse.Namespace) -> None:
+    import cogs.giveaways as giveaways
+
+    statements = {"commits": 0}
+
+    def trace(sql: str) -> None:
+        if sql == "COMMIT":
+            statements["commits"] += 1
+
+    giveaways.conn.set_trace_callback(trace)
+
+    cog = giveaways.Giveaways(StubBot())
+    if args.flush_ms is not None:
+        cog.entry_flush_interval = args.flush_ms / 1000
+        cog._entry_flush_loop.change_interval(seconds=cog.entry_flush_interval)
+    if args.refresh_interval is not None:
+        cog.refresh_interval = args.refresh_interval
+
+    now = giveaways.unix_now()
+    giveaways.cursor.execute(
+        "INSERT INTO giveaways (guild_id, channel_id, message_id, prize, host_id, start_time, end_time, "
+        "winner_count, status, max_entries_per_user) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'running', ?)",
+        (GUILD_ID, CHANNEL_ID, MESSAGE_ID, "Load test", 1, now, now + 86400, args.winners, args.max_entries),
+    )
+    giveaways.conn.commit()
+    giveaway_id = giveaways.cursor.lastrowid
+
+    message = StubMessage(args.edit_latency_ms / 1000)
+    guild = StubGuild(message)
+    members = [StubMember(10_000 + i, guild) for i in range(args.users)]
+
+    rng = random.Random(args.seed)
+    clicks = sorted(
+        (
+            rng.uniform(0, args.window),
+            "giveaway_leave" if rng.random() < args.leave_ratio else "giveaway_enter",
+            rng.choice(members),
+        )
+        for _ in range(args.clicks)
+    )
+    latencies: List[float] = []
+
+    async def click(offset: float, action: str, member: StubMember, started: float) -> None:
+        await asyncio.sleep(max(0.0, started + offset - time.perf_counter()))
+        interaction = StubInteraction(guild, member)
+        sent = time.perf_counter()
+        await cog.handle_entry_button(interaction, action, giveaway_id)
+        if interaction.acked_at:
+            latencies.append(interaction.acked_at - sent)
+
+    statements["commits"] = 0
+    if args.trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(click(offset, action, member, started) for offset, action, member in clicks))
+    storm_s = time.perf_counter() - started
+
+    # Let the last coalesced refresh land before counting edits.
+    while cog.refresh_tasks:
+        await asyncio.gather(*cog.refresh_tasks.values(), return_exceptions=True)
+
+    draw_started = time.perf_counter()
+    winners = cog._draw_winners(giveaway_id, args.winners, 12345)
+    draw_s = time.perf_counter() - draw_started
+    heap_peak = tracemalloc.get_traced_memory()[1] if args.trace_memory else None
+    if args.trace_memory:
+        tracemalloc.stop()
+
+    row = cog._fetch_giveaway(giveaway_id)
+    latencies.sort()
+    print(
+        f"{args.clicks} clicks from {args.users} users over {args.window:.0f}s "
+        f"(ran {storm_s:.2f}s, {args.clicks / storm_s:.0f} clicks/s)"
+    )
+    print(
+        "  ack latency ms:  "
+        + "  ".join(
+            f"p{p} {percentile(latencies, p) * 1000:.2f}" for p in (50, 90, 99)
+        )
+        + f"  max {latencies[-1] * 1000 if latencies else 0:.2f}"
+    )
+    print(f"  db commits:      {statements['commits']}")
+    print(f"  message edits:   {message.edits}")
+    print(
+        f"  final counts:    {row['entry_count']} entries, {row['unique_entrants']} entrants"
+    )
+    print(f"  draw:            {draw_s * 1000:.2f} ms for {len(winners)} winners (includes final flush)")
+    if heap_peak is not None:
+        print(f"  python heap peak {heap_peak / 1_048_576:.1f} MB (tracemalloc)")
+    print(f"  peak RSS:        {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+    cog.cog_unload()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the giveaway entry path.")
+    parser.add_argument("--clicks", type=int, default=20000)
+    parser.add_argument("--window", type=float, default=10.0, help="Seconds the clicks are spread over.")
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--max-entries", type=int, default=3)
+    parser.add_argument("--leave-ratio", type=float, default=0.1)
+    parser.add_argument("--winners", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--edit-latency-ms", type=float, default=50.0, help="Simulated message edit round trip.")
+    parser.add_argument("--flush-ms", type=int, default=None, help="Override giveaway.entry_flush_ms.")
+    parser.add_argument("--refresh-interval", type=float, default=None, help="Override giveaway.refresh_interval.")
+    parser.add_argument("--trace-memory", action="store_true", help="Also report the Python heap peak (slower).")
+    args = parser.parse_args()
+
+    # The cog opens database.db and config.yaml in the working directory, so run
+    # from a scratch directory with a copy of the config and a fresh database.
+    with tempfile.TemporaryDirectory() as cwd:
+        config = os.path.join(ROOT, "config.yaml")
+        if os.path.exists(config):
+            shutil.copy(config, cwd)
+        os.chdir(cwd)
+        asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Import-time profile for every cog, with a budget.
+
+Each cog is imported in a fresh interpreter under `python -X importtime`, after
+the modules every cog shares (discord, yaml, ...) have already been imported, so
+the number reported per cog is what that cog adds on top of the shared base.
+Exits with status 1 when the total, or any single cog, goes over its budget,
+so it can be run as a check before deploying.
+
+Usage:
+    python benchmarks/import_time.py [--budget-ms 150] [--cog-budget-ms 50] [--repeat 3]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imported before the cog so that shared dependencies are not charged to it.
+SHARED_PRELUDE = (
+    "import discord, yaml, datetime, logging, sqlite3, asyncio; "
+    "from discord.ext import commands, tasks; "
+    "from discord import app_commands; "
+)
+
+LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, int, int, str]]:
+    """Return (self_us, cumulative_us, depth, module) for each -X importtime line."""
+    rows = []
+    for line in stderr.splitlines():
+        m = LINE.match(line)
+        if m:
+            depth = (len(m.group(3)) - 1) // 2
+            rows.append((int(m.group(1)), int(m.group(2)), depth, m.group(4)))
+    return rows
+
+
+def run_importtime(code: str, cwd: str) -> List[Tuple[int, int, int, str]]:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return parse_importtime(proc.stderr)
+
+
+def profile_cog(module: str, cwd: str, repeat: int) -> Tuple[float, List[Tuple[str, float]]]:
+    """Best-of-N cumulative import time of one cog in ms, plus its heaviest direct imports."""
+    best_ms = None
+    best_children: List[Tuple[str, float]] = []
+    for _ in range(repeat):
+        rows = run_importtime(f"{SHARED_PRELUDE}import {module}", cwd)
+        total = next((cum for _, cum, depth, name in rows if name == module and depth == 0), None)
+        if total is None:
+            continue
+        ms = total / 1000
+        if best_ms is None or ms < best_ms:
+            best_ms = ms
+            # Rows are printed children-first, so the cog's direct imports precede it.
+            idx = next(i for i, r in enumerate(rows) if r[3] == module and r[2] == 0)
+            start = idx
+            while start > 0 and rows[start - 1][2] > 0:
+                start -= 1
+            best_children = sorted(
+                ((name, cum / 1000) for _, cum, depth, name in rows[start:idx] if depth == 1),
+                key=lambda c: c[1],
+                reverse=True,
+            )[:3]
+    return (best_ms or 0.0), best_children
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="Budget for all cogs together.")
+    parser.add_argument("--cog-budget-ms", type=float, default=50.0, help="Budget for any single cog.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per cog; the fastest is kept.")
+    args = parser.parse_args()
+
+    cogs = sorted(
+        f"cogs.{name[:-3]}"
+        for name in os.listdir(os.path.join(ROOT, "cogs"))
+        if name.endswith(".py")
+    )
+
+    # Run from a scratch directory so cogs that open database.db at import
+    # never touch the real database.
+    with tempfile.TemporaryDirectory() as cwd:
+        base_rows = run_importtime(SHARED_PRELUDE.rstrip("; "), cwd)
+        shared_ms = sum(cum for _, cum, depth, _ in base_rows if depth == 0) / 1000
+
+        results: Dict[str, Tuple[float, List[Tuple[str, float]]]] = {}
+        for module in cogs:
+            try:
+                results[module] = profile_cog(module, cwd, max(1, args.repeat))
+            except RuntimeError as e:
+                print(f"{module}: failed to import ({e})")
+                return 1
+
+    total_ms = sum(ms for ms, _ in results.values())
+    print(f"Shared base (discord, yaml, ...): {shared_ms:8.1f} ms")
+    print(f"{'cog':32} {'ms':>8}  heaviest imports")
+    over: List[str] = []
+    for module, (ms, children) in sorted(results.items(), key=lambda r: r[1][0], reverse=True):
+        heavy = ", ".join(f"{name} {cms:.1f}" for name, cms in children)
+        flag = " !" if ms > args.cog_budget_ms else ""
+        print(f"{module:32} {ms:8.1f}{flag}  {heavy}")
+        if ms > args.cog_budget_ms:
+            over.append(f"{module} took {ms:.1f} ms (budget {args.cog_budget_ms:.0f} ms)")
+    print(f"{'total (cogs only)':32} {total_ms:8.1f}  budget {args.budget_ms:.0f} ms")
+
+    if total_ms > args.budget_ms:
+        over.append(f"all cogs took {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if over:
+        print("\nImport budget exceeded:\n  " + "\n  ".join(over))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
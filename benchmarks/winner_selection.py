@@ -0,0 +1,100 @@
+"""
+Benchmark for giveaway winner selection.
+
+Compares the old ticket-list draw (one list element per entry, rebuilt after
+every pick) with the exponential-key sampler in utils/sampling.py, and checks
+that both pick winners with the same probabilities on a small example.
+
+Usage:
+    python benchmarks/winner_selection.py [--entrants 5000] [--max-entries 50] [--winners 10]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sampling import weighted_sample_without_replacement  # noqa: E402
+
+
+def ticket_draw(entrants: List[Tuple[int, int]], k: int, rng: random.Random) -> List[int]:
+    """The previous implementation, kept here as the baseline."""
+    tickets: List[int] = []
+    for uid, entries in entrants:
+        tickets.extend([uid] * max(1, entries))
+    winners: List[int] = []
+    while tickets and len(winners) < k:
+        pick_uid = rng.choice(tickets)
+        if pick_uid not in winners:
+            winners.append(pick_uid)
+        tickets = [u for u in tickets if u != pick_uid]
+    return winners
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def check_distribution(trials: int) -> None:
+    """Both draws should give each user the same chance of winning with 2 of 4 slots."""
+    entrants = [(1, 1), (2, 2), (3, 3), (4, 10)]
+    old, new = Counter(), Counter()
+    rng = random.Random(1234)
+    for _ in range(trials):
+        old.update(ticket_draw(entrants, 2, rng))
+        new.update(weighted_sample_without_replacement(entrants, 2, rng))
+    print(f"Win rate with 2 winners over {trials} draws (entries 1/2/3/10):")
+    for uid, entries in entrants:
+        print(
+            f"  user {uid} ({entries:>2} entries): tickets {old[uid] / trials:6.3f}  "
+            f"exponential keys {new[uid] / trials:6.3f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark giveaway winner selection.")
+    parser.add_argument("--entrants", type=int, default=5000)
+    parser.add_argument("--max-entries", type=int, default=50)
+    parser.add_argument("--winners", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--trials", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    entrants = [
+        (100000 + i, rng.randint(1, args.max_entries)) for i in range(args.entrants)
+    ]
+    total_tickets = sum(e for _, e in entrants)
+    print(
+        f"{args.entrants} entrants, {total_tickets} tickets, {args.winners} winners"
+    )
+
+    old_s = best_of(lambda: ticket_draw(entrants, args.winners, random.Random(7)), args.repeat)
+    new_s = best_of(
+        lambda: weighted_sample_without_replacement(entrants, args.winners, random.Random(7)),
+        args.repeat,
+    )
+    print(f"  ticket list:       {old_s * 1000:9.2f} ms")
+    print(f"  exponential keys:  {new_s * 1000:9.2f} ms  ({old_s / new_s:.0f}x faster)")
+
+    seed = 987654321
+    a = weighted_sample_without_replacement(entrants, args.winners, random.Random(seed))
+    b = weighted_sample_without_replacement(entrants, args.winners, random.Random(seed))
+    print(f"  same seed replays the same winners: {a == b}")
+    print()
+    check_distribution(args.trials)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,8 @@ import sqlite3
 import unicodedata
 import asyncio
 
+from utils.cache import response_cache
+
 DATABASE_PATH = "database.db"
 HISTORY_THROTTLE_BATCH = 200
 HISTORY_THROTTLE_SLEEP = 1.0
@@ -83,6 +85,26 @@ def increment_sb_stat(table: str, id_value: int):
             (id_value,),
         )
         conn.commit()
+    # The counts are global, so every guild's cached leaderboard is stale.
+    response_cache.invalidate("secondbest_stats")
+
+
+def replace_sb_counts(user_counts: dict, channel_counts: dict):
+    """Swap both leaderboard tables for freshly computed counts in one transaction."""
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        c = conn.cursor()
+        c.execute("DELETE FROM second_best_user_count")
+        c.execute("DELETE FROM second_best_channel_count")
+        c.executemany(
+            "INSERT INTO second_best_user_count (user_id, count) VALUES (?, ?)",
+            user_counts.items(),
+        )
+        c.executemany(
+            "INSERT INTO second_best_channel_count (channel_id, count) VALUES (?, ?)",
+            channel_counts.items(),
+        )
+        conn.commit()
+    response_cache.invalidate("secondbest_stats")
 
 
 def get_top_sb_users(limit=5):
@@ -119,23 +141,23 @@ class SecondBestTracker(commands.Cog):
                 f"(ID: {message.author.id})."
             )
 
-    @app_commands.command(
-        name="secondbest_stats",
-        description="Show Second Best trigger leaderboard (top users and channels)",
-    )
-    async def secondbest_stats(self, interaction: discord.Interaction):
+    def _stats_embed(self, guild: discord.Guild) -> discord.Embed:
+        cached = response_cache.get("secondbest_stats", guild.id)
+        if cached is not None:
+            return discord.Embed.from_dict(cached)
+
         top_users = get_top_sb_users(5)
         top_channels = get_top_sb_channels(5)
 
         user_lines = []
         for user_id, count in top_users:
-            member = interaction.guild.get_member(user_id)
+            member = guild.get_member(user_id)
             name = member.display_name if member else f"User {user_id}"
             user_lines.append(f"**{name}**: {count}")
 
         channel_lines = []
         for channel_id, count in top_channels:
-            channel = interaction.guild.get_channel(channel_id)
+            channel = guild.get_channel(channel_id)
             mention = channel.mention if channel else f"Channel {channel_id}"
             channel_lines.append(f"{mention}: {count}")
 
@@ -154,7 +176,15 @@ class SecondBestTracker(commands.Cog):
             value="\n".join(channel_lines) if channel_lines else "No triggers yet.",
             inline=False,
         )
+        response_cache.set("secondbest_stats", guild.id, embed.to_dict())
+        return embed
 
+    @app_commands.command(
+        name="secondbest_stats",
+        description="Show Second Best trigger leaderboard (top users and channels)",
+    )
+    async def secondbest_stats(self, interaction: discord.Interaction):
+        embed = self._stats_embed(interaction.guild)
         await interaction.response.send_message(embed=embed)
         audit_log(
             f"{interaction.user.name} (ID: {interaction.user.id}) used "
@@ -180,6 +210,17 @@ class SecondBestTracker(commands.Cog):
         from datetime import datetime
         start_time = datetime.now()
 
+        archive = self.bot.get_cog("MessageArchive")
+        # The archive must be complete and caught up with anything posted while the
+        # bot was offline, or the local counts would come out low.
+        if (
+            archive is not None
+            and archive.backfill_complete(guild)
+            and await archive.catch_up(guild)
+        ):
+            await self._local_rescan(archive, guild, user, start_time)
+            return
+
         with sqlite3.connect(DATABASE_PATH) as conn:
             c = conn.cursor()
             c.execute("DELETE FROM second_best_user_count")
@@ -242,6 +283,39 @@ class SecondBestTracker(commands.Cog):
         except discord.Forbidden:
             audit_log(f"Could not DM user {user.id} after rescan.")
 
+    async def _local_rescan(self, archive, guild: discord.Guild, user: discord.User, start_time):
+        """Rescan from the local message archive instead of paging the Discord API."""
+        from datetime import datetime
+        logging.info(f"Rescanning {guild.name} from the local message archive...")
+        audit_log(f"Rescanning {guild.name} for 'second best' from the local message archive.")
+
+        archive.flush()
+        # Same channels as the API scan: threads and channels the bot can no longer
+        # read are archived but not counted.
+        channel_ids = [ch.id for ch in archive.readable_channels(guild)]
+        by_user, by_channel, total_messages = await asyncio.to_thread(
+            archive.count_matches, guild.id, contains_second_best, False, channel_ids
+        )
+        replace_sb_counts(by_user, by_channel)
+        total_count = sum(by_user.values())
+
+        elapsed = (datetime.now() - start_time).total_seconds()
+        summary = (
+            f"Rescan complete (archive). {total_count} matches found across {total_messages} messages "
+            f"in {elapsed:.1f} seconds."
+        )
+        logging.info(summary)
+        audit_log(summary)
+
+        try:
+            await user.send(
+                f"✅ Second Best rescan complete for **{guild.name}**.\n"
+                f"**{total_count}** matches found across **{total_messages}** archived messages "
+                f"in `{elapsed:.1f}` seconds."
+            )
+        except discord.Forbidden:
+            audit_log(f"Could not DM user {user.id} after rescan.")
+
     @commands.Cog.listener()
     async def on_ready(self):
         logging.info("\033[96mSecondBestTracker\033[0m cog synced successfully.")
@@ -1,12 +1,17 @@
 import re
+import math
 import discord
 import logging
 import sqlite3
 import asyncio
+import yaml
 from discord import app_commands
 from discord.ext import commands
 import datetime
-from typing import Optional, Dict, Iterable, Sequence, Union, List, Set
+from typing import Optional, Dict, Iterable, Sequence, Union, List, Set, Tuple
+
+from utils.metrics import metrics
+from utils.paginator import LazyPagedView
 
 # ============================================================
 # Discord embed limits and pagination helpers
@@ -35,80 +40,6 @@ def embed_length(embed: discord.Embed) -> int:
     return total
 
 
-class PagedView(discord.ui.View):
-    """Button view that paginates through a list of embeds. Restricted to the requesting user."""
-
-    def __init__(
-        self, user_id: int, pages: List[discord.Embed], timeout: Optional[float] = 120
-    ):
-        super().__init__(timeout=timeout)
-        self.user_id = user_id
-        self.pages = pages
-        self.index = 0
-        self._update_button_states()
-
-    def _update_button_states(self):
-        for child in self.children:
-            if isinstance(child, discord.ui.Button):
-                if child.custom_id == "first":
-                    child.disabled = self.index == 0
-                elif child.custom_id == "prev":
-                    child.disabled = self.index == 0
-                elif child.custom_id == "next":
-                    child.disabled = self.index >= len(self.pages) - 1
-                elif child.custom_id == "last":
-                    child.disabled = self.index >= len(self.pages) - 1
-
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message(
-                "Only the requester can use these buttons.", ephemeral=True
-            )
-            return False
-        return True
-
-    async def _show(self, interaction: discord.Interaction):
-        self._update_button_states()
-        try:
-            await interaction.response.edit_message(
-                embed=self.pages[self.index], view=self
-            )
-        except discord.InteractionResponded:
-            await interaction.edit_original_response(
-                embed=self.pages[self.index], view=self
-            )
-
-    @discord.ui.button(
-        label="⏮ First", style=discord.ButtonStyle.secondary, custom_id="first"
-    )
-    async def first(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.index = 0
-        await self._show(interaction)
-
-    @discord.ui.button(
-        label="◀ Previous", style=discord.ButtonStyle.secondary, custom_id="prev"
-    )
-    async def prev(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.index > 0:
-            self.index -= 1
-        await self._show(interaction)
-
-    @discord.ui.button(
-        label="Next ▶", style=discord.ButtonStyle.secondary, custom_id="next"
-    )
-    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.index < len(self.pages) - 1:
-            self.index += 1
-        await self._show(interaction)
-
-    @discord.ui.button(
-        label="Last ⏭", style=discord.ButtonStyle.secondary, custom_id="last"
-    )
-    async def last(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.index = len(self.pages) - 1
-        await self._show(interaction)
-
-
 # ============================================================
 # Sticky system
 # ============================================================
@@ -119,9 +50,19 @@ STICKY_MARKER = "\u200b\u200c\u200d\u2060"
 # Pattern that matches any run of our zero-width characters anywhere in text.
 ZERO_WIDTH_RUN = re.compile(r"[\u200b\u200c\u200d\u2060]+")
 
-# How deep we manually scan when hunting for stale stickies (older than 14d, etc.)
+# How deep /repairstickies scans history when hunting for stickies the ledger does not know about
 MANUAL_SCAN_LIMIT = 2000
 
+# Discord bulk-deletes at most 100 messages per call, and only messages younger than
+# 14 days; older ones are deleted one by one. The margin covers clock skew.
+BULK_DELETE_BATCH = 100
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14) - datetime.timedelta(minutes=5)
+
+# Floors for the configured repost cadence (seconds), so a config can never turn the
+# debounce or the repost cap off entirely.
+MIN_DEBOUNCE = 0.5
+MIN_COOLDOWN = 5.0
+
 
 def audit_log(message: str):
     """Append a timestamped message to the audit log file."""
@@ -436,6 +377,18 @@ class StickyModal(discord.ui.Modal, title="Set Sticky Message"):
         )
 
 
+class RepostTimer:
+    """Coalescing state for one sticky channel: a single armed loop timer and its deadline."""
+
+    __slots__ = ("channel", "first_at", "deadline", "handle")
+
+    def __init__(self, channel: GuildTextLike, first_at: float, deadline: float):
+        self.channel = channel
+        self.first_at = first_at
+        self.deadline = deadline
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+
 class StickyMessages(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -452,29 +405,138 @@ class StickyMessages(commands.Cog):
             self.db.execute(
                 "ALTER TABLE sticky_messages ADD COLUMN color INTEGER DEFAULT 0"
             )
+        # Every sticky message the bot posts, until it is deleted, so cleanup can
+        # delete known ids instead of scanning channel history.
+        ledger_existed = self.db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sticky_ledger'"
+        ).fetchone()
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS sticky_ledger (message_id INTEGER PRIMARY KEY, channel_id INTEGER NOT NULL, posted_at INTEGER NOT NULL)"
+        )
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sticky_ledger_channel ON sticky_ledger(channel_id)"
+        )
+        if not ledger_existed:
+            # Start from the stickies currently tracked; anything older needs /repairstickies.
+            self.db.execute(
+                "INSERT OR IGNORE INTO sticky_ledger (message_id, channel_id, posted_at) "
+                "SELECT message_id, channel_id, CAST(strftime('%s', 'now') AS INTEGER) "
+                "FROM sticky_messages WHERE message_id IS NOT NULL"
+            )
         self.db.commit()
         self.load_stickies()
 
         # Concurrency and debouncing
         self.locks: Dict[int, asyncio.Lock] = {}
-        self.debounce_tasks: Dict[int, asyncio.Task] = {}
+        # At most one armed timer per channel; messages only move its deadline.
+        self.repost_timers: Dict[int, RepostTimer] = {}
+        # Repost runs started by fired timers (task -> channel id), referenced so they
+        # are not garbage collected and can be stopped on unload.
+        self._repost_runs: Dict[asyncio.Task, int] = {}
         self.last_repost_times: Dict[int, float] = {}
-        self.last_cleanup_times: Dict[int, float] = {}
+        # Newest message id per sticky channel, kept current from gateway create/delete
+        # events. A missing entry means "unknown" and falls back to one REST history call.
+        self.last_message_ids: Dict[int, int] = {}
         # Channels currently undergoing an intentional sticky removal.
         self._suppress_repost: Set[int] = set()
-        # Use a slightly longer debounce window to reduce churn and duplicates during active chat
-        self.debounce_interval = 1.2
-        # Hard cap for how often a sticky is reposted in busy channels.
-        self.repost_cooldown = 20.0
-        # How often to run a lightweight duplicate cleanup during normal repost cycles.
-        self.cleanup_interval = 600.0
+        # Repost cadence follows each channel's message rate: quiet channels get the
+        # minimum debounce and cooldown, busy ones (where a sticky scrolls away at once)
+        # back off towards the maximum. Rates are in messages per minute.
+        self.debounce_bounds = (1.0, 4.0)
+        self.cooldown_bounds = (10.0, 90.0)
+        self.quiet_rate = 1.0
+        self.busy_rate = 60.0
+        # Time constant, in seconds, of the exponentially weighted message rate.
+        self.rate_window = 60.0
+        # A steady stream of messages cannot push a pending repost back further than this.
+        self.debounce_max_wait = 5.0
+        # channel_id -> (messages per second, loop time it was last updated)
+        self.message_rates: Dict[int, Tuple[float, float]] = {}
+        self._load_cadence_config()
+
+    def _load_cadence_config(self):
+        try:
+            with open("config.yaml", "r", encoding="utf-8") as f:
+                cfg = (yaml.safe_load(f) or {}).get("sticky", {}) or {}
+            self.debounce_bounds = self._cadence_bounds(
+                cfg, "debounce", self.debounce_bounds, MIN_DEBOUNCE
+            )
+            self.cooldown_bounds = self._cadence_bounds(
+                cfg, "cooldown", self.cooldown_bounds, MIN_COOLDOWN
+            )
+            self.quiet_rate = max(0.01, float(cfg.get("quiet_rate", self.quiet_rate)))
+            self.busy_rate = max(
+                self.quiet_rate * 2, float(cfg.get("busy_rate", self.busy_rate))
+            )
+            self.rate_window = max(1.0, float(cfg.get("rate_window", self.rate_window)))
+            self.debounce_max_wait = max(
+                0.1, float(cfg.get("debounce_max_wait", self.debounce_max_wait))
+            )
+        except Exception as e:
+            logging.warning(f"Sticky: failed to load config.yaml, using defaults. {e}")
+
+    @staticmethod
+    def _cadence_bounds(
+        cfg: Dict, name: str, default: Tuple[float, float], floor: float
+    ) -> Tuple[float, float]:
+        """Read <name>_min / <name>_max, raised to the floor and put back in order if swapped."""
+        low = max(floor, float(cfg.get(f"{name}_min", default[0])))
+        high = max(floor, float(cfg.get(f"{name}_max", default[1])))
+        if low > high:
+            logging.warning(
+                f"Sticky: {name}_min ({low}) is above {name}_max ({high}); swapping them."
+            )
+            low, high = high, low
+        return low, high
+
+    def _stop_repost_runs(self) -> List[int]:
+        """Cancel in-flight repost runs; returns the channels they were for."""
+        channels = list(self._repost_runs.values())
+        for task in list(self._repost_runs):
+            task.cancel()
+        self._repost_runs.clear()
+        return channels
 
     def cog_unload(self):
+        for channel_id in list(self.repost_timers):
+            self._cancel_repost_timer(channel_id)
+        self._stop_repost_runs()
         try:
             self.db.close()
         except Exception as e:
             logging.error(f"Error closing Sticky cog database: {e}")
 
+    def export_state(self) -> Dict:
+        """Hand in-memory state to the next instance when this cog is hot-reloaded."""
+        # Pending repost timers and runs belong to this instance, so stop them and
+        # let the new instance re-arm them for the same channels.
+        pending: List[int] = list(self.repost_timers)
+        for channel_id in pending:
+            self._cancel_repost_timer(channel_id)
+        pending.extend(c for c in self._stop_repost_runs() if c not in pending)
+        return {
+            "locks": self.locks,
+            "last_repost_times": self.last_repost_times,
+            "last_message_ids": self.last_message_ids,
+            "message_rates": self.message_rates,
+            "suppress_repost": self._suppress_repost,
+            "pending_updates": pending,
+        }
+
+    def import_state(self, state: Dict):
+        """Adopt state exported by the previous instance (see export_state)."""
+        # Reuse the same lock objects so in-flight work on the old instance stays serialised.
+        self.locks.update(state.get("locks", {}))
+        self.last_repost_times.update(state.get("last_repost_times", {}))
+        self.last_message_ids.update(state.get("last_message_ids", {}))
+        self.message_rates.update(state.get("message_rates", {}))
+        self._suppress_repost.update(state.get("suppress_repost", set()))
+        for channel_id in state.get("pending_updates", []):
+            channel = self.bot.get_channel(channel_id)
+            if channel is None or channel_id not in self.stickies:
+                continue
+            self._schedule_repost(channel)
+
     def load_stickies(self):
         self.stickies = {}
         cursor = self.db.execute(
@@ -510,10 +572,55 @@ class StickyMessages(commands.Cog):
         )
         self.db.commit()
 
+    def _ledger_add(self, channel_id: int, message_id: int):
+        self.db.execute(
+            "INSERT OR IGNORE INTO sticky_ledger (message_id, channel_id, posted_at) VALUES (?, ?, ?)",
+            (message_id, channel_id, int(datetime.datetime.now(datetime.timezone.utc).timestamp())),
+        )
+        self.db.commit()
+
+    def _ledger_ids(self, channel_id: int) -> List[int]:
+        return [
+            r[0]
+            for r in self.db.execute(
+                "SELECT message_id FROM sticky_ledger WHERE channel_id = ?", (channel_id,)
+            )
+        ]
+
+    def _ledger_remove(self, message_ids: Iterable[int]):
+        self.db.executemany(
+            "DELETE FROM sticky_ledger WHERE message_id = ?", [(i,) for i in message_ids]
+        )
+        self.db.commit()
+
     # -----------------------
     # Utility and helpers
     # -----------------------
 
+    def _note_message(self, channel_id: int, message_id: int):
+        """Record a message seen in a sticky channel; snowflakes only grow, so keep the max."""
+        if message_id > self.last_message_ids.get(channel_id, 0):
+            self.last_message_ids[channel_id] = message_id
+
+    def _forget_messages(self, channel_id: int, message_ids: Iterable[int]):
+        """Drop the index entry if its newest message was deleted; the one before it is unknown."""
+        last_id = self.last_message_ids.get(channel_id)
+        if last_id is not None and last_id in message_ids:
+            self.last_message_ids.pop(channel_id, None)
+
+    async def _latest_message_id(self, channel: GuildTextLike) -> Optional[int]:
+        """Newest message id in the channel, from the index or, after a gap, one history call."""
+        last_id = self.last_message_ids.get(channel.id)
+        if last_id is not None:
+            metrics.incr("stickies.latest_index_hits")
+            return last_id
+        metrics.incr("stickies.latest_history_calls")
+        latest = [m async for m in channel.history(limit=1)]
+        if not latest:
+            return None
+        self._note_message(channel.id, latest[0].id)
+        return self.last_message_ids[channel.id]
+
     def _is_message_sticky(self, msg: discord.Message) -> bool:
         """Detect our sticky messages robustly, both text and embed forms."""
         if msg.author.id != (self.bot.user.id if self.bot.user else 0):
@@ -541,74 +648,89 @@ class StickyMessages(commands.Cog):
     async def _manual_sweep_for_stickies(
         self,
         channel: GuildTextLike,
-        skip_ids: Optional[Sequence[int]] = None,
+        keep_id: Optional[int] = None,
         limit: int = MANUAL_SCAN_LIMIT,
-    ):
-        """Manually scan recent history and delete any detected stickies, regardless of age."""
-        skip = set(skip_ids or [])
-        deleted = 0
+    ) -> int:
+        """Repair mode: scan recent history for stickies the ledger does not know about,
+        record them, then delete everything in the ledger except keep_id. Returns
+        the number of untracked stickies found."""
+        known = set(self._ledger_ids(channel.id))
+        found = 0
         try:
             async for msg in channel.history(limit=limit):
-                if msg.id in skip:
+                if msg.id == keep_id or msg.id in known:
                     continue
                 if self._is_message_sticky(msg):
-                    try:
-                        await msg.delete()
-                        deleted += 1
-                    except Exception as e:
-                        logging.warning(f"Manual delete failed in #{channel.name}: {e}")
+                    self._ledger_add(channel.id, msg.id)
+                    found += 1
         except Exception as e:
             logging.debug(f"Manual sweep error in #{channel.name}: {e}")
-        if deleted:
+        await self._purge_old_stickies(channel, skip_id=keep_id)
+        if found:
             audit_log(
-                f"Manual sticky sweep deleted {deleted} messages in #{channel.name}."
+                f"Manual sticky sweep found {found} untracked stickies in #{channel.name}."
             )
+        return found
 
     async def _purge_old_stickies(
         self, channel: GuildTextLike, skip_id: Optional[int] = None
     ):
-        """Delete all previous sticky messages in the channel, optionally skipping one id.
+        """Delete every sticky the ledger knows about in the channel, optionally skipping one id.
 
-        Strategy:
-          1) Try purge with a check (fast). This will skip >14d silently.
-          2) Always follow with a manual sweep to catch anything the purge skipped.
+        Ids younger than 14 days are bulk-deleted up to 100 per request (needs Manage
+        Messages); older ones, or all of them without that permission, are deleted one
+        by one. Ids that are gone or cannot be deleted are dropped from the ledger.
+        No history is read; use /repairstickies for stickies the ledger never saw.
         """
-        perms = channel.permissions_for(channel.guild.me)
-        can_manage = perms.manage_messages
-        # 1) Bulk purge if possible
-        if perms.send_messages and can_manage:
+        ids = [i for i in self._ledger_ids(channel.id) if i != skip_id]
+        if not ids:
+            return
 
-            def check(m: discord.Message) -> bool:
-                if skip_id is not None and m.id == skip_id:
-                    return False
-                return self._is_message_sticky(m)
+        cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+        can_bulk = channel.permissions_for(channel.guild.me).manage_messages
+        recent = [i for i in ids if can_bulk and discord.utils.snowflake_time(i) > cutoff]
+        recent_set = set(recent)
+        single = [i for i in ids if i not in recent_set]
+        done: List[int] = []
 
+        for start in range(0, len(recent), BULK_DELETE_BATCH):
+            batch = recent[start : start + BULK_DELETE_BATCH]
             try:
-                await channel.purge(limit=200, check=check, oldest_first=False)
+                await channel.delete_messages([discord.Object(id=i) for i in batch])
+                done.extend(batch)
             except Exception as e:
-                # Ignore; we will still do the manual pass
                 logging.debug(
-                    f"Purge failed in #{channel.name}, will manual sweep: {e}"
+                    f"Bulk delete failed in #{channel.name}, deleting one by one: {e}"
                 )
+                single.extend(batch)
 
-        # 2) Manual sweep (handles >14d and when manage_messages is missing)
-        await self._manual_sweep_for_stickies(
-            channel, skip_ids=[skip_id] if skip_id else None
-        )
+        for message_id in single:
+            try:
+                await channel.get_partial_message(message_id).delete()
+                done.append(message_id)
+            except (discord.NotFound, discord.Forbidden):
+                done.append(message_id)
+            except Exception as e:
+                logging.warning(f"Failed to delete sticky {message_id} in #{channel.name}: {e}")
+
+        self._ledger_remove(done)
 
     async def _send_sticky(
         self, channel: GuildTextLike, content: str, fmt: str, colour_value: int
     ):
-        """Send a sticky message in the requested format."""
+        """Send a sticky message in the requested format and record it in the ledger."""
         if fmt == "embed":
             embed = discord.Embed(
                 title="Sticky Message",
                 description=f"{content}{STICKY_MARKER}",
                 color=discord.Color(colour_value),
             )
-            return await channel.send(embed=embed)
+            sent = await channel.send(embed=embed)
         else:
-            return await channel.send(f"{content}{STICKY_MARKER}")
+            sent = await channel.send(f"{content}{STICKY_MARKER}")
+        self._ledger_add(channel.id, sent.id)
+        self._note_message(channel.id, sent.id)
+        return sent
 
     async def _replace_sticky_atomically(self, channel: GuildTextLike, new_data: Dict):
         """Under a per-channel lock, remove all old stickies and post the new one exactly once.
@@ -629,25 +751,9 @@ class StickyMessages(commands.Cog):
 
         lock = self.locks.setdefault(channel.id, asyncio.Lock())
         async with lock:
-            # Purge all prior stickies first (both bulk and manual)
+            # Delete all prior stickies first, including the tracked one (all are in the ledger)
             await self._purge_old_stickies(channel)
 
-            # If we have a tracked sticky id, ensure it is gone as well
-            tracked = self.stickies.get(channel.id)
-            if tracked and tracked.get("message_id"):
-                try:
-                    old_message = await channel.fetch_message(tracked["message_id"])
-                    try:
-                        await old_message.delete()
-                    except Exception:
-                        pass
-                except discord.NotFound:
-                    pass
-                except Exception as e:
-                    logging.error(
-                        f"Error fetching tracked sticky in #{channel.name}: {e}"
-                    )
-
             # Explicitly delete any existing DB row for this channel BEFORE we insert the new one
             try:
                 self.delete_sticky_from_db(channel.id)
@@ -675,8 +781,8 @@ class StickyMessages(commands.Cog):
                 new_data["color"],
             )
 
-            # Post-send safety sweep to eliminate any race-created duplicates
-            await self._manual_sweep_for_stickies(channel, skip_ids=[sent.id], limit=25)
+            # Remove any sticky posted concurrently while we were sending
+            await self._purge_old_stickies(channel, skip_id=sent.id)
 
     async def update_sticky_for_channel(
         self, channel: GuildTextLike, sticky: dict, force_update: bool = False
@@ -697,6 +803,10 @@ class StickyMessages(commands.Cog):
 
         lock = self.locks.setdefault(channel.id, asyncio.Lock())
         async with lock:
+            # The sticky may have been removed while this call waited for the lock.
+            if channel.id not in self.stickies or channel.id in self._suppress_repost:
+                return
+
             loop_time = asyncio.get_running_loop().time()
 
             # Skip no-op updates when callers do not force a repost and there is no tracked sticky.
@@ -706,33 +816,22 @@ class StickyMessages(commands.Cog):
 
             if not force_update:
                 last_repost = self.last_repost_times.get(channel.id, 0.0)
-                if (loop_time - last_repost) < self.repost_cooldown:
+                _, cooldown = self._cadence(channel.id)
+                if (loop_time - last_repost) < cooldown:
                     return
 
             tracked_message_id = (self.stickies.get(channel.id) or sticky).get("message_id")
 
             # If the tracked sticky is already the newest message, there is nothing to do.
             try:
-                latest = [m async for m in channel.history(limit=1)]
-                if latest and tracked_message_id and latest[0].id == tracked_message_id:
+                latest_id = await self._latest_message_id(channel)
+                if tracked_message_id and latest_id == tracked_message_id:
                     return
             except Exception as e:
                 logging.debug(f"Failed latest-message check in #{channel.name}: {e}")
 
-            # If we still have the tracked sticky in the channel but it is not last, delete it so we can re-send
-            if tracked_message_id:
-                try:
-                    old_message = await channel.fetch_message(tracked_message_id)
-                    try:
-                        await old_message.delete()
-                    except Exception:
-                        pass
-                except discord.NotFound:
-                    pass
-                except Exception as e:
-                    logging.error(
-                        f"Error deleting tracked sticky in channel #{channel.name}: {e}"
-                    )
+            # The tracked sticky is not last: delete it (and any stale duplicate) so we can re-send
+            await self._purge_old_stickies(channel)
 
             # Send fresh sticky at bottom
             fmt = sticky.get("format", "normal")
@@ -753,12 +852,6 @@ class StickyMessages(commands.Cog):
             )
             self.last_repost_times[channel.id] = loop_time
 
-            # Periodic lightweight cleanup to remove stale duplicates without high API churn.
-            last_cleanup = self.last_cleanup_times.get(channel.id, 0.0)
-            if force_update or (loop_time - last_cleanup) >= self.cleanup_interval:
-                await self._manual_sweep_for_stickies(channel, skip_ids=[new_msg.id], limit=100)
-                self.last_cleanup_times[channel.id] = loop_time
-
     # -----------------------
     # Events
     # -----------------------
@@ -783,6 +876,12 @@ class StickyMessages(commands.Cog):
                 except Exception:
                     pass
 
+    @commands.Cog.listener()
+    async def on_connect(self):
+        # A fresh session (not a resume) means events were missed while disconnected,
+        # so the index can no longer be trusted. Resumes replay missed events.
+        self.last_message_ids.clear()
+
     @commands.Cog.listener()
     async def on_resumed(self):
         logging.info("Bot resumed. Ensuring stickies exist.")
@@ -803,19 +902,16 @@ class StickyMessages(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
+        if message.channel.id in self.stickies:
+            self._note_message(message.channel.id, message.id)
         if message.author == self.bot.user:
             return
         channel = message.channel
         if not isinstance(channel, (discord.TextChannel, discord.Thread)):
             return
         if channel.id in self.stickies:
-            # Proper debounce: cancel existing task and reschedule
-            task = self.debounce_tasks.get(channel.id)
-            if task and not task.done():
-                task.cancel()
-            self.debounce_tasks[channel.id] = asyncio.create_task(
-                self._debounced_update(channel, dict(self.stickies[channel.id]))
-            )
+            self._note_activity(channel.id)
+            self._schedule_repost(channel)
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: discord.Message):
@@ -825,29 +921,124 @@ class StickyMessages(commands.Cog):
         if message.author == self.bot.user and message.channel.id in self.stickies:
             sticky = self.stickies[message.channel.id]
             if message.id == sticky["message_id"]:
-                task = self.debounce_tasks.pop(message.channel.id, None)
-                if task:
-                    task.cancel()
+                self._cancel_repost_timer(message.channel.id)
                 await self.update_sticky_for_channel(
                     message.channel, sticky, force_update=True
                 )
 
-    async def _debounced_update(self, channel: GuildTextLike, sticky: dict):
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        # Raw events fire for uncached messages too, so the index never misses a delete.
+        self._forget_messages(payload.channel_id, (payload.message_id,))
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        self._forget_messages(payload.channel_id, payload.message_ids)
+
+    # -----------------------
+    # Repost cadence
+    # -----------------------
+
+    def _note_activity(self, channel_id: int):
+        """Fold one message into the channel's exponentially weighted rate."""
+        now = asyncio.get_running_loop().time()
+        rate, updated_at = self.message_rates.get(channel_id, (0.0, now))
+        rate = rate * math.exp(-(now - updated_at) / self.rate_window) + 1 / self.rate_window
+        self.message_rates[channel_id] = (rate, now)
+
+    def _message_rate(self, channel_id: int) -> float:
+        """Messages per minute, decayed to now so a channel that went quiet reads as quiet."""
+        entry = self.message_rates.get(channel_id)
+        if entry is None:
+            return 0.0
+        rate, updated_at = entry
+        elapsed = max(0.0, asyncio.get_running_loop().time() - updated_at)
+        return rate * math.exp(-elapsed / self.rate_window) * 60
+
+    def _cadence(self, channel_id: int) -> Tuple[float, float]:
+        """(debounce, cooldown) in seconds for the channel's current message rate.
+
+        Interpolates on a log scale between quiet_rate and busy_rate, since going
+        from 1 to 10 messages a minute matters as much as going from 10 to 100.
+        """
+        rate = self._message_rate(channel_id)
+        if rate <= self.quiet_rate:
+            busy = 0.0
+        elif rate >= self.busy_rate:
+            busy = 1.0
+        else:
+            busy = math.log(rate / self.quiet_rate) / math.log(
+                self.busy_rate / self.quiet_rate
+            )
+        low, high = self.debounce_bounds
+        debounce = low + (high - low) * busy
+        low, high = self.cooldown_bounds
+        return debounce, low + (high - low) * busy
+
+    # -----------------------
+    # Repost coalescing
+    # -----------------------
+
+    def _schedule_repost(self, channel: GuildTextLike):
+        """Debounce a repost check: arm the channel's timer, or push its deadline forward.
+
+        The armed handle is never cancelled per message. When it fires early it re-arms
+        once at the latest deadline, so a burst costs one dict lookup per message.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        debounce, _ = self._cadence(channel.id)
+        timer = self.repost_timers.get(channel.id)
+        if timer is None:
+            timer = RepostTimer(channel, now, now + debounce)
+            timer.handle = loop.call_at(timer.deadline, self._repost_timer_due, channel.id)
+            self.repost_timers[channel.id] = timer
+            metrics.incr("stickies.repost_timers_armed")
+            metrics.set_gauge("stickies.repost_timers_pending", len(self.repost_timers))
+            return
+        timer.channel = channel
+        timer.deadline = min(
+            now + debounce, timer.first_at + max(self.debounce_max_wait, debounce)
+        )
+        metrics.incr("stickies.repost_timer_extensions")
+
+    def _repost_timer_due(self, channel_id: int):
+        timer = self.repost_timers.get(channel_id)
+        if timer is None:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if now < timer.deadline:
+            timer.handle = loop.call_at(timer.deadline, self._repost_timer_due, channel_id)
+            metrics.incr("stickies.repost_timer_rearms")
+            return
+
+        del self.repost_timers[channel_id]
+        metrics.set_gauge("stickies.repost_timers_pending", len(self.repost_timers))
+        metrics.incr("stickies.repost_timer_fires")
+        metrics.observe("stickies.repost_coalesce_wait", now - timer.first_at)
+        # Channel might have lost its sticky during the wait
+        sticky = self.stickies.get(channel_id)
+        if sticky is None:
+            return
+        task = asyncio.create_task(self._run_repost(timer.channel, dict(sticky)))
+        self._repost_runs[task] = channel_id
+        task.add_done_callback(lambda done: self._repost_runs.pop(done, None))
+
+    def _cancel_repost_timer(self, channel_id: int):
+        timer = self.repost_timers.pop(channel_id, None)
+        if timer is None:
+            return
+        if timer.handle:
+            timer.handle.cancel()
+        metrics.incr("stickies.repost_timers_cancelled")
+        metrics.set_gauge("stickies.repost_timers_pending", len(self.repost_timers))
+
+    async def _run_repost(self, channel: GuildTextLike, sticky: dict):
         try:
-            await asyncio.sleep(self.debounce_interval)
-            # Channel might have lost its sticky during wait
-            if channel.id not in self.stickies:
-                return
             await self.update_sticky_for_channel(channel, sticky, force_update=False)
-        except asyncio.CancelledError:
-            pass
-        finally:
-            # Only clear if this exact task is still the active one
-            current = self.debounce_tasks.get(channel.id)
-            if current and current.done():
-                self.debounce_tasks.pop(channel.id, None)
-            elif current is None:
-                pass
+        except Exception as e:
+            logging.warning(f"Sticky repost failed in #{channel.name}: {e}")
 
     # -----------------------
     # Commands
@@ -883,24 +1074,15 @@ class StickyMessages(commands.Cog):
         async with lock:
             self._suppress_repost.add(channel.id)
             try:
-                tracked = self.stickies.get(channel.id)
-                old_id = tracked["message_id"] if tracked else None
-                if old_id:
-                    try:
-                        old_msg = await channel.fetch_message(old_id)
-                        await old_msg.delete()
-                    except Exception:
-                        pass
-
-                # Always sweep even if we had no tracked entry
+                # Deletes the tracked sticky and any older ones the ledger knows about
                 await self._purge_old_stickies(channel)
             finally:
                 # Clean DB record regardless of cache presence
                 self.delete_sticky_from_db(channel.id)
                 self.stickies.pop(channel.id, None)
-                task = self.debounce_tasks.pop(channel.id, None)
-                if task:
-                    task.cancel()
+                self.last_message_ids.pop(channel.id, None)
+                self.message_rates.pop(channel.id, None)
+                self._cancel_repost_timer(channel.id)
                 self._suppress_repost.discard(channel.id)
 
         ok = make_embed(
@@ -911,6 +1093,37 @@ class StickyMessages(commands.Cog):
         await interaction.followup.send(embed=ok, ephemeral=True)
         audit_log(f"{interaction.user} removed sticky in #{channel.name}.")
 
+    @app_commands.command(
+        name="repairstickies",
+        description="Scan this channel's recent history and delete stray sticky messages.",
+    )
+    @app_commands.default_permissions(manage_messages=True)
+    async def repair_stickies(self, interaction: discord.Interaction):
+        channel = interaction.channel
+        if not isinstance(channel, (discord.TextChannel, discord.Thread)):
+            err = make_embed("Error", "This isn’t a text channel.", discord.Color.red())
+            return await interaction.response.send_message(embed=err, ephemeral=True)
+
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True, thinking=True)
+
+        lock = self.locks.setdefault(channel.id, asyncio.Lock())
+        async with lock:
+            tracked = self.stickies.get(channel.id)
+            keep_id = tracked.get("message_id") if tracked else None
+            found = await self._manual_sweep_for_stickies(channel, keep_id=keep_id)
+
+        ok = make_embed(
+            "Stickies Repaired",
+            f"Scanned the last {MANUAL_SCAN_LIMIT} messages in {channel.mention} and removed "
+            f"{found} stray sticky message(s).",
+            discord.Color.green(),
+        )
+        await interaction.followup.send(embed=ok, ephemeral=True)
+        audit_log(
+            f"{interaction.user} repaired stickies in #{channel.name}: {found} stray removed."
+        )
+
     # -----------------------
     # New command: liststickies (one sticky per page)
     # -----------------------
@@ -932,13 +1145,10 @@ class StickyMessages(commands.Cog):
             clean = clean[: limit - 1] + "…"
         return clean
 
-    async def _build_list_pages_for_guild(
-        self, guild: discord.Guild, requester: discord.Member
-    ) -> List[discord.Embed]:
-        """Build one page per sticky with clear fields and a code-block preview."""
-        pages: List[discord.Embed] = []
-
-        # Order by channel name for stable output
+    def _list_items_for_guild(
+        self, guild: discord.Guild
+    ) -> List[tuple[GuildTextLike, Dict]]:
+        """Stickies configured in this guild, ordered by channel name for stable output."""
         items: List[tuple[GuildTextLike, Dict]] = []
         for ch_id, data in self.stickies.items():
             channel = self.bot.get_channel(int(ch_id))
@@ -950,107 +1160,109 @@ class StickyMessages(commands.Cog):
         items.sort(
             key=lambda tup: tup[0].name if hasattr(tup[0], "name") else str(tup[0].id)
         )
+        return items
 
-        if not items:
-            empty = discord.Embed(
-                title="No Stickies Found",
-                description="There are no stickies configured in this server.",
-                color=discord.Color.red(),
-            )
-            empty.set_footer(text="Use /setsticky in a channel to create one.")
-            return [empty]
-
-        total = len(items)
-
-        for idx, (channel, data) in enumerate(items, start=1):
-            fmt = data.get("format", "normal")
-            colour_value = int(data.get("color", 0) or 0)
-            msg_id = data.get("message_id")
-            preview_block = self._clean_preview_block(
-                data.get("content", ""), limit=950
-            )
+    async def _build_sticky_page(
+        self,
+        guild: discord.Guild,
+        channel: GuildTextLike,
+        data: Dict,
+        idx: int,
+        total: int,
+    ) -> discord.Embed:
+        """Build the page for one sticky with clear fields and a code-block preview."""
+        fmt = data.get("format", "normal")
+        colour_value = int(data.get("color", 0) or 0)
+        msg_id = data.get("message_id")
+        preview_block = self._clean_preview_block(
+            data.get("content", ""), limit=950
+        )
 
-            # Try to verify whether the tracked message still exists and capture timestamp
+        # Try to verify whether the tracked message still exists and capture timestamp
+        existence = "Unknown"
+        jump = None
+        created_ts_unix: Optional[int] = None
+        try:
+            if msg_id:
+                try:
+                    msg = await channel.fetch_message(msg_id)  # type: ignore[arg-type]
+                    jump = msg.jump_url
+                    existence = "Present"
+                    created_ts_unix = int(msg.created_at.timestamp())
+                except discord.NotFound:
+                    existence = "Missing"
+                    jump = f"https://discord.com/channels/{guild.id}/{channel.id}/{msg_id}"
+                except discord.Forbidden:
+                    existence = "Cannot verify due to missing permissions"
+                    jump = f"https://discord.com/channels/{guild.id}/{channel.id}/{msg_id}"
+                except discord.HTTPException:
+                    existence = "Unknown"
+                    jump = f"https://discord.com/channels/{guild.id}/{channel.id}/{msg_id}"
+        except Exception:
             existence = "Unknown"
-            jump = None
-            created_ts_unix: Optional[int] = None
-            try:
-                if msg_id:
-                    try:
-                        msg = await channel.fetch_message(msg_id)  # type: ignore[arg-type]
-                        jump = msg.jump_url
-                        existence = "Present"
-                        created_ts_unix = int(msg.created_at.timestamp())
-                    except discord.NotFound:
-                        existence = "Missing"
-                        jump = f"https://discord.com/channels/{guild.id}/{channel.id}/{msg_id}"
-                    except discord.Forbidden:
-                        existence = "Cannot verify due to missing permissions"
-                        jump = f"https://discord.com/channels/{guild.id}/{channel.id}/{msg_id}"
-                    except discord.HTTPException:
-                        existence = "Unknown"
-                        jump = f"https://discord.com/channels/{guild.id}/{channel.id}/{msg_id}"
-            except Exception:
-                existence = "Unknown"
-                jump = (
-                    f"https://discord.com/channels/{guild.id}/{channel.id}/{msg_id}"
-                    if msg_id
-                    else None
-                )
-
-            embed_colour = (
-                discord.Color(colour_value)
-                if fmt == "embed" and colour_value
-                else discord.Color.blurple()
-            )
-            emb = discord.Embed(
-                title=f"Sticky • {channel.mention}",
-                description="Details for this channel’s sticky.",
-                color=embed_colour,
+            jump = (
+                f"https://discord.com/channels/{guild.id}/{channel.id}/{msg_id}"
+                if msg_id
+                else None
             )
 
-            channel_type = (
-                "Thread" if isinstance(channel, discord.Thread) else "Text Channel"
-            )
-            parent_line = (
-                f"\n• **Parent:** {channel.parent.mention}"
-                if isinstance(channel, discord.Thread) and channel.parent
-                else ""
-            )
-            colour_hex = (
-                f"#{colour_value:06X}" if fmt == "embed" and colour_value else "N/A"
-            )
-            msg_id_line = f"`{msg_id}`" if msg_id else "`None recorded`"
-            link_line = jump if jump else "`N/A`"
-            last_posted_line = (
-                f"<t:{created_ts_unix}:R>" if created_ts_unix else "`Unknown`"
-            )
+        embed_colour = (
+            discord.Color(colour_value)
+            if fmt == "embed" and colour_value
+            else discord.Color.blurple()
+        )
+        emb = discord.Embed(
+            title=f"Sticky • {channel.mention}",
+            description="Details for this channel’s sticky.",
+            color=embed_colour,
+        )
 
-            details_lines = [
-                f"• **Channel ID:** `{channel.id}`",
-                f"• **Type:** {channel_type}{parent_line}",
-                f"• **Format:** `{fmt}`",
-                f"• **Colour:** `{colour_hex}`",
-                f"• **Message ID:** {msg_id_line}",
-                f"• **Link:** {link_line}",
-                f"• **Status:** {existence}",
-                f"• **Last posted:** {last_posted_line}",
-            ]
-            emb.add_field(name="Details", value="\n".join(details_lines), inline=False)
-
-            if preview_block:
-                emb.add_field(
-                    name="Preview", value=f"```{preview_block}```", inline=False
-                )
-            else:
-                emb.add_field(name="Preview", value="_empty_", inline=False)
+        channel_type = (
+            "Thread" if isinstance(channel, discord.Thread) else "Text Channel"
+        )
+        parent_line = (
+            f"\n• **Parent:** {channel.parent.mention}"
+            if isinstance(channel, discord.Thread) and channel.parent
+            else ""
+        )
+        colour_hex = (
+            f"#{colour_value:06X}" if fmt == "embed" and colour_value else "N/A"
+        )
+        msg_id_line = f"`{msg_id}`" if msg_id else "`None recorded`"
+        link_line = jump if jump else "`N/A`"
+        last_posted_line = (
+            f"<t:{created_ts_unix}:R>" if created_ts_unix else "`Unknown`"
+        )
+        debounce, cooldown = self._cadence(channel.id)
+        cadence_line = (
+            f"`{self._message_rate(channel.id):.1f}` msgs/min → reposts `{debounce:.1f}s` "
+            f"after chat settles, at most every `{cooldown:.0f}s`"
+        )
 
-            emb.set_footer(
-                text=f"Sticky {idx} of {total} • Use buttons to navigate • /removesticky to delete"
+        details_lines = [
+            f"• **Channel ID:** `{channel.id}`",
+            f"• **Type:** {channel_type}{parent_line}",
+            f"• **Format:** `{fmt}`",
+            f"• **Colour:** `{colour_hex}`",
+            f"• **Message ID:** {msg_id_line}",
+            f"• **Link:** {link_line}",
+            f"• **Status:** {existence}",
+            f"• **Last posted:** {last_posted_line}",
+            f"• **Cadence:** {cadence_line}",
+        ]
+        emb.add_field(name="Details", value="\n".join(details_lines), inline=False)
+
+        if preview_block:
+            emb.add_field(
+                name="Preview", value=f"```{preview_block}```", inline=False
             )
-            pages.append(emb)
+        else:
+            emb.add_field(name="Preview", value="_empty_", inline=False)
 
-        return pages
+        emb.set_footer(
+            text=f"Sticky {idx} of {total} • Use buttons to navigate • /removesticky to delete"
+        )
+        return emb
 
     @app_commands.command(
         name="liststickies",
@@ -1071,17 +1283,29 @@ class StickyMessages(commands.Cog):
             if not interaction.response.is_done():
                 await interaction.response.defer(ephemeral=True, thinking=True)
 
-            pages = await self._build_list_pages_for_guild(interaction.guild, interaction.user)  # type: ignore[arg-type]
-            view = PagedView(interaction.user.id, pages)
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    embed=pages[0], view=view, ephemeral=True
+            guild = interaction.guild
+            items = self._list_items_for_guild(guild)
+            if not items:
+                empty = discord.Embed(
+                    title="No Stickies Found",
+                    description="There are no stickies configured in this server.",
+                    color=discord.Color.red(),
                 )
-            else:
-                await interaction.response.send_message(
-                    embed=pages[0], view=view, ephemeral=True
+                empty.set_footer(text="Use /setsticky in a channel to create one.")
+                await interaction.followup.send(embed=empty, ephemeral=True)
+                return
+
+            # Pages fetch their sticky message only when opened.
+            async def render(index: int) -> discord.Embed:
+                channel, data = items[index]
+                return await self._build_sticky_page(
+                    guild, channel, data, index + 1, len(items)
                 )
 
+            await LazyPagedView(interaction.user.id, len(items), render).send(
+                interaction
+            )
+
             audit_log(
                 f"{interaction.user} invoked /liststickies in guild '{interaction.guild.name}' (ID {interaction.guild.id})."
             )
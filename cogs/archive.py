@@ -0,0 +1,644 @@
+import discord
+import logging
+import sqlite3
+import asyncio
+import time
+import yaml
+from discord import app_commands
+from discord.ext import commands, tasks
+import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from utils.metrics import metrics
+
+
+def audit_log(message: str):
+    """Append a timestamped message to the audit log file."""
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        with open("audit.log", "a", encoding="utf-8") as f:
+            f.write(f"[{timestamp}] {message}\n")
+    except Exception as e:
+        logging.error(f"Failed to write to audit.log: {e}")
+
+
+def ensure_archive_schema(db: sqlite3.Connection) -> None:
+    """Create the archive tables, the FTS5 index and the triggers that keep it in sync."""
+    db.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS archived_messages (
+            message_id INTEGER PRIMARY KEY,
+            guild_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL,
+            author_id INTEGER NOT NULL,
+            author_is_bot INTEGER NOT NULL DEFAULT 0,
+            created_at INTEGER NOT NULL,
+            edited_at INTEGER,
+            deleted INTEGER NOT NULL DEFAULT 0,
+            content TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS idx_archived_messages_guild_channel
+            ON archived_messages (guild_id, channel_id, message_id);
+        CREATE INDEX IF NOT EXISTS idx_archived_messages_author
+            ON archived_messages (guild_id, author_id, message_id);
+
+        -- External-content FTS5 index over message text
+        CREATE VIRTUAL TABLE IF NOT EXISTS archived_messages_fts USING fts5(
+            content,
+            content='archived_messages',
+            content_rowid='message_id',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+        CREATE TRIGGER IF NOT EXISTS archived_messages_ai AFTER INSERT ON archived_messages BEGIN
+            INSERT INTO archived_messages_fts (rowid, content) VALUES (new.message_id, new.content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS archived_messages_ad AFTER DELETE ON archived_messages BEGIN
+            INSERT INTO archived_messages_fts (archived_messages_fts, rowid, content)
+                VALUES ('delete', old.message_id, old.content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS archived_messages_au AFTER UPDATE OF content ON archived_messages BEGIN
+            INSERT INTO archived_messages_fts (archived_messages_fts, rowid, content)
+                VALUES ('delete', old.message_id, old.content);
+            INSERT INTO archived_messages_fts (rowid, content) VALUES (new.message_id, new.content);
+        END;
+
+        -- One-time backfill progress per channel (resumable). newest_message_id is the
+        -- point up to which the channel's history is known to be archived without gaps.
+        CREATE TABLE IF NOT EXISTS archive_backfill (
+            channel_id INTEGER PRIMARY KEY,
+            guild_id INTEGER NOT NULL,
+            oldest_message_id INTEGER,
+            completed INTEGER NOT NULL DEFAULT 0,
+            updated_at INTEGER NOT NULL,
+            newest_message_id INTEGER
+        );
+        """
+    )
+    cols = [r[1] for r in db.execute("PRAGMA table_info(archive_backfill)")]
+    if "newest_message_id" not in cols:
+        db.execute("ALTER TABLE archive_backfill ADD COLUMN newest_message_id INTEGER")
+        # Older backfills did not record how far forward they reached, so anything
+        # posted while the bot was offline may be missing. Start those channels over;
+        # messages already archived are skipped by INSERT OR IGNORE.
+        db.execute("UPDATE archive_backfill SET oldest_message_id = NULL, completed = 0")
+        logging.info("Archive: backfill progress reset to record each channel's newest message.")
+    db.commit()
+
+
+class MessageArchive(commands.Cog):
+    """
+    Opt-in local archive of guild messages with an FTS5 full-text index.
+
+    Fed live from message create, edit and delete events plus a one-time,
+    resumable history backfill, so rescans, phrase counts and moderation lookups
+    can run against SQLite instead of paginating the Discord API. Deleted
+    messages are kept and flagged rather than removed. Messages posted while the
+    bot was offline are forward-filled from each channel's newest archived point
+    on every new gateway session and before local scans (see catch_up).
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        try:
+            with open("config.yaml", "r", encoding="utf-8") as config_file:
+                self.config = yaml.safe_load(config_file) or {}
+        except Exception as e:
+            logging.warning(f"Archive: failed to load config.yaml, using defaults. {e}")
+            self.config = {}
+
+        cfg = self.config.get("archive", {}) or {}
+        self.enabled: bool = bool(cfg.get("enabled", False))
+        self.path: str = str(cfg.get("path", "archive.db"))
+        self.flush_interval: float = float(cfg.get("flush_interval", 2.0))
+        self.backfill_batch: int = max(1, int(cfg.get("backfill_batch", 200)))
+        self.backfill_sleep: float = float(cfg.get("backfill_sleep", 1.0))
+        self.owner_ids = set(self.config.get("owner_ids", []) or [])
+
+        # Pending writes, applied in order by the flush loop.
+        self._pending: List[Tuple[str, tuple]] = []
+        self._backfill_task: Optional[asyncio.Task] = None
+
+        # Forward-fill state. A channel is in _caught_up once it has been filled up to
+        # the present during the current gateway session; after that, live messages
+        # keep it gap-free and advance its newest_message_id (via _live_newest).
+        self._session = 0
+        self._caught_up: Set[int] = set()
+        self._live_newest: Dict[int, int] = {}
+        self._catch_up_lock = asyncio.Lock()
+        self._catch_up_task: Optional[asyncio.Task] = None
+
+        self.db: Optional[sqlite3.Connection] = None
+        if self.enabled:
+            self.db = sqlite3.connect(self.path, check_same_thread=False)
+            # WAL lets the read-only scans below run while live events are written.
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            ensure_archive_schema(self.db)
+            self.flush_loop.change_interval(seconds=self.flush_interval)
+            self.flush_loop.start()
+
+    async def cog_unload(self):
+        self.flush_loop.cancel()
+        for task in (self._backfill_task, self._catch_up_task):
+            if task and not task.done():
+                task.cancel()
+        if self.db is not None:
+            try:
+                self.flush()
+                self.db.close()
+            except Exception as e:
+                logging.error(f"Error closing archive database: {e}")
+
+    @commands.Cog.listener()
+    async def on_connect(self):
+        # A new session (not a resume) may have missed messages, so no channel is
+        # known to be gap-free until it has been forward-filled again.
+        self._session += 1
+        self._caught_up.clear()
+        self._live_newest.clear()
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        logging.info("\033[96mMessageArchive\033[0m cog synced successfully.")
+        audit_log("MessageArchive cog synced successfully.")
+        if self.db is not None and not (self._catch_up_task and not self._catch_up_task.done()):
+            self._catch_up_task = asyncio.create_task(self._catch_up_all())
+
+    # -----------------------
+    # Write path
+    # -----------------------
+
+    @staticmethod
+    def _row_for(message: discord.Message) -> tuple:
+        return (
+            message.id,
+            message.guild.id,
+            message.channel.id,
+            message.author.id,
+            1 if message.author.bot else 0,
+            int(message.created_at.timestamp()),
+            int(message.edited_at.timestamp()) if message.edited_at else None,
+            message.content or "",
+        )
+
+    def flush(self) -> int:
+        """Apply pending writes in order, grouping consecutive writes of the same kind."""
+        if self.db is None or not self._pending:
+            return 0
+        pending, self._pending = self._pending, []
+        sql = {
+            "insert": "INSERT OR IGNORE INTO archived_messages (message_id, guild_id, channel_id, author_id, author_is_bot, created_at, edited_at, content) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            "edit": "UPDATE archived_messages SET content = ?, edited_at = ? WHERE message_id = ?",
+            "delete": "UPDATE archived_messages SET deleted = 1 WHERE message_id = ?",
+        }
+        advanced, self._live_newest = self._live_newest, {}
+        with self.db:
+            run: List[tuple] = []
+            kind = pending[0][0]
+            for op, params in pending:
+                if op != kind:
+                    self.db.executemany(sql[kind], run)
+                    run, kind = [], op
+                run.append(params)
+            self.db.executemany(sql[kind], run)
+            if advanced:
+                self.db.executemany(
+                    "UPDATE archive_backfill SET newest_message_id = ? WHERE channel_id = ? AND newest_message_id < ?",
+                    [(mid, cid, mid) for cid, mid in advanced.items()],
+                )
+        metrics.incr("archive.writes", len(pending))
+        return len(pending)
+
+    @tasks.loop(seconds=2.0)
+    async def flush_loop(self):
+        try:
+            self.flush()
+        except Exception as e:
+            metrics.incr("archive.flush_failures")
+            logging.error(f"Archive flush failed: {e}")
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if self.db is None or message.guild is None:
+            return
+        self._pending.append(("insert", self._row_for(message)))
+        channel_id = message.channel.id
+        if channel_id in self._caught_up and message.id > self._live_newest.get(channel_id, 0):
+            self._live_newest[channel_id] = message.id
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        if self.db is None or payload.guild_id is None:
+            return
+        content = payload.data.get("content")
+        if content is None:
+            # Embed-only updates carry no content change.
+            return
+        self._pending.append(("edit", (content, int(time.time()), payload.message_id)))
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        if self.db is None or payload.guild_id is None:
+            return
+        self._pending.append(("delete", (payload.message_id,)))
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(
+        self, payload: discord.RawBulkMessageDeleteEvent
+    ):
+        if self.db is None or payload.guild_id is None:
+            return
+        self._pending.extend(("delete", (mid,)) for mid in payload.message_ids)
+
+    # -----------------------
+    # Backfill
+    # -----------------------
+
+    def _backfill_state(self, channel_id: int) -> Tuple[Optional[int], bool]:
+        row = self.db.execute(
+            "SELECT oldest_message_id, completed FROM archive_backfill WHERE channel_id = ?",
+            (channel_id,),
+        ).fetchone()
+        if not row:
+            return None, False
+        return row[0], bool(row[1])
+
+    def _save_backfill_state(
+        self,
+        channel: discord.TextChannel,
+        oldest_id: Optional[int],
+        completed: bool,
+        newest_id: Optional[int] = None,
+    ) -> None:
+        """Record backfill progress. newest_id is only stored if none is recorded yet."""
+        self.db.execute(
+            "INSERT INTO archive_backfill (channel_id, guild_id, oldest_message_id, completed, updated_at, newest_message_id) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(channel_id) DO UPDATE SET oldest_message_id = excluded.oldest_message_id, completed = excluded.completed, updated_at = excluded.updated_at, "
+            "newest_message_id = COALESCE(archive_backfill.newest_message_id, excluded.newest_message_id)",
+            (channel.id, channel.guild.id, oldest_id, 1 if completed else 0, int(time.time()), newest_id),
+        )
+        self.db.commit()
+
+    def _newest_archived(self, channel_id: int) -> Optional[int]:
+        row = self.db.execute(
+            "SELECT newest_message_id FROM archive_backfill WHERE channel_id = ?",
+            (channel_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def readable_channels(self, guild: discord.Guild) -> List[discord.TextChannel]:
+        """Text channels whose history the bot can read; the channels archive scans cover."""
+        return [
+            ch
+            for ch in guild.text_channels
+            if ch.permissions_for(guild.me).read_message_history
+        ]
+
+    async def _backfill_channel(self, channel: discord.TextChannel) -> int:
+        """Walk history backwards from the oldest archived point, resuming where it left off."""
+        oldest_id, completed = self._backfill_state(channel.id)
+        if completed:
+            return 0
+        before = discord.Object(id=oldest_id) if oldest_id else None
+        # A fresh walk starts at the newest message, which is where forward-fill
+        # picks up later. A channel id is older than any message in it.
+        newest_id: Optional[int] = None if oldest_id else channel.id
+        stored = 0
+        batch: List[tuple] = []
+        async for msg in channel.history(limit=None, before=before, oldest_first=False):
+            batch.append(self._row_for(msg))
+            if newest_id == channel.id:
+                newest_id = msg.id
+            oldest_id = msg.id
+            if len(batch) >= self.backfill_batch:
+                self._pending.extend(("insert", row) for row in batch)
+                self.flush()
+                self._save_backfill_state(channel, oldest_id, completed=False, newest_id=newest_id)
+                stored += len(batch)
+                batch = []
+                await asyncio.sleep(self.backfill_sleep)
+        if batch:
+            self._pending.extend(("insert", row) for row in batch)
+            self.flush()
+            stored += len(batch)
+        self._save_backfill_state(channel, oldest_id, completed=True, newest_id=newest_id)
+        return stored
+
+    async def _catch_up_channel(self, channel: discord.TextChannel) -> int:
+        """Archive messages posted after the channel's newest archived point. Returns the count."""
+        if channel.id in self._caught_up:
+            return 0
+        session = self._session
+        newest_id = self._newest_archived(channel.id)
+        if newest_id is None:
+            raise LookupError(f"#{channel.name} has not been backfilled")
+        stored = 0
+        batch: List[tuple] = []
+        async for msg in channel.history(
+            limit=None, after=discord.Object(id=newest_id), oldest_first=True
+        ):
+            batch.append(self._row_for(msg))
+            if len(batch) >= self.backfill_batch:
+                newest_id = self._store_forward(channel.id, batch)
+                stored += len(batch)
+                batch = []
+                await asyncio.sleep(self.backfill_sleep)
+        if batch:
+            self._store_forward(channel.id, batch)
+            stored += len(batch)
+        if session == self._session:
+            self._caught_up.add(channel.id)
+        return stored
+
+    def _store_forward(self, channel_id: int, batch: List[tuple]) -> int:
+        """Write a forward-fill batch (oldest first) and advance the channel's newest point."""
+        newest_id = batch[-1][0]
+        self._pending.extend(("insert", row) for row in batch)
+        self.flush()
+        self.db.execute(
+            "UPDATE archive_backfill SET newest_message_id = ?, updated_at = ? WHERE channel_id = ? AND newest_message_id < ?",
+            (newest_id, int(time.time()), channel_id, newest_id),
+        )
+        self.db.commit()
+        return newest_id
+
+    async def catch_up(self, guild: discord.Guild) -> bool:
+        """
+        Forward-fill every readable channel of the guild up to the present.
+        Returns True only if all of them are now archived without gaps.
+        """
+        if self.db is None:
+            return False
+        complete = True
+        async with self._catch_up_lock:
+            started = time.perf_counter()
+            stored = 0
+            for channel in self.readable_channels(guild):
+                try:
+                    stored += await self._catch_up_channel(channel)
+                except (LookupError, discord.Forbidden, discord.HTTPException) as e:
+                    complete = False
+                    logging.warning(f"Archive catch-up skipped #{channel.name}: {e}")
+            metrics.incr("archive.caught_up", stored)
+            metrics.observe("archive.catch_up_duration", time.perf_counter() - started)
+        if stored:
+            audit_log(f"Archive caught up {stored} missed messages in {guild.name}.")
+        return complete
+
+    async def _catch_up_all(self) -> None:
+        for guild in list(self.bot.guilds):
+            try:
+                await self.catch_up(guild)
+            except Exception as e:
+                logging.error(f"Archive catch-up failed for {guild.name}: {e}")
+
+    async def _backfill_guild(self, guild: discord.Guild, user: discord.abc.User):
+        started = time.perf_counter()
+        total = 0
+        channels = self.readable_channels(guild)
+        for i, channel in enumerate(channels, start=1):
+            try:
+                count = await self._backfill_channel(channel)
+                total += count
+                logging.info(
+                    f"[{i}/{len(channels)}] Archived {count} messages from #{channel.name}."
+                )
+            except (discord.Forbidden, discord.HTTPException) as e:
+                logging.warning(f"Archive backfill error in #{channel.name}: {e}")
+                audit_log(f"Archive backfill error in #{channel.name}: {e}")
+        elapsed = time.perf_counter() - started
+        metrics.incr("archive.backfilled", total)
+        metrics.observe("archive.backfill_duration", elapsed)
+        summary = f"Archive backfill complete for {guild.name}: {total} messages in {elapsed:.1f}s."
+        logging.info(summary)
+        audit_log(summary)
+        try:
+            await user.send(f"✅ {summary}")
+        except discord.HTTPException:
+            pass
+
+    def backfill_complete(self, guild: discord.Guild) -> bool:
+        """True when every readable text channel in the guild has been fully backfilled."""
+        if self.db is None:
+            return False
+        channels = self.readable_channels(guild)
+        if not channels:
+            return False
+        done = {
+            row[0]
+            for row in self.db.execute(
+                "SELECT channel_id FROM archive_backfill WHERE guild_id = ? AND completed = 1",
+                (guild.id,),
+            )
+        }
+        return all(ch.id in done for ch in channels)
+
+    # -----------------------
+    # Read path (safe to call from worker threads)
+    # -----------------------
+
+    def _reader(self) -> sqlite3.Connection:
+        return sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+
+    def iter_guild_messages(
+        self,
+        guild_id: int,
+        include_bots: bool = False,
+        batch: int = 5000,
+        channel_ids: Optional[Sequence[int]] = None,
+    ) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield (author_id, channel_id, content) for every live archived message in a guild,
+        optionally only from channel_ids (see readable_channels).
+        Call flush() on the event loop first so events still queued are included.
+        """
+        where = "WHERE guild_id = ? AND deleted = 0" + ("" if include_bots else " AND author_is_bot = 0")
+        params: list = [guild_id]
+        if channel_ids is not None:
+            where += f" AND channel_id IN ({','.join('?' for _ in channel_ids) or 'NULL'})"
+            params.extend(channel_ids)
+        reader = self._reader()
+        try:
+            cur = reader.execute(
+                f"SELECT author_id, channel_id, content FROM archived_messages {where}",
+                params,
+            )
+            while True:
+                rows = cur.fetchmany(batch)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            reader.close()
+
+    def count_matches(
+        self,
+        guild_id: int,
+        predicate: Callable[[str], bool],
+        include_bots: bool = False,
+        channel_ids: Optional[Sequence[int]] = None,
+    ) -> Tuple[Dict[int, int], Dict[int, int], int]:
+        """
+        Count messages whose content satisfies predicate, per author and per channel.
+        Pass channel_ids to count the same channels an API scan would read.
+        Returns (by_user, by_channel, messages_scanned).
+        """
+        by_user: Dict[int, int] = {}
+        by_channel: Dict[int, int] = {}
+        scanned = 0
+        for author_id, channel_id, content in self.iter_guild_messages(
+            guild_id, include_bots=include_bots, channel_ids=channel_ids
+        ):
+            scanned += 1
+            if predicate(content):
+                by_user[author_id] = by_user.get(author_id, 0) + 1
+                by_channel[channel_id] = by_channel.get(channel_id, 0) + 1
+        return by_user, by_channel, scanned
+
+    def search(
+        self,
+        guild_id: int,
+        query: str,
+        author_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        limit: int = 10,
+    ) -> Tuple[int, List[sqlite3.Row]]:
+        """Full-text search. Returns (total matches, newest `limit` matching rows)."""
+        reader = self._reader()
+        reader.row_factory = sqlite3.Row
+        try:
+            where = "archived_messages_fts MATCH ? AND m.guild_id = ?"
+            params: list = [query, guild_id]
+            if author_id is not None:
+                where += " AND m.author_id = ?"
+                params.append(author_id)
+            if channel_id is not None:
+                where += " AND m.channel_id = ?"
+                params.append(channel_id)
+            base = (
+                "FROM archived_messages_fts JOIN archived_messages m "
+                "ON m.message_id = archived_messages_fts.rowid WHERE " + where
+            )
+            total = reader.execute(f"SELECT COUNT(*) {base}", params).fetchone()[0]
+            rows = reader.execute(
+                f"SELECT m.* {base} ORDER BY m.message_id DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+            return total, rows
+        finally:
+            reader.close()
+
+    # -----------------------
+    # Commands
+    # -----------------------
+
+    async def _require_enabled(self, interaction: discord.Interaction) -> bool:
+        if self.db is not None:
+            return True
+        await interaction.response.send_message(
+            embed=discord.Embed(
+                title="Archive Disabled",
+                description="The message archive is not enabled. Set `archive.enabled` in config.yaml.",
+                color=discord.Color.red(),
+            ),
+            ephemeral=True,
+        )
+        return False
+
+    @app_commands.command(
+        name="archive_backfill",
+        description="Archive this server's message history once (owner only).",
+    )
+    async def archive_backfill(self, interaction: discord.Interaction):
+        if not await self._require_enabled(interaction):
+            return
+        if interaction.user.id not in self.owner_ids:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Error",
+                    description="Only the bot owners can start a backfill.",
+                    color=discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+        if self._backfill_task and not self._backfill_task.done():
+            await interaction.response.send_message(
+                "A backfill is already running.", ephemeral=True
+            )
+            return
+
+        await interaction.response.send_message(
+            "Started archive backfill in the background. You’ll be DMed when it's done (if possible).",
+            ephemeral=True,
+        )
+        audit_log(
+            f"{interaction.user.name} (ID: {interaction.user.id}) started archive backfill in guild {interaction.guild.id}."
+        )
+        self._backfill_task = asyncio.create_task(
+            self._backfill_guild(interaction.guild, interaction.user)
+        )
+
+    @app_commands.command(
+        name="archive_search",
+        description="Search archived messages in this server.",
+    )
+    @app_commands.describe(
+        query="Words or a \"quoted phrase\" to search for.",
+        user="Only show messages from this user.",
+        channel="Only show messages from this channel.",
+    )
+    @app_commands.default_permissions(manage_messages=True)
+    async def archive_search(
+        self,
+        interaction: discord.Interaction,
+        query: str,
+        user: Optional[discord.User] = None,
+        channel: Optional[discord.TextChannel] = None,
+    ):
+        if not await self._require_enabled(interaction):
+            return
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        self.flush()
+        try:
+            total, rows = await asyncio.to_thread(
+                self.search,
+                interaction.guild.id,
+                query,
+                user.id if user else None,
+                channel.id if channel else None,
+            )
+        except sqlite3.OperationalError as e:
+            await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Invalid Search",
+                    description=f"That search could not be understood: `{e}`",
+                    color=discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        lines = []
+        for row in rows:
+            content = " ".join((row["content"] or "").split())
+            if len(content) > 150:
+                content = content[:149] + "…"
+            flag = " (deleted)" if row["deleted"] else ""
+            link = f"https://discord.com/channels/{row['guild_id']}/{row['channel_id']}/{row['message_id']}"
+            lines.append(
+                f"<t:{row['created_at']}:d> <@{row['author_id']}> in <#{row['channel_id']}>{flag} [jump]({link})\n{content}"
+            )
+        embed = discord.Embed(
+            title=f"Archive Search: {total} match{'es' if total != 1 else ''}",
+            description="\n\n".join(lines)[:4000] if lines else "No matches.",
+            color=discord.Color.blurple(),
+        )
+        await interaction.followup.send(embed=embed, ephemeral=True)
+        audit_log(
+            f"{interaction.user.name} (ID: {interaction.user.id}) searched the archive for '{query}' in guild {interaction.guild.id}."
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(MessageArchive(bot))
@@ -0,0 +1,262 @@
+import discord
+import logging
+import sqlite3
+import asyncio
+import gzip
+import os
+import shutil
+import time
+import yaml
+from discord import app_commands
+from discord.ext import commands, tasks
+import datetime
+from typing import Optional, Tuple
+
+from utils.metrics import metrics
+
+DATABASE_PATH = "database.db"
+
+
+class BackupRestarted(Exception):
+    """Raised from the progress callback to abandon a stepped backup that keeps restarting."""
+
+
+def audit_log(message: str):
+    """Append a timestamped message to the audit log file."""
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        with open("audit.log", "a", encoding="utf-8") as f:
+            f.write(f"[{timestamp}] {message}\n")
+    except Exception as e:
+        logging.error(f"Failed to write to audit.log: {e}")
+
+
+class DatabaseBackup(commands.Cog):
+    """
+    Takes rotating, gzip-compressed snapshots of database.db while the bot is running.
+
+    Uses SQLite's online backup API on a worker thread. Each step copies a small
+    number of pages under a short shared lock and then pauses, so giveaway entries
+    and sticky updates on the main connections are never held up behind a backup.
+    A write from another connection restarts a stepped backup from page 0, so after
+    max_restarts restarts the copy is redone in a single step instead.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        try:
+            with open("config.yaml", "r", encoding="utf-8") as config_file:
+                self.config = yaml.safe_load(config_file) or {}
+        except Exception as e:
+            logging.warning(f"Backup: failed to load config.yaml, using defaults. {e}")
+            self.config = {}
+
+        backup_cfg = self.config.get("backup", {}) or {}
+        self.enabled: bool = bool(backup_cfg.get("enabled", True))
+        self.directory: str = str(backup_cfg.get("directory", "backups"))
+        self.keep: int = max(1, int(backup_cfg.get("keep", 14)))
+        self.interval_minutes: float = float(backup_cfg.get("interval_minutes", 360))
+        # Pages copied per backup step and the pause between steps (seconds).
+        self.pages_per_step: int = max(1, int(backup_cfg.get("pages_per_step", 64)))
+        self.step_pause: float = float(backup_cfg.get("step_pause", 0.05))
+        # Restarts tolerated before falling back to a single-step copy.
+        self.max_restarts: int = max(0, int(backup_cfg.get("max_restarts", 3)))
+        self.owner_ids = set(self.config.get("owner_ids", []) or [])
+
+        # Only one backup may run at a time (scheduled or manual).
+        self._run_lock = asyncio.Lock()
+
+        if self.enabled:
+            self.backup_loop.change_interval(minutes=self.interval_minutes)
+            self.backup_loop.start()
+
+    def cog_unload(self):
+        try:
+            self.backup_loop.cancel()
+        except Exception:
+            pass
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        logging.info("\033[96mBackup\033[0m cog synced successfully.")
+        audit_log("Backup cog synced successfully.")
+
+    # -----------------------
+    # Backup implementation
+    # -----------------------
+
+    def _snapshot_to_file(self) -> Tuple[str, int, int, int]:
+        """
+        Runs on a worker thread. Copies the live database into a temporary file with
+        the online backup API, verifies it, compresses it and rotates old snapshots.
+        Returns (path, raw_bytes, compressed_bytes, pages).
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        tmp_path = os.path.join(self.directory, f".database-{stamp}.db.tmp")
+        final_path = os.path.join(self.directory, f"database-{stamp}.db.gz")
+
+        pages_total = 0
+        steps = 0
+        restarts = 0
+        last_remaining: Optional[int] = None
+
+        def progress(status: int, remaining: int, total: int) -> None:
+            nonlocal pages_total, steps, restarts, last_remaining
+            pages_total = total
+            steps += 1
+            # A write on another connection sends the copy back to page 0,
+            # which shows up as the remaining count going up again.
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                if restarts > self.max_restarts:
+                    raise BackupRestarted()
+            last_remaining = remaining
+            # The shared lock on the source is released between steps;
+            # pausing here gives writers a clear window.
+            if remaining and self.step_pause > 0:
+                time.sleep(self.step_pause)
+
+        # Separate read-only connection so the bot's shared connections and cursors are untouched.
+        src = sqlite3.connect(f"file:{DATABASE_PATH}?mode=ro", uri=True, timeout=5)
+        dst = sqlite3.connect(tmp_path)
+        fell_back = False
+        try:
+            try:
+                src.backup(dst, pages=self.pages_per_step, progress=progress)
+            except BackupRestarted:
+                # Copy everything in one step: writers wait for one read lock,
+                # but the backup is guaranteed to finish.
+                fell_back = True
+                src.backup(dst, pages=-1)
+            check = dst.execute("PRAGMA quick_check").fetchone()
+            if not check or check[0] != "ok":
+                raise RuntimeError(f"Snapshot failed quick_check: {check}")
+        finally:
+            dst.close()
+            src.close()
+
+        try:
+            raw_size = os.path.getsize(tmp_path)
+            with open(tmp_path, "rb") as f_in, gzip.open(
+                final_path, "wb", compresslevel=6
+            ) as f_out:
+                shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
+        finally:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+        compressed_size = os.path.getsize(final_path)
+        metrics.set_gauge("backup.steps", steps)
+        metrics.incr("backup.restarts", restarts)
+        if fell_back:
+            metrics.incr("backup.single_step_fallbacks")
+            logging.warning(
+                f"Backup: stepped copy restarted {restarts} times under writes; "
+                "finished it in a single step."
+            )
+        self._rotate()
+        return final_path, raw_size, compressed_size, pages_total
+
+    def _rotate(self) -> None:
+        """Delete the oldest snapshots beyond the configured retention count."""
+        snapshots = sorted(
+            name
+            for name in os.listdir(self.directory)
+            if name.startswith("database-") and name.endswith(".db.gz")
+        )
+        for name in snapshots[: max(0, len(snapshots) - self.keep)]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+                metrics.incr("backup.rotated")
+            except OSError as e:
+                logging.warning(f"Backup: failed to remove old snapshot {name}: {e}")
+
+    async def run_backup(self) -> Optional[str]:
+        """Take one snapshot. Returns the snapshot path, or None if it failed."""
+        if not os.path.exists(DATABASE_PATH):
+            logging.warning("Backup skipped: database file not found.")
+            return None
+
+        async with self._run_lock:
+            started = time.perf_counter()
+            try:
+                path, raw_size, compressed_size, pages = await asyncio.to_thread(
+                    self._snapshot_to_file
+                )
+            except Exception as e:
+                metrics.incr("backup.failures")
+                logging.error(f"Database backup failed: {e}")
+                audit_log(f"Database backup failed: {e}")
+                return None
+
+            elapsed = time.perf_counter() - started
+            metrics.incr("backup.runs")
+            metrics.observe("backup.duration", elapsed)
+            metrics.set_gauge("backup.raw_bytes", raw_size)
+            metrics.set_gauge("backup.compressed_bytes", compressed_size)
+            metrics.set_gauge("backup.pages", pages)
+            metrics.set_gauge("backup.last_success", time.time())
+            logging.info(
+                f"Database backup written to {path} in {elapsed:.2f}s "
+                f"({raw_size} bytes raw, {compressed_size} bytes compressed)."
+            )
+            audit_log(
+                f"Database backup written to {path} in {elapsed:.2f}s ({raw_size} bytes raw, {compressed_size} bytes compressed)."
+            )
+            return path
+
+    @tasks.loop(minutes=360)
+    async def backup_loop(self):
+        await self.run_backup()
+
+    @backup_loop.before_loop
+    async def before_backup_loop(self):
+        await self.bot.wait_until_ready()
+
+    # -----------------------
+    # Commands
+    # -----------------------
+
+    @app_commands.command(
+        name="backup_now", description="Take a database backup immediately (owner only)."
+    )
+    async def backup_now(self, interaction: discord.Interaction):
+        if interaction.user.id not in self.owner_ids:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Error",
+                    description="Only the bot owners can run backups.",
+                    color=discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            audit_log(
+                f"{interaction.user.name} (ID: {interaction.user.id}) attempted /backup_now without permission."
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        path = await self.run_backup()
+        if path:
+            embed = discord.Embed(
+                title="Backup Complete",
+                description=f"Snapshot written to `{path}`.",
+                color=discord.Color.green(),
+            )
+        else:
+            embed = discord.Embed(
+                title="Backup Failed",
+                description="The backup could not be completed. Check the logs for details.",
+                color=discord.Color.red(),
+            )
+        await interaction.followup.send(embed=embed, ephemeral=True)
+        audit_log(
+            f"{interaction.user.name} (ID: {interaction.user.id}) invoked /backup_now. Result: {path or 'failed'}."
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(DatabaseBackup(bot))
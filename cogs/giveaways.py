@@ -1,18 +1,54 @@
 from __future__ import annotations
 
-from typing import Optional, List, Tuple, Sequence
+from typing import Dict, Optional, List, Set, Tuple, Sequence
 
+import asyncio
+import csv
 import datetime
+import gzip
+import io
+import json
 import logging
 import random
 import re
 import sqlite3
+import tempfile
 
 import discord
+import time
 import yaml
 from discord import app_commands
 from discord.ext import commands, tasks
 
+from utils.cache import response_cache
+from utils.metrics import metrics
+from utils.packing import pack_pairs, unpack_pairs
+from utils.paginator import LazyPagedView
+from utils.sampling import new_draw_seed, weighted_sample_without_replacement
+
+# Entrants shown per page of /giveaway_entrants (keeps each page well under the description limit)
+ENTRANTS_PER_PAGE = 40
+
+# Winner announcements are split so each embed description and each message stay under
+# Discord's limits (4096 characters per description, 6000 per message, 10 embeds per
+# message), with room left on every message for the reroll note.
+ANNOUNCE_DESCRIPTION_CHARS = 3800
+ANNOUNCE_MESSAGE_CHARS = 5400
+ANNOUNCE_EMBEDS_PER_MESSAGE = 10
+# Winners mentioned in a host DM, and per /giveaway_info field, before "and N more"
+HOST_DM_MENTIONS = 50
+INFO_FIELD_CHARS = 1000
+
+# /giveaway_stats: columns in the entry-rate sparkline and entrant milestones reported
+STATS_CURVE_WIDTH = 24
+STATS_SPARK_CHARS = "▁▂▃▄▅▆▇█"
+STATS_MILESTONES = (10, 50, 100, 500, 1000, 5000, 10000)
+
+# Rows fetched per batch by /giveaway_export, and how much of the file stays in memory
+EXPORT_BATCH_SIZE = 1000
+EXPORT_SPOOL_BYTES = 4 * 1024 * 1024
+EXPORT_FIELDS = ("user_id", "entries", "entered_at", "winner", "reroll_winner")
+
 # ============================================================
 # Database setup
 # ============================================================
@@ -83,6 +119,80 @@ cursor.execute(
     )
     """
 )
+
+# Entry summaries (kept once the retention job prunes per-user entry rows)
+cursor.execute(
+    """
+    CREATE TABLE IF NOT EXISTS giveaway_entry_summaries (
+        giveaway_id INTEGER PRIMARY KEY,
+        unique_entrants INTEGER NOT NULL DEFAULT 0,
+        total_entries INTEGER NOT NULL DEFAULT 0,
+        first_entry_at INTEGER,
+        last_entry_at INTEGER,
+        summarised_at INTEGER NOT NULL,
+        FOREIGN KEY (giveaway_id) REFERENCES giveaways(giveaway_id) ON DELETE CASCADE
+    )
+    """
+)
+
+# Per-minute entry activity, maintained by the entry flush (see Giveaways._flush_entries)
+_buckets_existed = conn.execute(
+    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'giveaway_entry_buckets'"
+).fetchone()
+cursor.execute(
+    """
+    CREATE TABLE IF NOT EXISTS giveaway_entry_buckets (
+        giveaway_id INTEGER NOT NULL,
+        minute INTEGER NOT NULL, -- unix time // 60
+        entries INTEGER NOT NULL DEFAULT 0,
+        leaves INTEGER NOT NULL DEFAULT 0,
+        joined INTEGER NOT NULL DEFAULT 0, -- users who went from no entries to some
+        departed INTEGER NOT NULL DEFAULT 0, -- users who removed their last entry
+        PRIMARY KEY (giveaway_id, minute),
+        FOREIGN KEY (giveaway_id) REFERENCES giveaways(giveaway_id) ON DELETE CASCADE
+    )
+    """
+)
+if not _buckets_existed:
+    # Seed from existing entries. Only each user's first entry time is known, so
+    # all of a user's entries land in that minute.
+    cursor.execute(
+        """
+        INSERT INTO giveaway_entry_buckets (giveaway_id, minute, entries, joined)
+        SELECT giveaway_id, entered_at / 60, SUM(entries), COUNT(*)
+        FROM giveaway_entries GROUP BY giveaway_id, entered_at / 60
+        """
+    )
+
+# Archived entrants of ended giveaways: one packed (user_id, entries) blob per
+# giveaway instead of one giveaway_entries row per user (see _archive_entries)
+cursor.execute(
+    """
+    CREATE TABLE IF NOT EXISTS giveaway_archive (
+        giveaway_id INTEGER PRIMARY KEY,
+        unique_entrants INTEGER NOT NULL,
+        total_entries INTEGER NOT NULL,
+        first_entry_at INTEGER,
+        last_entry_at INTEGER,
+        entrants BLOB NOT NULL,
+        archived_at INTEGER NOT NULL,
+        FOREIGN KEY (giveaway_id) REFERENCES giveaways(giveaway_id) ON DELETE CASCADE
+    )
+    """
+)
+
+# Indexes for the startup reconciliation queries (see Giveaways._reconcile)
+cursor.execute(
+    "CREATE INDEX IF NOT EXISTS idx_giveaways_status_end ON giveaways(status, end_time)"
+)
+cursor.execute(
+    "CREATE INDEX IF NOT EXISTS idx_giveaway_winners_giveaway ON giveaway_winners(giveaway_id, is_reroll)"
+)
+# Entrant pages walk this index in display order instead of sorting every entrant
+# (see Giveaways._get_entrants_page)
+cursor.execute(
+    "CREATE INDEX IF NOT EXISTS idx_giveaway_entries_rank ON giveaway_entries(giveaway_id, entries DESC, user_id)"
+)
 conn.commit()
 
 
@@ -91,12 +201,97 @@ def _column_names(table: str) -> List[str]:
     return [row["name"] for row in cursor.fetchall()]
 
 
+def _repair_entry_counters(guild_id: Optional[int] = None) -> int:
+    """
+    Recompute giveaways.entry_count and giveaways.unique_entrants from giveaway_entries,
+    falling back to the archive or the retention summary once per-user entries are gone.
+    Returns the number of giveaways whose counters were wrong.
+    """
+    where = "WHERE g.guild_id = ?" if guild_id is not None else ""
+    cursor.execute(
+        f"""
+        SELECT g.giveaway_id, g.entry_count, g.unique_entrants,
+               COALESCE(e.total, a.total_entries, s.total_entries, 0) AS total,
+               COALESCE(e.uniq, a.unique_entrants, s.unique_entrants, 0) AS uniq
+        FROM giveaways g
+        LEFT JOIN (
+            SELECT giveaway_id, SUM(entries) AS total, COUNT(*) AS uniq
+            FROM giveaway_entries GROUP BY giveaway_id
+        ) e ON e.giveaway_id = g.giveaway_id
+        LEFT JOIN giveaway_archive a ON a.giveaway_id = g.giveaway_id
+        LEFT JOIN giveaway_entry_summaries s ON s.giveaway_id = g.giveaway_id
+        {where}
+        """,
+        (guild_id,) if guild_id is not None else (),
+    )
+    fixes = [
+        (int(r["total"]), int(r["uniq"]), r["giveaway_id"])
+        for r in cursor.fetchall()
+        if (r["entry_count"], r["unique_entrants"]) != (r["total"], r["uniq"])
+    ]
+    if fixes:
+        cursor.executemany(
+            "UPDATE giveaways SET entry_count = ?, unique_entrants = ? WHERE giveaway_id = ?",
+            fixes,
+        )
+    conn.commit()
+    return len(fixes)
+
+
+def _archive_entries(giveaway_id: int) -> int:
+    """
+    Move a finished giveaway's entrants from giveaway_entries into one packed
+    giveaway_archive row, in a single transaction. Runs on a connection of its own,
+    so it is safe to call from a worker thread (see Giveaways._archive_finished).
+    Returns the number of entrants archived.
+    """
+    writer = sqlite3.connect("database.db", timeout=30)
+    try:
+        rows = writer.execute(
+            "SELECT user_id, entries, entered_at FROM giveaway_entries WHERE giveaway_id = ? ORDER BY user_id ASC",
+            (giveaway_id,),
+        ).fetchall()
+        if not rows:
+            return 0
+        # Packing runs outside any transaction, so the bot's own writes never wait on it.
+        blob = pack_pairs((user_id, entries) for user_id, entries, _ in rows)
+        entered = [entered_at for _, _, entered_at in rows]
+        with writer:
+            writer.execute(
+                "INSERT OR REPLACE INTO giveaway_archive (giveaway_id, unique_entrants, total_entries, first_entry_at, last_entry_at, entrants, archived_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    giveaway_id,
+                    len(rows),
+                    sum(entries for _, entries, _ in rows),
+                    min(entered),
+                    max(entered),
+                    blob,
+                    unix_now(),
+                ),
+            )
+            writer.execute("DELETE FROM giveaway_entries WHERE giveaway_id = ?", (giveaway_id,))
+        return len(rows)
+    finally:
+        writer.close()
+
+
+def _archived_entrants(giveaway_id: int) -> Optional[List[Tuple[int, int]]]:
+    """(user_id, entries) pairs in user_id order from the archive, or None if not archived."""
+    found = conn.execute(
+        "SELECT entrants FROM giveaway_archive WHERE giveaway_id = ?", (giveaway_id,)
+    ).fetchone()
+    return list(unpack_pairs(found[0])) if found else None
+
+
 def _ensure_schema() -> None:
     """
     Add idempotency columns so the DB communicates clearly:
       - giveaways.winners_drawn: 0/1 flag indicating whether original winners were chosen
       - giveaways.winners_message_id: message id of the original winners announcement
       - giveaways.winners_announced_at: unix time when the original announcement was posted
+    and the maintained counter giveaways.unique_entrants (see _repair_entry_counters),
+    plus per-winner DM delivery (giveaway_winners.dm_status / dm_attempts, see _notify_winners).
     """
     cols = _column_names("giveaways")
 
@@ -108,6 +303,22 @@ def _ensure_schema() -> None:
         cursor.execute("ALTER TABLE giveaways ADD COLUMN winners_message_id INTEGER")
     if "winners_announced_at" not in cols:
         cursor.execute("ALTER TABLE giveaways ADD COLUMN winners_announced_at INTEGER")
+    if "unique_entrants" not in cols:
+        cursor.execute(
+            "ALTER TABLE giveaways ADD COLUMN unique_entrants INTEGER NOT NULL DEFAULT 0"
+        )
+        conn.commit()
+        # Seed the new counter (and the legacy entry_count) from the entries table once.
+        _repair_entry_counters()
+
+    winner_cols = _column_names("giveaway_winners")
+    if "dm_status" not in winner_cols:
+        # pending | sent | closed (DMs disabled) | missing (left the server) | failed
+        cursor.execute("ALTER TABLE giveaway_winners ADD COLUMN dm_status TEXT")
+    if "dm_attempts" not in winner_cols:
+        cursor.execute(
+            "ALTER TABLE giveaway_winners ADD COLUMN dm_attempts INTEGER NOT NULL DEFAULT 0"
+        )
 
     # Normalise any NULLs that may exist after adding columns
     cursor.execute("UPDATE giveaways SET winners_drawn = COALESCE(winners_drawn, 0)")
@@ -179,33 +390,127 @@ def humanise_remaining(seconds: int) -> str:
 
 
 # ============================================================
-# Giveaway Entry View (Persistent)
+# Giveaway Entry Buttons (Dynamic)
 # ============================================================
-class GiveawayEntryView(discord.ui.View):
-    def __init__(self, cog: "Giveaways", giveaway_id: int):
-        super().__init__(timeout=None)  # persistent
-        self.cog = cog
-        self.giveaway_id = giveaway_id
+class GiveawayEntryButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"giveaway_(?P<action>enter|leave):(?P<giveaway_id>[0-9]+)",
+):
+    """
+    Enter/Leave button for any giveaway. Registered once with the bot, so clicks on
+    every giveaway message are routed here by custom_id pattern without keeping a
+    View per giveaway.
+    """
 
-        # Buttons need stable custom_ids for persistence
-        self.add_item(
+    def __init__(self, action: str, giveaway_id: int, label: Optional[str] = None):
+        super().__init__(
             discord.ui.Button(
-                label=self.cog.labels.get("enter_label", "Enter"),
-                style=discord.ButtonStyle.success,
-                custom_id=f"giveaway_enter:{giveaway_id}",
+                label=label or action.capitalize(),
+                style=(
+                    discord.ButtonStyle.success
+                    if action == "enter"
+                    else discord.ButtonStyle.secondary
+                ),
+                custom_id=f"giveaway_{action}:{giveaway_id}",
             )
         )
-        self.add_item(
-            discord.ui.Button(
-                label=self.cog.labels.get("leave_label", "Leave"),
-                style=discord.ButtonStyle.secondary,
-                custom_id=f"giveaway_leave:{giveaway_id}",
+        self.action = action
+        self.giveaway_id = giveaway_id
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: discord.ui.Button,
+        match: re.Match[str],
+    ) -> "GiveawayEntryButton":
+        return cls(match["action"], int(match["giveaway_id"]))
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        cog = interaction.client.get_cog("Giveaways")
+        if cog is not None:
+            await cog.handle_entry_button(
+                interaction, f"giveaway_{self.action}", self.giveaway_id
             )
-        )
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        # All checks are handled in component callbacks registered in the Cog
-        return True
+
+def export_entrants(giveaway_id: int, file_format: str) -> Tuple[tempfile.SpooledTemporaryFile, int]:
+    """
+    Write every entrant of a giveaway to a gzip-compressed CSV or JSONL file.
+    Rows are streamed in batches (from the cursor, or decoded from the archive)
+    into a spooled temp file, so memory stays flat however many entrants there
+    are. Runs on a read-only connection of its own, so it is safe to call from a
+    worker thread. Archived entrants have no per-user entry time.
+    Returns the file (rewound) and the number of rows written.
+    """
+    out = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+    written = 0
+    reader = sqlite3.connect("file:database.db?mode=ro", uri=True)
+    try:
+        winners: Dict[int, Set[int]] = {0: set(), 1: set()}
+        for user_id, is_reroll in reader.execute(
+            "SELECT user_id, is_reroll FROM giveaway_winners WHERE giveaway_id = ?",
+            (giveaway_id,),
+        ):
+            winners[1 if is_reroll else 0].add(user_id)
+
+        archived = reader.execute(
+            "SELECT entrants FROM giveaway_archive WHERE giveaway_id = ?", (giveaway_id,)
+        ).fetchone()
+
+        def batches():
+            if archived:
+                batch = []
+                for user_id, entries in unpack_pairs(archived[0]):
+                    batch.append((user_id, entries, None))
+                    if len(batch) >= EXPORT_BATCH_SIZE:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+                return
+            cur = reader.execute(
+                "SELECT user_id, entries, entered_at FROM giveaway_entries WHERE giveaway_id = ? ORDER BY user_id ASC",
+                (giveaway_id,),
+            )
+            while True:
+                batch = cur.fetchmany(EXPORT_BATCH_SIZE)
+                if not batch:
+                    return
+                yield batch
+
+        with gzip.GzipFile(fileobj=out, mode="wb") as gz:
+            text = io.TextIOWrapper(gz, encoding="utf-8", newline="")
+            writer = csv.writer(text) if file_format == "csv" else None
+            if writer:
+                writer.writerow(EXPORT_FIELDS)
+            for batch in batches():
+                for user_id, entries, entered_at in batch:
+                    record = (
+                        str(user_id),
+                        entries,
+                        datetime.datetime.fromtimestamp(
+                            entered_at, datetime.timezone.utc
+                        ).isoformat()
+                        if entered_at is not None
+                        else None,
+                        user_id in winners[0],
+                        user_id in winners[1],
+                    )
+                    if writer:
+                        writer.writerow(record)
+                    else:
+                        text.write(json.dumps(dict(zip(EXPORT_FIELDS, record))) + "\n")
+                written += len(batch)
+            text.flush()
+            text.detach()
+    except Exception:
+        out.close()
+        raise
+    finally:
+        reader.close()
+    out.seek(0)
+    return out, written
 
 
 # ============================================================
@@ -229,6 +534,43 @@ class Giveaways(commands.Cog):
             "leave_label": "Leave",
         }
 
+        # Coalesced message refreshes: at most one edit per giveaway per interval.
+        self.refresh_interval = 5.0
+        self.refresh_tasks: Dict[int, asyncio.Task] = {}
+        self.last_refresh_times: Dict[int, float] = {}
+        self.message_cache: Dict[int, discord.Message] = {}
+
+        # Group-commit entry buffer: clicks are validated against known_entries and
+        # written in one transaction per flush (see _flush_entries).
+        self.entry_flush_interval = 0.5
+        self.reconcile_concurrency = 4
+
+        # Eligibility index: guild_id -> blacklisted user ids, loaded once and kept
+        # in sync by _set_blacklisted. Edits made to the table outside the bot are
+        # picked up on the next reload.
+        self.blacklists: Dict[int, Set[int]] = {}
+        for bl in conn.execute("SELECT guild_id, user_id FROM giveaway_blacklist"):
+            self.blacklists.setdefault(bl["guild_id"], set()).add(bl["user_id"])
+
+        # Winner/host DMs are sent in the background after the announcement.
+        self.dm_concurrency = 5
+        self.dm_retries = 3
+        self.dm_backoff_base = 1.0
+        self.dm_backoff_max = 30.0
+
+        # Entrants of ended giveaways are packed into giveaway_archive once winners are drawn.
+        # Recently decoded archives are kept for paging and rerolls.
+        self.archive_entries = True
+        self.archive_cache: Dict[Tuple[int, bool], List[Tuple[int, int]]] = {}
+        self.notify_tasks: Set[asyncio.Task] = set()
+        self._reconcile_lock = asyncio.Lock()
+        self.entry_locks: Dict[int, asyncio.Lock] = {}
+        self.known_entries: Dict[int, Dict[int, int]] = {}
+        self.entry_buffer: Dict[int, Dict[int, Tuple[int, int]]] = {}
+        self.entry_deltas: Dict[int, List[int]] = {}
+        # giveaway_id -> minute -> [entries, leaves, joined, departed], written with the entries
+        self.bucket_deltas: Dict[int, Dict[int, List[int]]] = {}
+
         try:
             with open("config.yaml", "r", encoding="utf-8") as f:
                 self.config = yaml.safe_load(f) or {}
@@ -242,6 +584,16 @@ class Giveaways(commands.Cog):
             self.defaults["max_entries_per_user"] = int(
                 gw.get("default_max_entries_per_user", 1)
             )
+            self.refresh_interval = float(gw.get("refresh_interval", 5))
+            self.entry_flush_interval = (
+                max(50, int(gw.get("entry_flush_ms", 500))) / 1000
+            )
+            self.reconcile_concurrency = max(1, int(gw.get("reconcile_concurrency", 4)))
+            self.dm_concurrency = max(1, int(gw.get("dm_concurrency", 5)))
+            self.dm_retries = max(1, int(gw.get("dm_retries", 3)))
+            self.dm_backoff_base = max(0.0, float(gw.get("dm_backoff_base", 1.0)))
+            self.dm_backoff_max = max(self.dm_backoff_base, float(gw.get("dm_backoff_max", 30.0)))
+            self.archive_entries = bool(gw.get("archive_entries", True))
             labels_cfg = gw.get("labels", {})
             self.labels["enter_label"] = str(
                 labels_cfg.get("enter_button_label", "Enter")
@@ -254,22 +606,200 @@ class Giveaways(commands.Cog):
                 f"Giveaways: failed to load config.yaml, using defaults. {e}"
             )
 
-        # Register component callbacks for persistent custom_ids
-        bot.add_listener(self.on_component_interaction, "on_interaction")
+        # One pattern-matched handler for every giveaway's Enter/Leave buttons
+        bot.add_dynamic_items(GiveawayEntryButton)
 
         # Background task to sweep and end overdue giveaways
         self._sweep_overdue.start()
+        self._entry_flush_loop.change_interval(seconds=self.entry_flush_interval)
+        self._entry_flush_loop.start()
 
     def cog_unload(self) -> None:
         try:
             self._sweep_overdue.cancel()
         except Exception:
             pass
+        for task in self.refresh_tasks.values():
+            task.cancel()
+        self._entry_flush_loop.cancel()
+        # Nothing buffered may be lost on unload, reload or shutdown.
+        self._flush_entries()
         try:
-            self.bot.remove_listener(self.on_component_interaction, "on_interaction")
+            self.bot.remove_dynamic_items(GiveawayEntryButton)
         except Exception:
             pass
 
+    def _entry_view(self, giveaway_id: int) -> discord.ui.View:
+        """Buttons to attach to a giveaway message."""
+        view = discord.ui.View(timeout=None)
+        view.add_item(
+            GiveawayEntryButton("enter", giveaway_id, self.labels.get("enter_label"))
+        )
+        view.add_item(
+            GiveawayEntryButton("leave", giveaway_id, self.labels.get("leave_label"))
+        )
+        # Render-only: clicks are dispatched through the registered dynamic item,
+        # so a stopped view keeps discord.py from storing one per message.
+        view.stop()
+        return view
+
+    # --------------------------------------------------------
+    # Entry buffer
+    # --------------------------------------------------------
+    def _entry_lock(self, giveaway_id: int) -> asyncio.Lock:
+        lock = self.entry_locks.get(giveaway_id)
+        if lock is None:
+            lock = self.entry_locks[giveaway_id] = asyncio.Lock()
+        return lock
+
+    def _current_entries(self, giveaway_id: int, user_id: int) -> int:
+        """A user's entries including buffered clicks; read from the DB once per user."""
+        known = self.known_entries.setdefault(giveaway_id, {})
+        if user_id not in known:
+            cursor.execute(
+                "SELECT entries FROM giveaway_entries WHERE giveaway_id = ? AND user_id = ?",
+                (giveaway_id, user_id),
+            )
+            found = cursor.fetchone()
+            known[user_id] = int(found["entries"]) if found else 0
+        return known[user_id]
+
+    def _buffer_entry(
+        self, giveaway_id: int, guild_id: int, user_id: int, old: int, new: int
+    ) -> None:
+        self.known_entries.setdefault(giveaway_id, {})[user_id] = new
+        self.entry_buffer.setdefault(giveaway_id, {})[user_id] = (guild_id, new)
+        deltas = self.entry_deltas.setdefault(giveaway_id, [0, 0])
+        deltas[0] += new - old
+        deltas[1] += int(new > 0) - int(old > 0)
+        bucket = self.bucket_deltas.setdefault(giveaway_id, {}).setdefault(
+            unix_now() // 60, [0, 0, 0, 0]
+        )
+        bucket[0] += max(new - old, 0)
+        bucket[1] += max(old - new, 0)
+        bucket[2] += int(old == 0 and new > 0)
+        bucket[3] += int(old > 0 and new == 0)
+
+    def _pending_entry_delta(self, giveaway_id: int) -> int:
+        return self.entry_deltas.get(giveaway_id, [0, 0])[0]
+
+    def _flush_entries(self, giveaway_id: Optional[int] = None) -> int:
+        """
+        Write buffered entries (for one giveaway, or all), the matching counter
+        changes and the per-minute buckets in a single transaction. Returns the
+        number of entry rows written.
+        """
+        ids = [giveaway_id] if giveaway_id is not None else list(self.entry_buffer)
+        batches = {
+            gid: (self.entry_buffer.pop(gid), self.entry_deltas.pop(gid, [0, 0]))
+            for gid in ids
+            if self.entry_buffer.get(gid)
+        }
+        buckets = {gid: self.bucket_deltas.pop(gid, {}) for gid in batches}
+        if not batches:
+            return 0
+
+        now = unix_now()
+        upserts = []
+        deletes = []
+        counters = []
+        for gid, (users, (total_delta, unique_delta)) in batches.items():
+            for uid, (guild_id, entries) in users.items():
+                if entries > 0:
+                    upserts.append((gid, guild_id, uid, entries, now))
+                else:
+                    deletes.append((gid, uid))
+            counters.append((total_delta, unique_delta, gid))
+        bucket_rows = [
+            (gid, minute, *counts)
+            for gid, minutes in buckets.items()
+            for minute, counts in minutes.items()
+        ]
+
+        started = time.perf_counter()
+        try:
+            cursor.executemany(
+                "INSERT INTO giveaway_entries (giveaway_id, guild_id, user_id, entries, entered_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(giveaway_id, user_id) DO UPDATE SET entries = excluded.entries",
+                upserts,
+            )
+            cursor.executemany(
+                "DELETE FROM giveaway_entries WHERE giveaway_id = ? AND user_id = ?",
+                deletes,
+            )
+            cursor.executemany(
+                "UPDATE giveaways SET entry_count = MAX(entry_count + ?, 0), unique_entrants = MAX(unique_entrants + ?, 0) WHERE giveaway_id = ?",
+                counters,
+            )
+            cursor.executemany(
+                "INSERT INTO giveaway_entry_buckets (giveaway_id, minute, entries, leaves, joined, departed) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(giveaway_id, minute) DO UPDATE SET entries = entries + excluded.entries, "
+                "leaves = leaves + excluded.leaves, joined = joined + excluded.joined, departed = departed + excluded.departed",
+                bucket_rows,
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            metrics.incr("giveaways.entry_flush_failures")
+            logging.error(f"Failed to flush giveaway entries: {e}")
+            # Put the batch back underneath anything buffered since, so it is retried.
+            for gid, (users, (total_delta, unique_delta)) in batches.items():
+                merged = dict(users)
+                merged.update(self.entry_buffer.get(gid, {}))
+                self.entry_buffer[gid] = merged
+                deltas = self.entry_deltas.setdefault(gid, [0, 0])
+                deltas[0] += total_delta
+                deltas[1] += unique_delta
+                pending = self.bucket_deltas.setdefault(gid, {})
+                for minute, counts in buckets[gid].items():
+                    bucket = pending.setdefault(minute, [0, 0, 0, 0])
+                    for i, value in enumerate(counts):
+                        bucket[i] += value
+            return 0
+
+        written = len(upserts) + len(deletes)
+        metrics.incr("giveaways.entry_flushes")
+        metrics.incr("giveaways.entries_flushed", written)
+        metrics.observe("giveaways.entry_flush", time.perf_counter() - started)
+        self._invalidate_cached()
+        return written
+
+    def _forget_entries(self, giveaway_id: int) -> None:
+        """Flush and drop in-memory entry state once a giveaway stops taking entries."""
+        self._flush_entries(giveaway_id)
+        self.known_entries.pop(giveaway_id, None)
+        self.entry_locks.pop(giveaway_id, None)
+
+    @tasks.loop(seconds=0.5)
+    async def _entry_flush_loop(self) -> None:
+        self._flush_entries()
+
+    def export_state(self) -> Dict:
+        """Hand in-memory state to the next instance when this cog is hot-reloaded."""
+        # Pending refresh tasks are bound to this instance; the new one re-arms them.
+        pending: List[Tuple[int, int]] = []
+        for giveaway_id, task in list(self.refresh_tasks.items()):
+            if not task.done():
+                task.cancel()
+                msg = self.message_cache.get(giveaway_id)
+                if msg is not None and msg.guild is not None:
+                    pending.append((msg.guild.id, giveaway_id))
+        self.refresh_tasks.clear()
+        return {
+            "last_refresh_times": self.last_refresh_times,
+            "message_cache": self.message_cache,
+            "pending_refreshes": pending,
+        }
+
+    def import_state(self, state: Dict) -> None:
+        """Adopt state exported by the previous instance (see export_state)."""
+        self.last_refresh_times.update(state.get("last_refresh_times", {}))
+        self.message_cache.update(state.get("message_cache", {}))
+        for guild_id, giveaway_id in state.get("pending_refreshes", []):
+            guild = self.bot.get_guild(guild_id)
+            if guild is not None:
+                self._schedule_refresh(guild, giveaway_id)
+
     # --------------------------------------------------------
     # Permission Helpers
     # --------------------------------------------------------
@@ -278,8 +808,7 @@ class Giveaways(commands.Cog):
             return True
         if not self.manager_role_ids:
             return member.guild_permissions.manage_guild
-        member_role_ids = {r.id for r in member.roles}
-        return any(rid in member_role_ids for rid in self.manager_role_ids)
+        return any(member.get_role(rid) is not None for rid in self.manager_role_ids)
 
     # --------------------------------------------------------
     # Embeds
@@ -289,23 +818,147 @@ class Giveaways(commands.Cog):
         return discord.Embed(title=title, description=description, color=colour)
 
     @staticmethod
-    def _winners_embed(
+    def _winners_messages(
         prize: str,
         winners: Sequence[int],
         host_id: Optional[int],
         title: str = "🎉 Giveaway Winners",
-    ) -> discord.Embed:
-        if winners:
-            mentions = " ".join(f"<@{uid}>" for uid in winners)
-            contact_line = (
-                f"\n\nPlease contact <@{host_id}> to collect your prize."
-                if host_id
-                else ""
+    ) -> List[Tuple[List[discord.Embed], List[int]]]:
+        """
+        Winner announcement split into messages, as (embeds, winners mentioned) per message.
+        The split depends only on the arguments, so the same call rebuilds the same messages.
+        """
+        if not winners:
+            embed = discord.Embed(
+                title=title,
+                description="No valid entries. No winners could be selected.",
+                color=discord.Color.gold(),
             )
-            desc = f"Congratulations {mentions}!\n\nYou won **{prize}**.{contact_line}"
-        else:
-            desc = "No valid entries. No winners could be selected."
-        return discord.Embed(title=title, description=desc, color=discord.Color.gold())
+            return [([embed], [])]
+
+        contact_line = (
+            f"\n\nPlease contact <@{host_id}> to collect your prize." if host_id else ""
+        )
+        closing = f"\n\nYou won **{prize}**.{contact_line}"
+        pages: List[List[int]] = [[]]
+        length = len("Congratulations !") + len(closing)
+        for uid in winners:
+            mention = len(f"<@{uid}> ")
+            if pages[-1] and length + mention > ANNOUNCE_DESCRIPTION_CHARS:
+                pages.append([])
+                length = len("Congratulations !") + len(closing)
+            pages[-1].append(uid)
+            length += mention
+
+        messages: List[Tuple[List[discord.Embed], List[int]]] = []
+        size = 0
+        for number, page in enumerate(pages, start=1):
+            mentions = " ".join(f"<@{uid}>" for uid in page)
+            embed = discord.Embed(
+                title=title if len(pages) == 1 else f"{title} ({number}/{len(pages)})",
+                description=f"Congratulations {mentions}!{closing}",
+                color=discord.Color.gold(),
+            )
+            if (
+                not messages
+                or size + len(embed) > ANNOUNCE_MESSAGE_CHARS
+                or len(messages[-1][0]) >= ANNOUNCE_EMBEDS_PER_MESSAGE
+            ):
+                messages.append(([], []))
+                size = 0
+            messages[-1][0].append(embed)
+            messages[-1][1].extend(page)
+            size += len(embed)
+        return messages
+
+    async def _post_winners(
+        self,
+        channel: discord.abc.Messageable,
+        giveaway_id: int,
+        prize: str,
+        winners: Sequence[int],
+        host_id: Optional[int],
+        title: str,
+        is_reroll: bool,
+    ) -> List[discord.Message]:
+        """
+        Send a winner announcement as one or more messages, in order, and record
+        in giveaway_winners which message mentions each winner.
+
+        Each message is recorded as soon as it is sent, and the first message of an
+        original announcement is saved as winners_message_id straight away, so a
+        retry never posts the announcement twice. If a later message fails, the
+        messages already sent are returned; only a failure of the first one raises.
+        """
+        sent: List[discord.Message] = []
+        try:
+            for embeds, mentioned in self._winners_messages(prize, winners, host_id, title):
+                msg = await channel.send(embeds=embeds)
+                sent.append(msg)
+                cursor.executemany(
+                    "UPDATE giveaway_winners SET message_id = ? "
+                    "WHERE giveaway_id = ? AND is_reroll = ? AND user_id = ? AND message_id IS NULL",
+                    [(msg.id, giveaway_id, 1 if is_reroll else 0, uid) for uid in mentioned],
+                )
+                conn.commit()
+                if len(sent) == 1 and not is_reroll:
+                    self._save_winners_announcement_message(giveaway_id, msg.id)
+        except Exception as e:
+            if not sent:
+                raise
+            metrics.incr("giveaways.announcement_partial")
+            logging.warning(
+                f"Winner announcement for giveaway {giveaway_id} stopped after "
+                f"{len(sent)} message(s): {e}"
+            )
+        finally:
+            metrics.incr("giveaways.announcement_messages", len(sent))
+        return sent
+
+    async def _mark_rerolled(
+        self,
+        channel: discord.abc.Messageable,
+        row: sqlite3.Row,
+        reroll_message: discord.Message,
+    ) -> None:
+        """
+        Add a note pointing at the latest reroll to every original announcement
+        message. Edits go straight to the message ids recorded in giveaway_winners,
+        without fetching the messages first.
+        """
+        giveaway_id = row["giveaway_id"]
+        ids = [
+            r["message_id"]
+            for r in conn.execute(
+                "SELECT message_id, MIN(id) AS first_id FROM giveaway_winners "
+                "WHERE giveaway_id = ? AND is_reroll = 0 AND message_id IS NOT NULL "
+                "GROUP BY message_id ORDER BY first_id ASC",
+                (giveaway_id,),
+            )
+        ]
+        if not ids and row["winners_message_id"]:
+            # Announced before message ids were recorded per winner.
+            ids = [row["winners_message_id"]]
+        if not ids or not hasattr(channel, "get_partial_message"):
+            return
+        winners = self._existing_original_winner_ids(giveaway_id)
+        messages = self._winners_messages(row["prize"], winners, row["host_id"])
+        note = f"Rerolled <t:{unix_now()}:R>: [see the new winners]({reroll_message.jump_url})"
+        semaphore = asyncio.Semaphore(self.dm_concurrency)
+
+        async def edit(message_id: int, embeds: List[discord.Embed]) -> None:
+            embeds[-1].add_field(name="Rerolled", value=note, inline=False)
+            async with semaphore:
+                try:
+                    await channel.get_partial_message(message_id).edit(embeds=embeds)
+                except Exception as e:
+                    logging.warning(
+                        f"Failed to mark announcement {message_id} of giveaway {giveaway_id} as rerolled: {e}"
+                    )
+
+        await asyncio.gather(
+            *(edit(mid, embeds) for mid, (embeds, _) in zip(ids, messages))
+        )
 
     @staticmethod
     def _dm_winner_embed(
@@ -325,7 +978,9 @@ class Giveaways(commands.Cog):
         giveaway_id: int, prize: str, winners: Sequence[int], is_reroll: bool
     ) -> discord.Embed:
         if winners:
-            mentions = " ".join(f"<@{uid}>" for uid in winners)
+            mentions = " ".join(f"<@{uid}>" for uid in winners[:HOST_DM_MENTIONS])
+            if len(winners) > HOST_DM_MENTIONS:
+                mentions += f" and {len(winners) - HOST_DM_MENTIONS} more (see /giveaway_info)"
             action = "Reroll winners" if is_reroll else "Winners"
             desc = f"{action} for giveaway `{giveaway_id}` (**{prize}**): {mentions}"
         else:
@@ -349,33 +1004,110 @@ class Giveaways(commands.Cog):
         )
         return cursor.fetchall()
 
-    def _count_unique_entrants(self, giveaway_id: int) -> int:
-        cursor.execute(
-            "SELECT COUNT(*) FROM giveaway_entries WHERE giveaway_id = ?",
-            (giveaway_id,),
-        )
-        return int(cursor.fetchone()[0])
+    def _get_entrants_page(
+        self,
+        giveaway_id: int,
+        offset: int,
+        limit: int,
+        after: Optional[Tuple[int, int]] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        (user_id, entries) for one page, most entries first, from the live table or the archive.
 
-    def _count_total_entries(self, giveaway_id: int) -> int:
-        cursor.execute(
-            "SELECT COALESCE(SUM(entries), 0) FROM giveaway_entries WHERE giveaway_id = ?",
-            (giveaway_id,),
-        )
-        return int(cursor.fetchone()[0])
+        Pass the last (user_id, entries) of the previous page as `after` to seek
+        straight to this page in idx_giveaway_entries_rank; otherwise the index is
+        walked past `offset` rows, which still avoids sorting the whole giveaway.
+        """
+        ranked = self._archived_view(giveaway_id, ranked=True)
+        if ranked is not None:
+            return ranked[offset : offset + limit]
+        if after is not None:
+            last_user, last_entries = after
+            cursor.execute(
+                "SELECT user_id, entries FROM giveaway_entries "
+                "WHERE giveaway_id = ? AND entries <= ? AND (entries < ? OR user_id > ?) "
+                "ORDER BY entries DESC, user_id ASC LIMIT ?",
+                (giveaway_id, last_entries, last_entries, last_user, limit),
+            )
+        else:
+            cursor.execute(
+                "SELECT user_id, entries FROM giveaway_entries "
+                "WHERE giveaway_id = ? ORDER BY entries DESC, user_id ASC LIMIT ? OFFSET ?",
+                (giveaway_id, limit, offset),
+            )
+        return [(r["user_id"], r["entries"]) for r in cursor.fetchall()]
 
-    def _get_entrants(self, giveaway_id: int) -> List[sqlite3.Row]:
-        cursor.execute(
-            "SELECT user_id, entries FROM giveaway_entries WHERE giveaway_id = ? ORDER BY entries DESC, user_id ASC",
-            (giveaway_id,),
-        )
-        return cursor.fetchall()
+    def _archived_view(
+        self, giveaway_id: int, ranked: bool = False
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Decoded archive of a giveaway in user_id order (or most entries first when
+        ranked), or None if its entrants have not been archived.
+        """
+        key = (giveaway_id, ranked)
+        if key in self.archive_cache:
+            return self.archive_cache[key]
+        pairs = _archived_entrants(giveaway_id)
+        if pairs is None:
+            return None
+        if ranked:
+            pairs.sort(key=lambda p: (-p[1], p[0]))
+        if len(self.archive_cache) >= 8:
+            self.archive_cache.pop(next(iter(self.archive_cache)))
+        self.archive_cache[key] = pairs
+        return pairs
+
+    async def _archive_finished(self, giveaway_id: int) -> int:
+        """
+        Archive an ended giveaway's entrants once its winners are drawn, on a worker
+        thread so packing a large giveaway never blocks the event loop. Returns entrants archived.
+        """
+        if not self.archive_entries:
+            return 0
+        row = self._fetch_giveaway(giveaway_id)
+        if not row or row["status"] != "ended" or not row["winners_drawn"]:
+            return 0
+        self._forget_entries(giveaway_id)
+        try:
+            with metrics.timer("giveaways.archive"):
+                archived = await asyncio.to_thread(_archive_entries, giveaway_id)
+        except Exception as e:
+            logging.error(f"Failed to archive entrants of giveaway {giveaway_id}: {e}")
+            return 0
+        self.archive_cache.pop((giveaway_id, False), None)
+        self.archive_cache.pop((giveaway_id, True), None)
+        if archived:
+            metrics.incr("giveaways.archived_entrants", archived)
+        return archived
 
     def _user_is_blacklisted(self, guild_id: int, user_id: int) -> bool:
-        cursor.execute(
-            "SELECT 1 FROM giveaway_blacklist WHERE guild_id = ? AND user_id = ?",
-            (guild_id, user_id),
-        )
-        return cursor.fetchone() is not None
+        return user_id in self.blacklists.get(guild_id, ())
+
+    def _set_blacklisted(
+        self, guild_id: int, user_id: int, blacklisted: bool, reason: Optional[str] = None
+    ) -> bool:
+        """Add or remove a blacklist entry, keeping the in-memory index in step. Returns True if it changed."""
+        if blacklisted == self._user_is_blacklisted(guild_id, user_id):
+            return False
+        if blacklisted:
+            cursor.execute(
+                "INSERT OR REPLACE INTO giveaway_blacklist (guild_id, user_id, reason) VALUES (?, ?, ?)",
+                (guild_id, user_id, reason),
+            )
+            self.blacklists.setdefault(guild_id, set()).add(user_id)
+        else:
+            cursor.execute(
+                "DELETE FROM giveaway_blacklist WHERE guild_id = ? AND user_id = ?",
+                (guild_id, user_id),
+            )
+            self.blacklists.get(guild_id, set()).discard(user_id)
+        conn.commit()
+        return True
+
+    def _invalidate_cached(self, guild_id: Optional[int] = None) -> None:
+        """Drop cached /giveaway_list and /giveaway_info responses (all guilds if guild_id is None)."""
+        response_cache.invalidate("giveaway_list", guild_id)
+        response_cache.invalidate("giveaway_info", guild_id)
 
     def _record_winners(
         self,
@@ -386,14 +1118,16 @@ class Giveaways(commands.Cog):
     ) -> None:
         ts = unix_now()
         rows = [
-            (giveaway_id, uid, ts, 1 if is_reroll else 0, message_id) for uid in winners
+            (giveaway_id, uid, ts, 1 if is_reroll else 0, message_id, "pending")
+            for uid in winners
         ]
         if rows:
             cursor.executemany(
-                "INSERT INTO giveaway_winners (giveaway_id, user_id, announced_at, is_reroll, message_id) VALUES (?, ?, ?, ?, ?)",
+                "INSERT INTO giveaway_winners (giveaway_id, user_id, announced_at, is_reroll, message_id, dm_status) VALUES (?, ?, ?, ?, ?, ?)",
                 rows,
             )
         conn.commit()
+        self._invalidate_cached()
 
     def _has_original_winners(self, giveaway_id: int) -> bool:
         cursor.execute(
@@ -411,7 +1145,7 @@ class Giveaways(commands.Cog):
 
     def _fetch_winners(self, giveaway_id: int, is_reroll: bool) -> List[sqlite3.Row]:
         cursor.execute(
-            "SELECT user_id, announced_at FROM giveaway_winners WHERE giveaway_id = ? AND is_reroll = ? ORDER BY id ASC",
+            "SELECT user_id, announced_at, dm_status FROM giveaway_winners WHERE giveaway_id = ? AND is_reroll = ? ORDER BY id ASC",
             (giveaway_id, 1 if is_reroll else 0),
         )
         return cursor.fetchall()
@@ -422,6 +1156,7 @@ class Giveaways(commands.Cog):
             (giveaway_id,),
         )
         conn.commit()
+        self._invalidate_cached()
 
     def _save_winners_announcement_message(
         self, giveaway_id: int, message_id: Optional[int]
@@ -433,18 +1168,40 @@ class Giveaways(commands.Cog):
             (int(message_id), unix_now(), giveaway_id),
         )
         conn.commit()
+        self._invalidate_cached()
 
     def _set_status_and_end_time(self, giveaway_id: int, status: str) -> None:
+        self._forget_entries(giveaway_id)
         # Keep end_time accurate for "Ended" display if the giveaway is ended early or cancelled.
         cursor.execute(
             "UPDATE giveaways SET status = ?, end_time = ? WHERE giveaway_id = ?",
             (status, unix_now(), giveaway_id),
         )
         conn.commit()
+        self._invalidate_cached()
 
     # --------------------------------------------------------
     # Idempotent Winner Flow
     # --------------------------------------------------------
+    def _draw_winners(self, giveaway_id: int, desired_count: int, seed: int) -> List[int]:
+        """
+        Weighted draw without replacement, one ticket per entry.
+        Entrants are streamed in user_id order, so the same seed replays the same draw.
+        """
+        # Every acknowledged click must be in the table before drawing.
+        self._flush_entries(giveaway_id)
+        pairs = self._archived_view(giveaway_id)
+        if pairs is None:
+            pairs = conn.execute(
+                "SELECT user_id, entries FROM giveaway_entries WHERE giveaway_id = ? ORDER BY user_id ASC",
+                (giveaway_id,),
+            )
+        return weighted_sample_without_replacement(
+            ((int(uid), max(1, int(entries))) for uid, entries in pairs),
+            max(0, int(desired_count)),
+            random.Random(seed),
+        )
+
     async def _choose_original_winners_once(
         self, giveaway_id: int, desired_count: int
     ) -> List[int]:
@@ -455,25 +1212,8 @@ class Giveaways(commands.Cog):
         if self._has_original_winners(giveaway_id):
             return self._existing_original_winner_ids(giveaway_id)
 
-        entrants_rows = self._get_entrants(giveaway_id)
-
-        # Build "ticket bucket" with weighting (each entry is a ticket).
-        tickets: List[int] = []
-        for r in entrants_rows:
-            uid = int(r["user_id"])
-            count = int(max(1, int(r["entries"])))
-            tickets.extend([uid] * count)
-
-        winners: List[int] = []
-        desired = max(0, int(desired_count))
-        if tickets and desired > 0:
-            # Weighted without replacement:
-            # pick from tickets; when a user wins, remove all of their tickets.
-            while tickets and len(winners) < desired:
-                pick_uid = random.choice(tickets)
-                if pick_uid not in winners:
-                    winners.append(pick_uid)
-                tickets = [u for u in tickets if u != pick_uid]
+        seed = new_draw_seed()
+        winners = self._draw_winners(giveaway_id, desired_count, seed)
 
         self._record_winners(
             giveaway_id=giveaway_id, winners=winners, is_reroll=False, message_id=None
@@ -481,7 +1221,7 @@ class Giveaways(commands.Cog):
         self._mark_winners_drawn(giveaway_id)
 
         audit_log(
-            f"Original winners drawn for giveaway {giveaway_id}: {', '.join(map(str, winners)) if winners else 'no winners'}"
+            f"Original winners drawn for giveaway {giveaway_id} (seed {seed}): {', '.join(map(str, winners)) if winners else 'no winners'}"
         )
         return winners
 
@@ -507,44 +1247,28 @@ class Giveaways(commands.Cog):
             audit_log(
                 f"Skip duplicate announce for giveaway {giveaway_id}. Existing message id {row['winners_message_id']}."
             )
+            await self._archive_finished(giveaway_id)
             return winners, None
 
         try:
             channel = guild.get_channel(channel_id) or await guild.fetch_channel(
                 channel_id
             )
-            embed = self._winners_embed(prize, winners, host_id, title=title)
-            msg = await channel.send(embed=embed)
-            self._save_winners_announcement_message(giveaway_id, msg.id)
-
-            for uid in winners:
-                try:
-                    user = guild.get_member(uid) or await guild.fetch_member(uid)
-                    await user.send(
-                        embed=self._dm_winner_embed(guild.name, prize, host_id)
-                    )
-                except Exception:
-                    pass
-
-            if host_id:
-                try:
-                    host_member = guild.get_member(host_id) or await guild.fetch_member(
-                        host_id
-                    )
-                    await host_member.send(
-                        embed=self._dm_host_embed(
-                            giveaway_id, prize, winners, is_reroll=False
-                        )
-                    )
-                except Exception:
-                    pass
-
-            return winners, msg
+            sent = await self._post_winners(
+                channel, giveaway_id, prize, winners, host_id, title, is_reroll=False
+            )
+            # Sent even if only part of the announcement went out; winners_message_id is
+            # already saved, so a retry will not announce (or DM) again.
+            self._spawn_notifier(guild, giveaway_id, prize, host_id, winners, False)
+            message: Optional[discord.Message] = sent[0]
         except Exception as e:
             logging.warning(
                 f"Failed to post winners message for giveaway {giveaway_id}: {e}"
             )
-            return winners, None
+            message = None
+        # Archive only once the announcement is out, so packing never delays it.
+        await self._archive_finished(giveaway_id)
+        return winners, message
 
     async def _announce_reroll_winners(
         self,
@@ -561,84 +1285,208 @@ class Giveaways(commands.Cog):
         prize = row["prize"]
         host_id = row["host_id"]
 
-        entrants_rows = self._get_entrants(giveaway_id)
-        tickets: List[int] = []
-        for r in entrants_rows:
-            uid = int(r["user_id"])
-            count = int(max(1, int(r["entries"])))
-            tickets.extend([uid] * count)
-
-        winners: List[int] = []
-        desired = max(0, int(winners_to_draw))
-        if tickets and desired > 0:
-            while tickets and len(winners) < desired:
-                pick_uid = random.choice(tickets)
-                if pick_uid not in winners:
-                    winners.append(pick_uid)
-                tickets = [u for u in tickets if u != pick_uid]
-
-        msg: Optional[discord.Message] = None
-        try:
-            channel = guild.get_channel(channel_id) or await guild.fetch_channel(
-                channel_id
-            )
-            embed = self._winners_embed(prize, winners, host_id, title=title)
-            msg = await channel.send(embed=embed)
-        except Exception:
-            msg = None
+        seed = new_draw_seed()
+        winners = self._draw_winners(giveaway_id, winners_to_draw, seed)
 
         self._record_winners(
-            giveaway_id=giveaway_id,
-            winners=winners,
-            is_reroll=True,
-            message_id=(msg.id if msg else None),
+            giveaway_id=giveaway_id, winners=winners, is_reroll=True, message_id=None
         )
         audit_log(
-            f"Giveaway {giveaway_id} reroll winners: {', '.join(map(str, winners)) if winners else 'no winners'}"
+            f"Giveaway {giveaway_id} reroll winners (seed {seed}): {', '.join(map(str, winners)) if winners else 'no winners'}"
         )
 
-        for uid in winners:
-            try:
-                user = guild.get_member(uid) or await guild.fetch_member(uid)
-                await user.send(embed=self._dm_winner_embed(guild.name, prize, host_id))
-            except Exception:
-                pass
-
-        if host_id:
-            try:
-                host_member = guild.get_member(host_id) or await guild.fetch_member(
-                    host_id
-                )
-                await host_member.send(
-                    embed=self._dm_host_embed(
-                        giveaway_id, prize, winners, is_reroll=True
-                    )
-                )
-            except Exception:
-                pass
+        msg: Optional[discord.Message] = None
+        try:
+            channel = guild.get_channel(channel_id) or await guild.fetch_channel(
+                channel_id
+            )
+            sent = await self._post_winners(
+                channel, giveaway_id, prize, winners, host_id, title, is_reroll=True
+            )
+            msg = sent[0]
+            await self._mark_rerolled(channel, row, msg)
+        except Exception as e:
+            logging.warning(f"Failed to post reroll winners for giveaway {giveaway_id}: {e}")
 
+        self._spawn_notifier(guild, giveaway_id, prize, host_id, winners, True)
         return winners, msg
 
     # --------------------------------------------------------
-    # UI Builders
+    # Winner notifications
     # --------------------------------------------------------
-    def _build_giveaway_embed(
+    def _spawn_notifier(
         self,
         guild: discord.Guild,
+        giveaway_id: int,
         prize: str,
-        description: Optional[str],
-        host: Optional[discord.abc.User],
-        end_ts: int,
-        winner_count: int,
-        required_role_id: Optional[int],
-        entry_count: int,
-        status: str = "running",
-        message_url: Optional[str] = None,
-    ) -> discord.Embed:
-        remaining = max(0, end_ts - unix_now())
-        pretty_time = f"<t:{end_ts}:R>" if status == "running" else f"<t:{end_ts}:F>"
-        colour = (
-            discord.Color.green()
+        host_id: Optional[int],
+        winners: Sequence[int],
+        is_reroll: bool,
+    ) -> None:
+        """Send winner and host DMs in the background so the announcement does not wait."""
+        task = asyncio.create_task(
+            self._notify_winners(guild, giveaway_id, prize, host_id, list(winners), is_reroll)
+        )
+        # Keep a reference until done; the tasks are left to finish across a reload.
+        self.notify_tasks.add(task)
+        task.add_done_callback(self.notify_tasks.discard)
+
+    async def _resolve_members(
+        self, guild: discord.Guild, user_ids: Sequence[int]
+    ) -> Dict[int, discord.Member]:
+        """
+        Members from the cache, then one gateway query per 100 for the rest. If the
+        gateway query is unavailable, fall back to fetching the remainder over HTTP.
+        """
+        found: Dict[int, discord.Member] = {}
+        for uid in user_ids:
+            member = guild.get_member(uid)
+            if member is not None:
+                found[uid] = member
+        missing = [uid for uid in dict.fromkeys(user_ids) if uid not in found]
+        try:
+            for i in range(0, len(missing), 100):
+                members = await guild.query_members(user_ids=missing[i : i + 100], cache=True)
+                found.update((m.id, m) for m in members)
+            return found
+        except Exception:
+            pass
+
+        semaphore = asyncio.Semaphore(self.dm_concurrency)
+
+        async def fetch(uid: int) -> None:
+            async with semaphore:
+                try:
+                    found[uid] = await guild.fetch_member(uid)
+                except Exception:
+                    pass
+
+        await asyncio.gather(*(fetch(uid) for uid in missing if uid not in found))
+        return found
+
+    async def _send_dm(
+        self,
+        member: Optional[discord.abc.Messageable],
+        embed: discord.Embed,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[str, int]:
+        """
+        DM one user, retrying rate limits, server errors and timeouts with backoff.
+        Returns (status, attempts) with status as stored in giveaway_winners.dm_status.
+        """
+        if member is None:
+            return "missing", 0
+        attempts = 0
+        while True:
+            attempts += 1
+            # Hold a slot only for the send itself, so a user being backed off
+            # does not keep the other winners' DMs waiting.
+            async with semaphore:
+                try:
+                    await member.send(embed=embed)
+                    metrics.incr("giveaways.dm_sent")
+                    return "sent", attempts
+                except discord.Forbidden:
+                    metrics.incr("giveaways.dm_closed")
+                    return "closed", attempts
+                except discord.NotFound:
+                    return "missing", attempts
+                except (discord.HTTPException, discord.RateLimited, asyncio.TimeoutError, OSError) as e:
+                    transient = not isinstance(e, discord.HTTPException) or (
+                        e.status == 429 or e.status >= 500
+                    )
+                    if not transient or attempts >= self.dm_retries:
+                        metrics.incr("giveaways.dm_failed")
+                        logging.warning(f"Giving up on giveaway DM after {attempts} attempts: {e}")
+                        return "failed", attempts
+                    metrics.incr("giveaways.dm_retries")
+                    delay = self._dm_backoff(attempts - 1, e)
+            await asyncio.sleep(delay)
+
+    def _dm_backoff(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential backoff, honouring the retry delay Discord sends with a 429."""
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is None and isinstance(error, discord.HTTPException):
+            headers = getattr(error.response, "headers", None) or {}
+            retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(self.dm_backoff_max, max(0.0, float(retry_after)))
+            except (TypeError, ValueError):
+                pass
+        ceiling = min(self.dm_backoff_max, self.dm_backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    async def _notify_winners(
+        self,
+        guild: discord.Guild,
+        giveaway_id: int,
+        prize: str,
+        host_id: Optional[int],
+        winners: List[int],
+        is_reroll: bool,
+    ) -> None:
+        """DM the winners and the host in parallel and record each winner's delivery status."""
+        try:
+            with metrics.timer("giveaways.notify"):
+                members = await self._resolve_members(
+                    guild, winners + ([host_id] if host_id else [])
+                )
+                semaphore = asyncio.Semaphore(self.dm_concurrency)
+                winner_embed = self._dm_winner_embed(guild.name, prize, host_id)
+                sends = [
+                    self._send_dm(members.get(uid), winner_embed, semaphore)
+                    for uid in winners
+                ]
+                if host_id:
+                    sends.append(
+                        self._send_dm(
+                            members.get(host_id),
+                            self._dm_host_embed(giveaway_id, prize, winners, is_reroll),
+                            semaphore,
+                        )
+                    )
+                results = await asyncio.gather(*sends)
+
+            cursor.executemany(
+                "UPDATE giveaway_winners SET dm_status = ?, dm_attempts = dm_attempts + ? "
+                "WHERE giveaway_id = ? AND user_id = ? AND is_reroll = ? AND dm_status = 'pending'",
+                [
+                    (status, attempts, giveaway_id, uid, 1 if is_reroll else 0)
+                    for uid, (status, attempts) in zip(winners, results)
+                ],
+            )
+            conn.commit()
+            self._invalidate_cached(guild.id)
+
+            delivered = sum(1 for status, _ in results[: len(winners)] if status == "sent")
+            audit_log(
+                f"Giveaway {giveaway_id} winner DMs delivered {delivered}/{len(winners)}"
+                + (f", host DM {results[-1][0]}." if host_id else ".")
+            )
+        except Exception as e:
+            logging.error(f"Failed to notify winners of giveaway {giveaway_id}: {e}")
+
+    # --------------------------------------------------------
+    # UI Builders
+    # --------------------------------------------------------
+    def _build_giveaway_embed(
+        self,
+        guild: discord.Guild,
+        prize: str,
+        description: Optional[str],
+        host: Optional[discord.abc.User],
+        end_ts: int,
+        winner_count: int,
+        required_role_id: Optional[int],
+        entry_count: int,
+        status: str = "running",
+        message_url: Optional[str] = None,
+    ) -> discord.Embed:
+        remaining = max(0, end_ts - unix_now())
+        pretty_time = f"<t:{end_ts}:R>" if status == "running" else f"<t:{end_ts}:F>"
+        colour = (
+            discord.Color.green()
             if status == "running"
             else (
                 discord.Color.red() if status == "cancelled" else discord.Color.gold()
@@ -692,7 +1540,7 @@ class Giveaways(commands.Cog):
         if not row:
             return
         try:
-            entry_count = self._count_total_entries(giveaway_id)
+            entry_count = int(row["entry_count"]) + self._pending_entry_delta(giveaway_id)
             channel = guild.get_channel(row["channel_id"]) or await guild.fetch_channel(
                 row["channel_id"]
             )
@@ -709,6 +1557,9 @@ class Giveaways(commands.Cog):
                 message_id_val = None
 
             msg: Optional[discord.Message]
+            cached = self.message_cache.get(giveaway_id)
+            if message_hint is None and cached is not None and cached.id == message_id_val:
+                message_hint = cached
             if message_hint and (
                 message_id_val is None
                 or (
@@ -740,14 +1591,58 @@ class Giveaways(commands.Cog):
                 status=row["status"],
             )
             view = (
-                GiveawayEntryView(self, giveaway_id)
+                self._entry_view(giveaway_id)
                 if row["status"] == "running"
                 else None
             )
-            await msg.edit(embed=embed, view=view)
+            msg = await msg.edit(embed=embed, view=view)
+            metrics.incr("giveaways.refresh_edits")
+            if row["status"] == "running":
+                self.message_cache[giveaway_id] = msg
+            else:
+                self.message_cache.pop(giveaway_id, None)
+                self.last_refresh_times.pop(giveaway_id, None)
         except Exception as e:
+            self.message_cache.pop(giveaway_id, None)
             logging.warning(f"Failed to refresh giveaway message {giveaway_id}: {e}")
 
+    def _schedule_refresh(
+        self,
+        guild: discord.Guild,
+        giveaway_id: int,
+        message_hint: Optional[discord.Message] = None,
+    ) -> None:
+        """
+        Mark a giveaway message as needing a refresh. The first change after a quiet
+        period is shown straight away; later ones are folded into a single edit at
+        most every refresh_interval seconds, showing the latest count.
+        """
+        metrics.incr("giveaways.refresh_requests")
+        if message_hint is not None:
+            self.message_cache[giveaway_id] = message_hint
+        task = self.refresh_tasks.get(giveaway_id)
+        if task is not None and not task.done():
+            metrics.incr("giveaways.refresh_coalesced")
+            return
+        last = self.last_refresh_times.get(giveaway_id, 0.0)
+        delay = max(0.0, last + self.refresh_interval - time.monotonic())
+        self.refresh_tasks[giveaway_id] = asyncio.create_task(
+            self._delayed_refresh(guild, giveaway_id, delay)
+        )
+
+    async def _delayed_refresh(
+        self, guild: discord.Guild, giveaway_id: int, delay: float
+    ) -> None:
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # Clicks from here on schedule the next edit rather than joining this one.
+            self.refresh_tasks.pop(giveaway_id, None)
+            self.last_refresh_times[giveaway_id] = time.monotonic()
+            await self._refresh_giveaway_message(guild, giveaway_id)
+        except asyncio.CancelledError:
+            pass
+
     async def _end_if_overdue(self, guild: discord.Guild, row: sqlite3.Row) -> bool:
         """
         If the giveaway has passed its end_time, end it now and announce winners.
@@ -831,7 +1726,7 @@ class Giveaways(commands.Cog):
                     end_ts=ended_row["end_time"],
                     winner_count=int(ended_row["winner_count"]),
                     required_role_id=ended_row["required_role_id"],
-                    entry_count=self._count_total_entries(giveaway_id),
+                    entry_count=int(ended_row["entry_count"]),
                     status="ended",
                 )
                 await msg.edit(embed=embed, view=None)
@@ -876,26 +1771,10 @@ class Giveaways(commands.Cog):
     # --------------------------------------------------------
     # Component handling for persistent buttons
     # --------------------------------------------------------
-    async def on_component_interaction(self, interaction: discord.Interaction):
-        if interaction.type != discord.InteractionType.component:
-            return
-        data = interaction.data or {}
-        custom_id = data.get("custom_id")
-        if not custom_id:
-            return
-
-        if not (
-            custom_id.startswith("giveaway_enter:")
-            or custom_id.startswith("giveaway_leave:")
-        ):
-            return
-
-        try:
-            action, sid = custom_id.split(":")
-            giveaway_id = int(sid)
-        except Exception:
-            return
-
+    async def handle_entry_button(
+        self, interaction: discord.Interaction, action: str, giveaway_id: int
+    ) -> None:
+        """Enter or leave a giveaway from its message buttons (see GiveawayEntryButton)."""
         row = self._fetch_giveaway(giveaway_id)
         if not row:
             try:
@@ -971,7 +1850,7 @@ class Giveaways(commands.Cog):
         max_entries = int(row["max_entries_per_user"])
 
         # Role requirement
-        if required_role_id and not any(r.id == required_role_id for r in member.roles):
+        if required_role_id and member.get_role(required_role_id) is None:
             try:
                 await interaction.response.send_message(
                     embed=self._embed(
@@ -989,42 +1868,30 @@ class Giveaways(commands.Cog):
 
         # Enter
         if action == "giveaway_enter":
-            cursor.execute(
-                "SELECT entries FROM giveaway_entries WHERE giveaway_id = ? AND user_id = ?",
-                (giveaway_id_val, member.id),
-            )
-            existing = cursor.fetchone()
-            if existing:
-                current_entries = int(existing["entries"])
-                if current_entries >= max_entries:
-                    try:
-                        await interaction.response.send_message(
-                            embed=self._embed(
-                                "Entry limit reached",
-                                f"You already have the maximum of {max_entries} entries.",
-                                discord.Color.red(),
-                            ),
-                            ephemeral=True,
-                        )
-                    except Exception:
-                        pass
-                    return
-                cursor.execute(
-                    "UPDATE giveaway_entries SET entries = entries + 1 WHERE giveaway_id = ? AND user_id = ?",
-                    (giveaway_id_val, member.id),
-                )
-            else:
-                cursor.execute(
-                    "INSERT INTO giveaway_entries (giveaway_id, guild_id, user_id, entries, entered_at) VALUES (?, ?, ?, ?, ?)",
-                    (giveaway_id_val, guild.id, member.id, 1, unix_now()),
-                )
-
-            # Keep legacy giveaways.entry_count in sync with total entries
-            cursor.execute(
-                "UPDATE giveaways SET entry_count = entry_count + 1 WHERE giveaway_id = ?",
-                (giveaway_id_val,),
-            )
-            conn.commit()
+            async with self._entry_lock(giveaway_id_val):
+                current_entries = self._current_entries(giveaway_id_val, member.id)
+                at_limit = current_entries >= max_entries
+                if not at_limit:
+                    self._buffer_entry(
+                        giveaway_id_val,
+                        guild.id,
+                        member.id,
+                        current_entries,
+                        current_entries + 1,
+                    )
+            if at_limit:
+                try:
+                    await interaction.response.send_message(
+                        embed=self._embed(
+                            "Entry limit reached",
+                            f"You already have the maximum of {max_entries} entries.",
+                            discord.Color.red(),
+                        ),
+                        ephemeral=True,
+                    )
+                except Exception:
+                    pass
+                return
 
             try:
                 await interaction.response.send_message(
@@ -1041,18 +1908,21 @@ class Giveaways(commands.Cog):
             audit_log(
                 f"{member} entered giveaway {giveaway_id_val} in guild {guild.id}."
             )
-            await self._refresh_giveaway_message(
-                guild, giveaway_id_val, interaction.message
-            )
+            self._schedule_refresh(guild, giveaway_id_val, interaction.message)
 
         # Leave
         elif action == "giveaway_leave":
-            cursor.execute(
-                "SELECT entries FROM giveaway_entries WHERE giveaway_id = ? AND user_id = ?",
-                (giveaway_id_val, member.id),
-            )
-            existing = cursor.fetchone()
-            if not existing:
+            async with self._entry_lock(giveaway_id_val):
+                entries_count = self._current_entries(giveaway_id_val, member.id)
+                if entries_count > 0:
+                    self._buffer_entry(
+                        giveaway_id_val,
+                        guild.id,
+                        member.id,
+                        entries_count,
+                        entries_count - 1,
+                    )
+            if entries_count <= 0:
                 try:
                     await interaction.response.send_message(
                         embed=self._embed(
@@ -1066,24 +1936,6 @@ class Giveaways(commands.Cog):
                     pass
                 return
 
-            entries_count = int(existing["entries"])
-            if entries_count > 1:
-                cursor.execute(
-                    "UPDATE giveaway_entries SET entries = entries - 1 WHERE giveaway_id = ? AND user_id = ?",
-                    (giveaway_id_val, member.id),
-                )
-            else:
-                cursor.execute(
-                    "DELETE FROM giveaway_entries WHERE giveaway_id = ? AND user_id = ?",
-                    (giveaway_id_val, member.id),
-                )
-
-            cursor.execute(
-                "UPDATE giveaways SET entry_count = CASE WHEN entry_count > 0 THEN entry_count - 1 ELSE 0 END WHERE giveaway_id = ?",
-                (giveaway_id_val,),
-            )
-            conn.commit()
-
             try:
                 await interaction.response.send_message(
                     embed=self._embed(
@@ -1097,9 +1949,7 @@ class Giveaways(commands.Cog):
                 pass
 
             audit_log(f"{member} left giveaway {giveaway_id_val} in guild {guild.id}.")
-            await self._refresh_giveaway_message(
-                guild, giveaway_id_val, interaction.message
-            )
+            self._schedule_refresh(guild, giveaway_id_val, interaction.message)
 
     # --------------------------------------------------------
     # Slash Commands
@@ -1188,8 +2038,8 @@ class Giveaways(commands.Cog):
         cursor.execute(
             """
             INSERT INTO giveaways
-                (guild_id, channel_id, prize, description, host_id, start_time, end_time, winner_count, status, required_role_id, max_entries_per_user, entry_count, winners_drawn, winners_message_id, winners_announced_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'running', ?, ?, 0, 0, NULL, NULL)
+                (guild_id, channel_id, prize, description, host_id, start_time, end_time, winner_count, status, required_role_id, max_entries_per_user, entry_count, unique_entrants, winners_drawn, winners_message_id, winners_announced_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'running', ?, ?, 0, 0, 0, NULL, NULL)
             """,
             (
                 guild.id,
@@ -1206,6 +2056,7 @@ class Giveaways(commands.Cog):
         )
         conn.commit()
         giveaway_id = cursor.lastrowid
+        self._invalidate_cached(guild.id)
 
         embed = self._build_giveaway_embed(
             guild=guild,
@@ -1218,7 +2069,7 @@ class Giveaways(commands.Cog):
             entry_count=0,
             status="running",
         )
-        view = GiveawayEntryView(self, giveaway_id)
+        view = self._entry_view(giveaway_id)
 
         try:
             content_ping = f"<@&{self.ping_role_id}>" if self.ping_role_id else None
@@ -1242,6 +2093,7 @@ class Giveaways(commands.Cog):
             (message.id, giveaway_id),
         )
         conn.commit()
+        self._invalidate_cached(guild.id)
 
         await interaction.followup.send(
             embed=self._embed(
@@ -1483,7 +2335,7 @@ class Giveaways(commands.Cog):
                     end_ts=fresh["end_time"],
                     winner_count=int(fresh["winner_count"]),
                     required_role_id=fresh["required_role_id"],
-                    entry_count=self._count_total_entries(giveaway_id),
+                    entry_count=int(fresh["entry_count"]),
                     status="cancelled",
                 )
                 await msg.edit(embed=embed, view=None)
@@ -1516,6 +2368,15 @@ class Giveaways(commands.Cog):
             )
             return
 
+        cached = response_cache.get("giveaway_list", guild.id)
+        if cached is not None:
+            await interaction.response.send_message(
+                embed=discord.Embed.from_dict(cached)
+            )
+            return
+
+        self._flush_entries()
+
         # Optional: mark any overdue ones as ended so they stop showing up
         try:
             cursor.execute(
@@ -1535,6 +2396,7 @@ class Giveaways(commands.Cog):
                 description="There are no active giveaways.",
                 color=discord.Color.blurple(),
             )
+            response_cache.set("giveaway_list", guild.id, embed.to_dict())
             await interaction.response.send_message(embed=embed)
             return
 
@@ -1554,6 +2416,14 @@ class Giveaways(commands.Cog):
             description="\n".join(lines),
             color=discord.Color.blurple(),
         )
+        # Never serve the list past the next end time, even if the sweep is late.
+        next_end = min(int(row["end_time"]) for row in giveaways)
+        response_cache.set(
+            "giveaway_list",
+            guild.id,
+            embed.to_dict(),
+            ttl=min(response_cache.ttl, max(1, next_end - unix_now())),
+        )
         await interaction.response.send_message(embed=embed)
         audit_log(f"Listed active giveaways in guild {guild.id}.")
 
@@ -1574,6 +2444,14 @@ class Giveaways(commands.Cog):
             )
             return
 
+        cached = response_cache.get("giveaway_info", guild.id, giveaway_id)
+        if cached is not None:
+            await interaction.response.send_message(
+                embed=discord.Embed.from_dict(cached)
+            )
+            return
+
+        self._flush_entries(giveaway_id)
         row = self._fetch_giveaway(giveaway_id)
         if not row or row["guild_id"] != guild.id:
             await interaction.response.send_message(
@@ -1596,7 +2474,8 @@ class Giveaways(commands.Cog):
         status = row["status"]
         required_role_id = row["required_role_id"]
         max_entries = int(row["max_entries_per_user"])
-        entry_count = self._count_total_entries(giveaway_id)
+        entry_count = int(row["entry_count"])
+        unique_entrants = int(row["unique_entrants"])
         winners_drawn = int(row["winners_drawn"])
         winners_msg_id = row["winners_message_id"]
         winners_announced_at = row["winners_announced_at"]
@@ -1629,7 +2508,7 @@ class Giveaways(commands.Cog):
         embed.add_field(name="ID", value=str(giveaway_id), inline=True)
         embed.add_field(
             name="Unique Entrants",
-            value=str(self._count_unique_entrants(giveaway_id)),
+            value=str(unique_entrants),
             inline=True,
         )
 
@@ -1640,10 +2519,17 @@ class Giveaways(commands.Cog):
             if not rows:
                 return "None recorded"
             parts = []
-            for r in rows:
+            length = 0
+            for shown, r in enumerate(rows):
                 uid = r["user_id"]
                 ts = r["announced_at"]
-                parts.append(f"<@{uid}> <t:{ts}:R>")
+                dm = f" · DM {r['dm_status']}" if r["dm_status"] else ""
+                line = f"<@{uid}> <t:{ts}:R>{dm}"
+                if length + len(line) + 40 > INFO_FIELD_CHARS:
+                    parts.append(f"... and {len(rows) - shown} more")
+                    break
+                parts.append(line)
+                length += len(line) + 1
             return "\n".join(parts)
 
         embed.add_field(
@@ -1665,9 +2551,250 @@ class Giveaways(commands.Cog):
             name="Original Announcement Posted", value=announced_state, inline=True
         )
 
+        ttl = response_cache.ttl
+        if status == "running":
+            ttl = min(ttl, max(1, end_ts - unix_now()))
+        response_cache.set(
+            "giveaway_info", guild.id, embed.to_dict(), args=giveaway_id, ttl=ttl
+        )
         await interaction.response.send_message(embed=embed)
         audit_log(f"Viewed info for giveaway {giveaway_id} in guild {guild.id}.")
 
+    def _stats_embed(self, row: sqlite3.Row) -> discord.Embed:
+        """Entry-rate curve, peak rate and time to N entrants, from the minute buckets only."""
+        giveaway_id = row["giveaway_id"]
+        buckets = conn.execute(
+            "SELECT minute, entries, leaves, joined, departed FROM giveaway_entry_buckets WHERE giveaway_id = ? ORDER BY minute ASC",
+            (giveaway_id,),
+        ).fetchall()
+
+        embed = discord.Embed(
+            title=f"Giveaway Stats - {row['prize']}",
+            color=discord.Color.blurple(),
+        )
+        embed.set_footer(text=f"Giveaway ID: {giveaway_id}")
+        if not buckets:
+            embed.description = "No entry activity has been recorded for this giveaway."
+            return embed
+
+        start_min = row["start_time"] // 60
+        end_min = max(start_min, min(row["end_time"], unix_now()) // 60, buckets[-1]["minute"])
+        span = end_min - start_min + 1
+
+        total_entries = total_leaves = 0
+        peak_rate, peak_minute = 0, start_min
+        columns = [0] * min(STATS_CURVE_WIDTH, span)
+        entrants = 0
+        reached: List[Tuple[int, int]] = []
+        milestones = iter(STATS_MILESTONES)
+        target = next(milestones)
+        for b in buckets:
+            total_entries += b["entries"]
+            total_leaves += b["leaves"]
+            if b["entries"] > peak_rate:
+                peak_rate, peak_minute = b["entries"], b["minute"]
+            offset = max(0, b["minute"] - start_min)
+            columns[min(len(columns) - 1, offset * len(columns) // span)] += b["entries"]
+            entrants += b["joined"] - b["departed"]
+            while target is not None and entrants >= target:
+                reached.append((target, (b["minute"] + 1) * 60 - row["start_time"]))
+                target = next(milestones, None)
+
+        top = max(columns) or 1
+        levels = len(STATS_SPARK_CHARS) - 1
+        curve = "".join(
+            STATS_SPARK_CHARS[round(c / top * levels)] if c else " " for c in columns
+        )
+        minutes_per_column = span / len(columns)
+
+        embed.add_field(
+            name="Entry rate",
+            value=f"`{curve}`\n<t:{start_min * 60}:f> to <t:{end_min * 60}:f> "
+            f"(~{humanise_remaining(int(minutes_per_column * 60))} per column)",
+            inline=False,
+        )
+        embed.add_field(
+            name="Peak rate",
+            value=f"{peak_rate} entries/min at <t:{peak_minute * 60}:t>",
+            inline=True,
+        )
+        embed.add_field(
+            name="Average rate",
+            value=f"{total_entries / span:.1f} entries/min",
+            inline=True,
+        )
+        embed.add_field(
+            name="Activity",
+            value=f"{total_entries} entries, {total_leaves} removed",
+            inline=True,
+        )
+        embed.add_field(
+            name="Time to entrants",
+            value="\n".join(
+                f"{n}: {humanise_remaining(max(60, secs))}" for n, secs in reached
+            )
+            or f"Fewer than {STATS_MILESTONES[0]} entrants so far.",
+            inline=False,
+        )
+        return embed
+
+    @app_commands.command(
+        name="giveaway_stats",
+        description="Show how fast a giveaway filled: entry rate, peak and time to N entrants.",
+    )
+    @app_commands.describe(giveaway_id="The ID of the giveaway.")
+    async def giveaway_stats(self, interaction: discord.Interaction, giveaway_id: int):
+        guild = interaction.guild
+        if guild is None:
+            await interaction.response.send_message(
+                embed=self._embed(
+                    "Server only",
+                    "This command must be used in a server.",
+                    discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        row = self._fetch_giveaway(giveaway_id)
+        if not row or row["guild_id"] != guild.id:
+            await interaction.response.send_message(
+                embed=self._embed(
+                    "Not found",
+                    "Giveaway not found in this server.",
+                    discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        self._flush_entries(giveaway_id)
+        await interaction.response.send_message(embed=self._stats_embed(row))
+        audit_log(f"Viewed stats for giveaway {giveaway_id} in guild {guild.id}.")
+
+    @app_commands.command(
+        name="giveaway_repair_counts",
+        description="Recompute the stored entry counters for this server's giveaways.",
+    )
+    async def giveaway_repair_counts(self, interaction: discord.Interaction):
+        actor = interaction.user
+        guild = interaction.guild
+        if not isinstance(actor, discord.Member) or guild is None:
+            await interaction.response.send_message(
+                embed=self._embed(
+                    "Server only",
+                    "This command must be used in a server.",
+                    discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        if not self._is_manager(actor):
+            await interaction.response.send_message(
+                embed=self._embed(
+                    "No permission",
+                    "You do not have permission to repair giveaway counters.",
+                    discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        self._flush_entries()
+        fixed = _repair_entry_counters(guild.id)
+        self._invalidate_cached(guild.id)
+        for row in self._active_giveaways_for_guild(guild.id):
+            self._schedule_refresh(guild, row["giveaway_id"])
+
+        await interaction.response.send_message(
+            embed=self._embed(
+                "Counters repaired",
+                f"Recomputed entry counters. {fixed} giveaway(s) were out of date."
+                if fixed
+                else "Recomputed entry counters. Everything was already correct.",
+                discord.Color.green(),
+            ),
+            ephemeral=True,
+        )
+        audit_log(
+            f"{actor} repaired giveaway entry counters in guild {guild.id}: {fixed} corrected."
+        )
+
+    @app_commands.command(
+        name="giveaway_blacklist_add",
+        description="Stop a member from entering giveaways in this server.",
+    )
+    @app_commands.describe(
+        user="The member to blacklist.",
+        reason="Optional reason, kept in the blacklist record.",
+    )
+    async def giveaway_blacklist_add(
+        self,
+        interaction: discord.Interaction,
+        user: discord.User,
+        reason: Optional[str] = None,
+    ):
+        await self._change_blacklist(interaction, user, True, reason)
+
+    @app_commands.command(
+        name="giveaway_blacklist_remove",
+        description="Allow a blacklisted member to enter giveaways again.",
+    )
+    @app_commands.describe(user="The member to remove from the blacklist.")
+    async def giveaway_blacklist_remove(
+        self, interaction: discord.Interaction, user: discord.User
+    ):
+        await self._change_blacklist(interaction, user, False)
+
+    async def _change_blacklist(
+        self,
+        interaction: discord.Interaction,
+        user: discord.User,
+        blacklisted: bool,
+        reason: Optional[str] = None,
+    ) -> None:
+        actor = interaction.user
+        guild = interaction.guild
+        if not isinstance(actor, discord.Member) or guild is None:
+            await interaction.response.send_message(
+                embed=self._embed(
+                    "Server only",
+                    "This command must be used in a server.",
+                    discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        if not self._is_manager(actor):
+            await interaction.response.send_message(
+                embed=self._embed(
+                    "No permission",
+                    "You do not have permission to manage the giveaway blacklist.",
+                    discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        changed = self._set_blacklisted(guild.id, user.id, blacklisted, reason)
+        if blacklisted:
+            title = "Blacklisted" if changed else "Already blacklisted"
+            desc = f"{user.mention} can no longer enter giveaways in this server."
+        else:
+            title = "Removed from blacklist" if changed else "Not blacklisted"
+            desc = f"{user.mention} can enter giveaways in this server."
+        await interaction.response.send_message(
+            embed=self._embed(title, desc, discord.Color.green()),
+            ephemeral=True,
+        )
+        if changed:
+            audit_log(
+                f"{actor} {'blacklisted' if blacklisted else 'unblacklisted'} {user} ({user.id}) "
+                f"from giveaways in guild {guild.id}" + (f": {reason}" if reason else ".")
+            )
+
     @app_commands.command(
         name="giveaway_entrants",
         description="List all people who have entered a giveaway.",
@@ -1694,6 +2821,7 @@ class Giveaways(commands.Cog):
             )
             return
 
+        self._flush_entries(giveaway_id)
         row = self._fetch_giveaway(giveaway_id)
         if not row or row["guild_id"] != guild.id:
             await interaction.response.send_message(
@@ -1706,8 +2834,8 @@ class Giveaways(commands.Cog):
             )
             return
 
-        entrants = self._get_entrants(giveaway_id)
-        if not entrants:
+        unique_entrants = int(row["unique_entrants"])
+        if not unique_entrants:
             await interaction.response.send_message(
                 embed=self._embed(
                     "No entrants",
@@ -1719,97 +2847,257 @@ class Giveaways(commands.Cog):
             return
 
         header = f"Entrants for giveaway `{giveaway_id}` - **{row['prize']}**"
-        lines: List[str] = []
-        for r in entrants:
-            mention = f"<@{r['user_id']}>"
-            if show_entries:
-                lines.append(f"{mention} - {r['entries']} entries")
-            else:
-                lines.append(mention)
-
-        chunks: List[List[str]] = []
-        current: List[str] = []
-        current_len = 0
-        for line in lines:
-            add_len = len(line) + 1
-            if current_len + add_len > 3800:
-                chunks.append(current)
-                current = [line]
-                current_len = add_len
-            else:
-                current.append(line)
-                current_len += add_len
-        if current:
-            chunks.append(current)
-
-        first_embed = discord.Embed(
-            title="Giveaway Entrants",
-            description=f"{header}\n\n" + "\n".join(chunks[0]),
-            color=discord.Color.blurple(),
-        )
-        await interaction.response.send_message(embed=first_embed, ephemeral=True)
-
-        for extra in chunks[1:]:
+        page_count = -(-unique_entrants // ENTRANTS_PER_PAGE)
+
+        # Each page reads only its own slice of entrants when it is opened. The last
+        # entrant of every rendered page is kept so the next page can seek from it.
+        page_ends: Dict[int, Tuple[int, int]] = {}
+
+        async def render(index: int) -> discord.Embed:
+            lines: List[str] = []
+            page = self._get_entrants_page(
+                giveaway_id,
+                index * ENTRANTS_PER_PAGE,
+                ENTRANTS_PER_PAGE,
+                after=page_ends.get(index - 1),
+            )
+            if page:
+                page_ends[index] = page[-1]
+            for user_id, entries in page:
+                mention = f"<@{user_id}>"
+                if show_entries:
+                    lines.append(f"{mention} - {entries} entries")
+                else:
+                    lines.append(mention)
             emb = discord.Embed(
-                title="Giveaway Entrants (cont.)",
-                description="\n".join(extra),
+                title="Giveaway Entrants",
+                description=f"{header}\n\n" + ("\n".join(lines) or "_No entrants on this page._"),
                 color=discord.Color.blurple(),
             )
-            try:
-                await interaction.followup.send(embed=emb, ephemeral=True)
-            except Exception:
-                break
+            emb.set_footer(
+                text=f"Page {index + 1} of {page_count} • {unique_entrants} entrants"
+            )
+            return emb
+
+        await LazyPagedView(interaction.user.id, page_count, render).send(interaction)
+
+    @app_commands.command(
+        name="giveaway_export",
+        description="Download every entrant of a giveaway as a compressed CSV or JSONL file.",
+    )
+    @app_commands.describe(
+        giveaway_id="The ID of the giveaway.",
+        file_format="CSV (default) or JSON Lines.",
+    )
+    @app_commands.choices(
+        file_format=[
+            app_commands.Choice(name="CSV", value="csv"),
+            app_commands.Choice(name="JSON Lines", value="jsonl"),
+        ]
+    )
+    async def giveaway_export(
+        self,
+        interaction: discord.Interaction,
+        giveaway_id: int,
+        file_format: Optional[app_commands.Choice[str]] = None,
+    ):
+        actor = interaction.user
+        guild = interaction.guild
+        if not isinstance(actor, discord.Member) or guild is None:
+            await interaction.response.send_message(
+                embed=self._embed(
+                    "Server only",
+                    "This command must be used in a server.",
+                    discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        if not self._is_manager(actor):
+            await interaction.response.send_message(
+                embed=self._embed(
+                    "No permission",
+                    "You do not have permission to export giveaway entrants.",
+                    discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        row = self._fetch_giveaway(giveaway_id)
+        if not row or row["guild_id"] != guild.id:
+            await interaction.response.send_message(
+                embed=self._embed(
+                    "Not found",
+                    "Giveaway not found in this server.",
+                    discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        fmt = file_format.value if file_format else "csv"
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        self._flush_entries(giveaway_id)
+
+        started = time.perf_counter()
+        try:
+            out, written = await asyncio.to_thread(export_entrants, giveaway_id, fmt)
+        except Exception as e:
+            logging.error(f"Failed to export entrants of giveaway {giveaway_id}: {e}")
+            await interaction.followup.send(
+                embed=self._embed(
+                    "Export failed",
+                    "The entrants could not be exported. Please try again.",
+                    discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+        metrics.observe("giveaways.export", time.perf_counter() - started)
+
+        with out:
+            size = out.seek(0, io.SEEK_END)
+            out.seek(0)
+            if not written:
+                desc = (
+                    "Per-user entries for this giveaway have been pruned by retention; "
+                    "only the totals remain."
+                    if row["entry_count"]
+                    else "Nobody has entered this giveaway yet."
+                )
+                await interaction.followup.send(
+                    embed=self._embed("No entrants", desc, discord.Color.blurple()),
+                    ephemeral=True,
+                )
+                return
+            if size > guild.filesize_limit:
+                await interaction.followup.send(
+                    embed=self._embed(
+                        "Export too large",
+                        f"The compressed export is {size / 1_048_576:.1f} MB, over this server's upload limit.",
+                        discord.Color.red(),
+                    ),
+                    ephemeral=True,
+                )
+                return
+            await interaction.followup.send(
+                content=f"{written} entrants of giveaway `{giveaway_id}` - **{row['prize']}**.",
+                file=discord.File(out, filename=f"giveaway_{giveaway_id}_entrants.{fmt}.gz"),
+                ephemeral=True,
+            )
+        audit_log(
+            f"{actor} exported {written} entrants of giveaway {giveaway_id} in guild {guild.id} as {fmt}."
+        )
 
     # --------------------------------------------------------
-    # Ready: register persistent views for active giveaways and sweep overdue
+    # Ready: sweep overdue giveaways and announce missing winners
     # --------------------------------------------------------
-    @commands.Cog.listener()
-    async def on_ready(self) -> None:
-        try:
-            cursor.execute("SELECT giveaway_id FROM giveaways WHERE status = 'running'")
-            ids = [row["giveaway_id"] for row in cursor.fetchall()]
-            for gid in ids:
-                self.bot.add_view(GiveawayEntryView(self, gid))
+    async def _resolve_guild(self, guild_id: int) -> Optional[discord.Guild]:
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            try:
+                guild = await self.bot.fetch_guild(guild_id)
+            except Exception:
+                return None
+        return guild
 
-            now = unix_now()
-            cursor.execute(
-                "SELECT * FROM giveaways WHERE status = 'running' AND end_time <= ?",
-                (now,),
+    async def _reconcile(self) -> Tuple[int, int]:
+        """
+        End overdue giveaways and announce ended ones that never got winners.
+        Only actionable rows are selected, each guild is resolved once, and rows
+        are handled concurrently, at most reconcile_concurrency at a time.
+        Returns (overdue ended, late announcements).
+        """
+        cursor.execute(
+            "SELECT * FROM giveaways WHERE status = 'running' AND end_time <= ?",
+            (unix_now(),),
+        )
+        overdue = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT g.* FROM giveaways g
+            LEFT JOIN giveaway_winners w
+                ON w.giveaway_id = g.giveaway_id AND w.is_reroll = 0
+            WHERE g.status = 'ended' AND w.id IS NULL
+            """
+        )
+        unannounced = cursor.fetchall()
+        metrics.set_gauge("giveaways.reconcile_actionable", len(overdue) + len(unannounced))
+        if not overdue and not unannounced:
+            return 0, 0
+
+        semaphore = asyncio.Semaphore(self.reconcile_concurrency)
+
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+
+        guild_ids = sorted({r["guild_id"] for r in overdue} | {r["guild_id"] for r in unannounced})
+        resolved = await asyncio.gather(*(bounded(self._resolve_guild(g)) for g in guild_ids))
+        guilds = {gid: guild for gid, guild in zip(guild_ids, resolved) if guild is not None}
+
+        ended = await asyncio.gather(
+            *(
+                bounded(self._end_if_overdue(guilds[r["guild_id"]], r))
+                for r in overdue
+                if r["guild_id"] in guilds
             )
-            overdue = cursor.fetchall()
-            for row in overdue:
-                guild = self.bot.get_guild(row["guild_id"])
-                if guild is None:
-                    try:
-                        guild = await self.bot.fetch_guild(row["guild_id"])
-                    except Exception:
-                        continue
-                await self._end_if_overdue(guild, row)
+        )
+        announced = await asyncio.gather(
+            *(
+                bounded(self._announce_if_missing(guilds[r["guild_id"]], r))
+                for r in unannounced
+                if r["guild_id"] in guilds
+            )
+        )
+        return sum(ended), sum(announced)
 
-            cursor.execute("SELECT * FROM giveaways WHERE status = 'ended'")
-            ended = cursor.fetchall()
-            for row in ended:
-                if self._has_original_winners(row["giveaway_id"]):
-                    continue
-                guild = self.bot.get_guild(row["guild_id"])
-                if guild is None:
-                    try:
-                        guild = await self.bot.fetch_guild(row["guild_id"])
-                    except Exception:
-                        continue
-                await self._announce_if_missing(guild, row)
+    async def _archive_backlog(self) -> int:
+        """Archive ended giveaways that still have live entry rows (drawn before archiving, or while it was off)."""
+        if not self.archive_entries:
+            return 0
+        cursor.execute(
+            """
+            SELECT giveaway_id FROM giveaways g
+            WHERE status = 'ended' AND winners_drawn = 1
+              AND EXISTS (SELECT 1 FROM giveaway_entries e WHERE e.giveaway_id = g.giveaway_id)
+            """
+        )
+        archived = 0
+        for (giveaway_id,) in cursor.fetchall():
+            if await self._archive_finished(giveaway_id):
+                archived += 1
+        return archived
+
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        if self._reconcile_lock.locked():
+            # on_ready fires again after a reconnect; one pass at a time is enough.
+            return
+        try:
+            async with self._reconcile_lock:
+                started = time.perf_counter()
+                ended, announced = await self._reconcile()
+                archived = await self._archive_backlog()
+                elapsed = time.perf_counter() - started
+                metrics.observe("giveaways.reconcile", elapsed)
 
             logging.info(
-                "\033[96mGiveaways\033[0m cog synced. Persistent views restored for %d giveaways. Overdue processed: %d.",
-                len(ids),
-                len(overdue),
+                "\033[96mGiveaways\033[0m cog synced. Overdue processed: %d, late announcements: %d, archived: %d (%.0f ms).",
+                ended,
+                announced,
+                archived,
+                elapsed * 1000,
             )
             audit_log(
-                f"Giveaways cog ready. Restored {len(ids)} persistent views. Processed {len(overdue)} overdue giveaways."
+                f"Giveaways cog ready. Processed {ended} overdue giveaways, "
+                f"{announced} late announcements and archived {archived} giveaways in {elapsed * 1000:.0f} ms."
             )
         except Exception as e:
-            logging.error(f"Error restoring giveaway views on_ready: {e}")
-            audit_log(f"Error restoring giveaway views: {e}")
+            logging.error(f"Error processing giveaways on_ready: {e}")
+            audit_log(f"Error processing giveaways on ready: {e}")
 
 
 async def setup(bot: commands.Bot) -> None:
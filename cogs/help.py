@@ -5,6 +5,8 @@ from discord.ext import commands
 import datetime
 from typing import Optional, List, Tuple
 
+from utils.paginator import LazyPagedView
+
 # Discord embed limits
 EMBED_TOTAL_CHAR_LIMIT = 6000
 EMBED_DESCRIPTION_LIMIT = 4096
@@ -126,80 +128,6 @@ def can_user_run_command(
     return True
 
 
-class PagedView(discord.ui.View):
-    """Button view that paginates through a list of embeds. Restricted to the requesting user."""
-
-    def __init__(
-        self, user_id: int, pages: List[discord.Embed], timeout: Optional[float] = 120
-    ):
-        super().__init__(timeout=timeout)
-        self.user_id = user_id
-        self.pages = pages
-        self.index = 0
-        self._update_button_states()
-
-    def _update_button_states(self):
-        for child in self.children:
-            if isinstance(child, discord.ui.Button):
-                if child.custom_id == "first":
-                    child.disabled = self.index == 0
-                elif child.custom_id == "prev":
-                    child.disabled = self.index == 0
-                elif child.custom_id == "next":
-                    child.disabled = self.index >= len(self.pages) - 1
-                elif child.custom_id == "last":
-                    child.disabled = self.index >= len(self.pages) - 1
-
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message(
-                "Only the requester can use these buttons.", ephemeral=True
-            )
-            return False
-        return True
-
-    async def _show(self, interaction: discord.Interaction):
-        self._update_button_states()
-        try:
-            await interaction.response.edit_message(
-                embed=self.pages[self.index], view=self
-            )
-        except discord.InteractionResponded:
-            await interaction.edit_original_response(
-                embed=self.pages[self.index], view=self
-            )
-
-    @discord.ui.button(
-        label="⏮ First", style=discord.ButtonStyle.secondary, custom_id="first"
-    )
-    async def first(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.index = 0
-        await self._show(interaction)
-
-    @discord.ui.button(
-        label="◀ Previous", style=discord.ButtonStyle.secondary, custom_id="prev"
-    )
-    async def prev(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.index > 0:
-            self.index -= 1
-        await self._show(interaction)
-
-    @discord.ui.button(
-        label="Next ▶", style=discord.ButtonStyle.secondary, custom_id="next"
-    )
-    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.index < len(self.pages) - 1:
-            self.index += 1
-        await self._show(interaction)
-
-    @discord.ui.button(
-        label="Last ⏭", style=discord.ButtonStyle.secondary, custom_id="last"
-    )
-    async def last(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.index = len(self.pages) - 1
-        await self._show(interaction)
-
-
 class Help(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -389,9 +317,8 @@ class Help(commands.Cog):
                     return
 
                 pages = self.build_command_list_pages(cmds)
-                view = PagedView(interaction.user.id, pages)
-                await interaction.response.send_message(
-                    embed=pages[0], view=view, ephemeral=True
+                await LazyPagedView.from_pages(interaction.user.id, pages).send(
+                    interaction
                 )
                 audit_log(
                     f"{interaction.user.name} (ID: {interaction.user.id}) requested a filtered list of commands."
@@ -407,9 +334,8 @@ class Help(commands.Cog):
 
             if found_command and can_user_run_command(interaction, found_command):
                 pages = self.build_detailed_command_pages(found_command)
-                view = PagedView(interaction.user.id, pages)
-                await interaction.response.send_message(
-                    embed=pages[0], view=view, ephemeral=True
+                await LazyPagedView.from_pages(interaction.user.id, pages).send(
+                    interaction
                 )
                 audit_log(
                     f"{interaction.user.name} (ID: {interaction.user.id}) requested detailed help for /{found_command.name}."
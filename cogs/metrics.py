@@ -0,0 +1,111 @@
+import discord
+import logging
+import yaml
+from discord import app_commands
+from discord.ext import commands
+import datetime
+from typing import Dict, List
+
+from utils.metrics import metrics
+
+EMBED_TOTAL_CHAR_LIMIT = 6000
+EMBED_FIELD_VALUE_LIMIT = 1024
+EMBED_MAX_FIELDS = 25
+
+
+def audit_log(message: str):
+    """Append a timestamped message to the audit log file."""
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with open("audit.log", "a", encoding="utf-8") as f:
+        f.write(f"[{timestamp}] {message}\n")
+
+
+def _format_number(value: float) -> str:
+    if isinstance(value, float) and not value.is_integer():
+        return f"{value:.3f}"
+    return str(int(value))
+
+
+class Metrics(commands.Cog):
+    """Exposes the in-process metrics registry to the bot owners."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        try:
+            with open("config.yaml", "r", encoding="utf-8") as config_file:
+                self.config = yaml.safe_load(config_file) or {}
+        except Exception:
+            self.config = {}
+        self.owner_ids = set(self.config.get("owner_ids", []) or [])
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        logging.info("\033[96mMetrics\033[0m cog synced successfully.")
+        audit_log("Metrics cog synced successfully.")
+
+    def _group_lines(self, snapshot: Dict) -> Dict[str, List[str]]:
+        """Group every metric under its prefix (the part before the first dot)."""
+        groups: Dict[str, List[str]] = {}
+        recent = snapshot["recent_counters"]
+        window = snapshot["rate_window"]
+        for name, value in sorted(snapshot["counters"].items()):
+            groups.setdefault(name.split(".", 1)[0], []).append(
+                f"`{name}`: {value} ({recent.get(name, 0)} in last {window}s)"
+            )
+        for name, value in sorted(snapshot["gauges"].items()):
+            groups.setdefault(name.split(".", 1)[0], []).append(
+                f"`{name}`: {_format_number(value)}"
+            )
+        for name, t in sorted(snapshot["timings"].items()):
+            avg = t["total"] / t["count"] if t["count"] else 0.0
+            groups.setdefault(name.split(".", 1)[0], []).append(
+                f"`{name}`: n={t['count']} avg={avg * 1000:.1f}ms "
+                f"last={t['last'] * 1000:.1f}ms max={t['max'] * 1000:.1f}ms"
+            )
+        return groups
+
+    @app_commands.command(
+        name="metrics", description="Show internal bot metrics (owner only)."
+    )
+    async def show_metrics(self, interaction: discord.Interaction):
+        if interaction.user.id not in self.owner_ids:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Error",
+                    description="Only the bot owners can view metrics.",
+                    color=discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        snapshot = metrics.snapshot()
+        uptime = int(snapshot["uptime"])
+        embed = discord.Embed(
+            title="Bot Metrics",
+            description=f"Collected over the last `{uptime // 3600}h {(uptime % 3600) // 60}m`.",
+            color=discord.Color.blurple(),
+        )
+        groups = self._group_lines(snapshot)
+        if not groups:
+            embed.description += "\nNo metrics recorded yet."
+        total_chars = len(embed.title) + len(embed.description)
+        for prefix, lines in list(groups.items())[:EMBED_MAX_FIELDS]:
+            value = ""
+            for line in lines:
+                if len(value) + len(line) + 1 > EMBED_FIELD_VALUE_LIMIT:
+                    break
+                value += line + "\n"
+            if total_chars + len(prefix) + len(value) > EMBED_TOTAL_CHAR_LIMIT:
+                break
+            total_chars += len(prefix) + len(value)
+            embed.add_field(name=prefix, value=value or "-", inline=False)
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        audit_log(
+            f"{interaction.user.name} (ID: {interaction.user.id}) viewed bot metrics."
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Metrics(bot))
@@ -0,0 +1,179 @@
+import discord
+import logging
+import time
+import yaml
+from discord import app_commands
+from discord.ext import commands
+import datetime
+from typing import Dict, Any, List
+
+from utils.metrics import metrics
+
+
+def audit_log(message: str):
+    """Append a timestamped message to the audit log file."""
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        with open("audit.log", "a", encoding="utf-8") as f:
+            f.write(f"[{timestamp}] {message}\n")
+    except Exception as e:
+        logging.error(f"Failed to write to audit.log: {e}")
+
+
+class Reload(commands.Cog):
+    """
+    Reloads a single extension in place without restarting the bot.
+
+    Cogs that hold in-memory state can opt in to a handoff by defining:
+      - export_state(self) -> dict: called on the old instance before it is unloaded.
+        It should also stop any background work still bound to the old instance.
+      - import_state(self, state: dict) -> None: called on the new instance once loaded.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        try:
+            with open("config.yaml", "r", encoding="utf-8") as config_file:
+                self.config = yaml.safe_load(config_file) or {}
+        except Exception:
+            self.config = {}
+        self.owner_ids = set(self.config.get("owner_ids", []) or [])
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        logging.info("\033[96mReload\033[0m cog synced successfully.")
+        audit_log("Reload cog synced successfully.")
+
+    def _cogs_for_extension(self, extension: str) -> List[commands.Cog]:
+        return [cog for cog in self.bot.cogs.values() if cog.__module__ == extension]
+
+    async def reload_with_handoff(self, extension: str) -> List[str]:
+        """
+        Reload one extension and hand state from the old cog instances to the new ones.
+        Returns the names of the cogs that received state. Raises on reload failure.
+        """
+        states: Dict[str, Dict[str, Any]] = {}
+        for cog in self._cogs_for_extension(extension):
+            exporter = getattr(cog, "export_state", None)
+            if callable(exporter):
+                try:
+                    states[cog.qualified_name] = exporter()
+                except Exception as e:
+                    logging.error(
+                        f"Reload: failed to export state from {cog.qualified_name}: {e}"
+                    )
+
+        handed_over: List[str] = []
+        try:
+            await self.bot.reload_extension(extension)
+        finally:
+            # On failure discord.py rolls back to the previous module, so whichever
+            # instance is loaded now still gets the state back.
+            for cog_name, state in states.items():
+                new_cog = self.bot.get_cog(cog_name)
+                importer = getattr(new_cog, "import_state", None)
+                if not callable(importer):
+                    continue
+                try:
+                    importer(state)
+                    handed_over.append(cog_name)
+                except Exception as e:
+                    logging.error(
+                        f"Reload: failed to import state into {cog_name}: {e}"
+                    )
+        return handed_over
+
+    async def extension_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> List[app_commands.Choice[str]]:
+        names = sorted(ext.split(".", 1)[-1] for ext in self.bot.extensions)
+        return [
+            app_commands.Choice(name=n, value=n)
+            for n in names
+            if current.lower() in n.lower()
+        ][:25]
+
+    @app_commands.command(
+        name="reload",
+        description="Reload one cog in place, keeping its in-memory state (owner only).",
+    )
+    @app_commands.describe(
+        extension="The cog file to reload, e.g. StickyMessages or giveaways.",
+        sync="Also re-sync slash commands (only needed if command signatures changed).",
+    )
+    @app_commands.autocomplete(extension=extension_autocomplete)
+    async def reload(
+        self, interaction: discord.Interaction, extension: str, sync: bool = False
+    ):
+        if interaction.user.id not in self.owner_ids:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Error",
+                    description="Only the bot owners can reload cogs.",
+                    color=discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            audit_log(
+                f"{interaction.user.name} (ID: {interaction.user.id}) attempted /reload {extension} without permission."
+            )
+            return
+
+        qualified = extension if extension.startswith("cogs.") else f"cogs.{extension}"
+        if qualified not in self.bot.extensions:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Error",
+                    description=f"`{extension}` is not a loaded extension.",
+                    color=discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        started = time.perf_counter()
+        try:
+            handed_over = await self.reload_with_handoff(qualified)
+            if sync:
+                await self.bot.tree.sync()
+        except Exception as e:
+            metrics.incr("reload.failures")
+            logging.error(f"Failed to reload {qualified}: {e}")
+            audit_log(
+                f"{interaction.user.name} (ID: {interaction.user.id}) failed to reload {qualified}: {e}"
+            )
+            await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Reload Failed",
+                    description=f"`{qualified}` could not be reloaded:\n`{e}`",
+                    color=discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        elapsed = time.perf_counter() - started
+        metrics.incr("reload.runs")
+        metrics.observe("reload.duration", elapsed)
+        state_line = (
+            f"State handed over for: {', '.join(handed_over)}."
+            if handed_over
+            else "No state handoff was needed."
+        )
+        await interaction.followup.send(
+            embed=discord.Embed(
+                title="Reloaded",
+                description=f"`{qualified}` reloaded in `{elapsed:.2f}s`.\n{state_line}",
+                color=discord.Color.green(),
+            ),
+            ephemeral=True,
+        )
+        logging.info(f"Reloaded {qualified} in {elapsed:.2f}s. {state_line}")
+        audit_log(
+            f"{interaction.user.name} (ID: {interaction.user.id}) reloaded {qualified} in {elapsed:.2f}s. {state_line}"
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Reload(bot))
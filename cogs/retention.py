@@ -0,0 +1,364 @@
+import discord
+import logging
+import sqlite3
+import asyncio
+import time
+import yaml
+from discord import app_commands
+from discord.ext import commands, tasks
+import datetime
+from typing import Dict, List, Tuple
+
+from utils.cache import response_cache
+from utils.metrics import metrics
+
+DATABASE_PATH = "database.db"
+
+# Tables keyed by giveaway_id that are pruned together with their giveaway.
+GIVEAWAY_CHILD_TABLES = (
+    "giveaway_winners",
+    "giveaway_entries",
+    "giveaway_entry_summaries",
+    "giveaway_archive",
+    "giveaway_entry_buckets",
+)
+
+
+def audit_log(message: str):
+    """Append a timestamped message to the audit log file."""
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        with open("audit.log", "a", encoding="utf-8") as f:
+            f.write(f"[{timestamp}] {message}\n")
+    except Exception as e:
+        logging.error(f"Failed to write to audit.log: {e}")
+
+
+def unix_now() -> int:
+    return int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+
+
+class Retention(commands.Cog):
+    """
+    Enforces per-table retention policies so database.db stops growing forever.
+
+    Old rows are deleted in small autocommitted batches on a worker thread so no
+    single delete holds the write lock for long, then free pages are handed back
+    with PRAGMA incremental_vacuum. A policy set to 0 days is disabled.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        try:
+            with open("config.yaml", "r", encoding="utf-8") as config_file:
+                self.config = yaml.safe_load(config_file) or {}
+        except Exception as e:
+            logging.warning(
+                f"Retention: failed to load config.yaml, using defaults. {e}"
+            )
+            self.config = {}
+
+        cfg = self.config.get("retention", {}) or {}
+        self.enabled: bool = bool(cfg.get("enabled", True))
+        self.interval_minutes: float = float(cfg.get("interval_minutes", 720))
+        self.batch_size: int = max(1, int(cfg.get("batch_size", 500)))
+        self.batch_pause: float = float(cfg.get("batch_pause", 0.05))
+        # Entries of finished giveaways are summarised, then deleted this many days after the end.
+        self.entries_days: int = int(cfg.get("entries_days", 30))
+        # Cancelled giveaways are deleted outright after this many days.
+        self.cancelled_days: int = int(cfg.get("cancelled_days", 30))
+        # Ended giveaways and their winners are deleted after this many days.
+        self.ended_days: int = int(cfg.get("ended_days", 365))
+        # Upper bound on free pages returned to the filesystem per run.
+        self.vacuum_pages: int = max(0, int(cfg.get("vacuum_pages", 2000)))
+        # Let scheduled runs switch the database to incremental auto-vacuum. The switch
+        # is one full VACUUM that locks the database, so by default it only happens
+        # when an owner asks for it with /retention_run convert_auto_vacuum:True.
+        self.convert_auto_vacuum: bool = bool(cfg.get("convert_auto_vacuum", False))
+        self.prune_stickies: bool = bool(cfg.get("stale_stickies", True))
+        self.owner_ids = set(self.config.get("owner_ids", []) or [])
+
+        self._run_lock = asyncio.Lock()
+
+        if self.enabled:
+            self.retention_loop.change_interval(minutes=self.interval_minutes)
+            self.retention_loop.start()
+
+    def cog_unload(self):
+        try:
+            self.retention_loop.cancel()
+        except Exception:
+            pass
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        logging.info("\033[96mRetention\033[0m cog synced successfully.")
+        audit_log("Retention cog synced successfully.")
+
+    # -----------------------
+    # Database work (worker thread)
+    # -----------------------
+
+    @staticmethod
+    def _connect() -> sqlite3.Connection:
+        # Autocommit: every batch is its own short transaction.
+        conn = sqlite3.connect(DATABASE_PATH, timeout=10, isolation_level=None)
+        return conn
+
+    @staticmethod
+    def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        return row is not None
+
+    def _delete_in_batches(
+        self, conn: sqlite3.Connection, table: str, where: str, params: Tuple
+    ) -> int:
+        """Delete rows matching `where` at most batch_size at a time. Returns rows deleted."""
+        deleted = 0
+        sql = (
+            f"DELETE FROM {table} WHERE rowid IN "
+            f"(SELECT rowid FROM {table} WHERE {where} LIMIT ?)"
+        )
+        while True:
+            cur = conn.execute(sql, (*params, self.batch_size))
+            deleted += cur.rowcount
+            if cur.rowcount < self.batch_size:
+                break
+            if self.batch_pause > 0:
+                time.sleep(self.batch_pause)
+        return deleted
+
+    def _prune_giveaways(self, conn: sqlite3.Connection, now: int) -> Dict[str, int]:
+        report: Dict[str, int] = {}
+        if not self._table_exists(conn, "giveaways"):
+            return report
+
+        # Child tables are created by the giveaways cog as features are added, so an
+        # older database may not have all of them yet.
+        children = [t for t in GIVEAWAY_CHILD_TABLES if self._table_exists(conn, t)]
+
+        # Winners must already be drawn before an ended giveaway's entries can go.
+        finished = "(status = 'cancelled' OR (status = 'ended' AND winners_drawn = 1))"
+
+        if self.entries_days > 0 and {"giveaway_entries", "giveaway_entry_summaries"} <= set(children):
+            cutoff = now - self.entries_days * 86400
+            # Keep the headline numbers before the per-user rows are removed.
+            conn.execute(
+                f"""
+                INSERT OR IGNORE INTO giveaway_entry_summaries
+                    (giveaway_id, unique_entrants, total_entries, first_entry_at, last_entry_at, summarised_at)
+                SELECT giveaway_id, COUNT(*), COALESCE(SUM(entries), 0), MIN(entered_at), MAX(entered_at), ?
+                FROM giveaway_entries
+                WHERE giveaway_id IN (SELECT giveaway_id FROM giveaways WHERE end_time <= ? AND {finished})
+                GROUP BY giveaway_id
+                """,
+                (now, cutoff),
+            )
+            report["giveaway_entries"] = self._delete_in_batches(
+                conn,
+                "giveaway_entries",
+                "giveaway_id IN (SELECT giveaway_id FROM giveaway_entry_summaries) "
+                f"AND giveaway_id IN (SELECT giveaway_id FROM giveaways WHERE end_time <= ? AND {finished})",
+                (cutoff,),
+            )
+
+        expired: List[Tuple[str, int]] = []
+        if self.cancelled_days > 0:
+            expired.append(("status = 'cancelled'", now - self.cancelled_days * 86400))
+        if self.ended_days > 0:
+            expired.append(
+                ("status = 'ended' AND winners_drawn = 1", now - self.ended_days * 86400)
+            )
+
+        for condition, cutoff in expired:
+            parent = f"SELECT giveaway_id FROM giveaways WHERE {condition} AND end_time <= ?"
+            for child in children:
+                report[child] = report.get(child, 0) + self._delete_in_batches(
+                    conn, child, f"giveaway_id IN ({parent})", (cutoff,)
+                )
+            report["giveaways"] = report.get("giveaways", 0) + self._delete_in_batches(
+                conn, "giveaways", f"{condition} AND end_time <= ?", (cutoff,)
+            )
+
+        # Orphans left behind by manual deletes (foreign keys are not enforced).
+        for child in children:
+            report[child] = report.get(child, 0) + self._delete_in_batches(
+                conn,
+                child,
+                "giveaway_id NOT IN (SELECT giveaway_id FROM giveaways)",
+                (),
+            )
+        return report
+
+    def _incremental_vacuum(self, conn: sqlite3.Connection, convert: bool) -> int:
+        """Return free pages to the filesystem. Returns the number of pages reclaimed."""
+        mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if mode != 2:
+            if not convert:
+                return 0
+            # One-off conversion; incremental_vacuum is a no-op until this has run.
+            logging.info("Retention: converting database to incremental auto-vacuum.")
+            audit_log("Retention: converting database to incremental auto-vacuum (one-off VACUUM).")
+            before = conn.execute("PRAGMA page_count").fetchone()[0]
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            after = conn.execute("PRAGMA page_count").fetchone()[0]
+            return max(0, before - after)
+
+        if self.vacuum_pages <= 0:
+            return 0
+        before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        # incremental_vacuum frees one page per step, so the statement must be drained.
+        conn.execute(f"PRAGMA incremental_vacuum({self.vacuum_pages})").fetchall()
+        after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return max(0, before - after)
+
+    def _run_db_policies(
+        self, stale_sticky_ids: List[int], convert_auto_vacuum: bool
+    ) -> Dict[str, int]:
+        conn = self._connect()
+        try:
+            now = unix_now()
+            report = self._prune_giveaways(conn, now)
+            if stale_sticky_ids and self._table_exists(conn, "sticky_messages"):
+                placeholders = ",".join("?" for _ in stale_sticky_ids)
+                report["sticky_messages"] = self._delete_in_batches(
+                    conn,
+                    "sticky_messages",
+                    f"channel_id IN ({placeholders})",
+                    tuple(stale_sticky_ids),
+                )
+            if stale_sticky_ids and self._table_exists(conn, "sticky_ledger"):
+                placeholders = ",".join("?" for _ in stale_sticky_ids)
+                report["sticky_ledger"] = self._delete_in_batches(
+                    conn,
+                    "sticky_ledger",
+                    f"channel_id IN ({placeholders})",
+                    tuple(stale_sticky_ids),
+                )
+            report["reclaimed_pages"] = self._incremental_vacuum(
+                conn, convert_auto_vacuum
+            )
+            report["page_count"] = conn.execute("PRAGMA page_count").fetchone()[0]
+            return report
+        finally:
+            conn.close()
+
+    # -----------------------
+    # Orchestration
+    # -----------------------
+
+    async def _find_stale_sticky_channels(self) -> List[int]:
+        """Sticky rows whose channel Discord reports as deleted."""
+        if not self.prune_stickies:
+            return []
+        sticky_cog = self.bot.get_cog("StickyMessages")
+        if sticky_cog is None:
+            return []
+        stale: List[int] = []
+        for channel_id in list(sticky_cog.stickies.keys()):
+            if self.bot.get_channel(int(channel_id)) is not None:
+                continue
+            try:
+                await self.bot.fetch_channel(int(channel_id))
+            except discord.NotFound:
+                stale.append(int(channel_id))
+            except Exception:
+                # Forbidden or transient errors: keep the row.
+                continue
+        # Drop them from the live cache so the sticky cog stops tracking them.
+        for channel_id in stale:
+            sticky_cog.stickies.pop(channel_id, None)
+        return stale
+
+    async def run_retention(self, convert_auto_vacuum: bool = False) -> Dict[str, int]:
+        async with self._run_lock:
+            started = time.perf_counter()
+            stale_stickies = await self._find_stale_sticky_channels()
+            try:
+                report = await asyncio.to_thread(
+                    self._run_db_policies,
+                    stale_stickies,
+                    convert_auto_vacuum or self.convert_auto_vacuum,
+                )
+            except Exception as e:
+                metrics.incr("retention.failures")
+                logging.error(f"Retention run failed: {e}")
+                audit_log(f"Retention run failed: {e}")
+                return {}
+            # Pruned giveaways and entries may still be cached by /giveaway_info and /giveaway_list.
+            response_cache.invalidate("giveaway_info")
+            response_cache.invalidate("giveaway_list")
+
+            elapsed = time.perf_counter() - started
+            metrics.incr("retention.runs")
+            metrics.observe("retention.duration", elapsed)
+            for key, value in report.items():
+                if key == "page_count":
+                    metrics.set_gauge("retention.page_count", value)
+                else:
+                    metrics.incr(f"retention.{key}", value)
+            summary = ", ".join(f"{k}={v}" for k, v in sorted(report.items()))
+            logging.info(f"Retention run finished in {elapsed:.2f}s: {summary}")
+            audit_log(f"Retention run finished in {elapsed:.2f}s: {summary}")
+            return report
+
+    @tasks.loop(minutes=720)
+    async def retention_loop(self):
+        await self.run_retention()
+
+    @retention_loop.before_loop
+    async def before_retention_loop(self):
+        await self.bot.wait_until_ready()
+
+    # -----------------------
+    # Commands
+    # -----------------------
+
+    @app_commands.command(
+        name="retention_run",
+        description="Prune old data and reclaim database space now (owner only).",
+    )
+    @app_commands.describe(
+        convert_auto_vacuum="Also switch the database to incremental auto-vacuum (one full VACUUM, locks the database while it runs)."
+    )
+    async def retention_run(
+        self, interaction: discord.Interaction, convert_auto_vacuum: bool = False
+    ):
+        if interaction.user.id not in self.owner_ids:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Error",
+                    description="Only the bot owners can run data retention.",
+                    color=discord.Color.red(),
+                ),
+                ephemeral=True,
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        report = await self.run_retention(convert_auto_vacuum)
+        if report:
+            lines = [f"• **{k}:** {v}" for k, v in sorted(report.items())]
+            embed = discord.Embed(
+                title="Retention Complete",
+                description="\n".join(lines),
+                color=discord.Color.green(),
+            )
+        else:
+            embed = discord.Embed(
+                title="Retention Failed",
+                description="The retention run could not be completed. Check the logs for details.",
+                color=discord.Color.red(),
+            )
+        await interaction.followup.send(embed=embed, ephemeral=True)
+        audit_log(
+            f"{interaction.user.name} (ID: {interaction.user.id}) invoked /retention_run"
+            f"{' with convert_auto_vacuum' if convert_auto_vacuum else ''}."
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Retention(bot))
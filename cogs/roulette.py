@@ -8,6 +8,8 @@ from discord.ext import commands
 from discord import app_commands
 import datetime
 
+from utils.cache import response_cache
+
 # Database setup – now with a guild_id column to separate stats per server.
 conn = sqlite3.connect("database.db", check_same_thread=False)
 cursor = conn.cursor()
@@ -171,8 +173,10 @@ class Roulette(commands.Cog):
             f"{interaction.user.name} (ID: {interaction.user.id}) viewed their roulette stats."
         )
 
-    async def leaderboard_callback(self, interaction: discord.Interaction):
-        guild_id = interaction.guild.id
+    def _leaderboard_embed(self, guild_id: int) -> discord.Embed:
+        cached = response_cache.get("roulette_leaderboard", guild_id)
+        if cached is not None:
+            return discord.Embed.from_dict(cached)
         cursor.execute(
             "SELECT user_id, username, wins, plays FROM roulette_players WHERE guild_id = ? ORDER BY wins DESC LIMIT 10",
             (guild_id,),
@@ -196,6 +200,11 @@ class Roulette(commands.Cog):
                 description="No players found.",
                 color=discord.Color.red(),
             )
+        response_cache.set("roulette_leaderboard", guild_id, embed.to_dict())
+        return embed
+
+    async def leaderboard_callback(self, interaction: discord.Interaction):
+        embed = self._leaderboard_embed(interaction.guild.id)
         await interaction.response.send_message(embed=embed)
         audit_log(
             f"{interaction.user.name} (ID: {interaction.user.id}) viewed the roulette leaderboard."
@@ -323,29 +332,7 @@ class Roulette(commands.Cog):
             f"{actor.name} (ID: {actor.id}) invoked /roulette_leaderboard in guild '{interaction.guild.name}' (ID: {guild_id})."
         )
         try:
-            cursor.execute(
-                "SELECT user_id, username, wins, plays FROM roulette_players WHERE guild_id = ? ORDER BY wins DESC LIMIT 10",
-                (guild_id,),
-            )
-            results = cursor.fetchall()
-            if results:
-                description = ""
-                for idx, (user_id, username, wins, plays) in enumerate(
-                    results, start=1
-                ):
-                    win_rate = (wins / plays) * 100 if plays > 0 else 0
-                    description += f"**{idx}. {username}** - Wins: {wins}, Win Rate: {win_rate:.1f}%\n"
-                embed = discord.Embed(
-                    title="🏅 Roulette Leaderboard 🏅",
-                    description=description,
-                    color=discord.Color.blurple(),
-                )
-            else:
-                embed = discord.Embed(
-                    title="Error",
-                    description="No players found.",
-                    color=discord.Color.red(),
-                )
+            embed = self._leaderboard_embed(guild_id)
             await interaction.response.send_message(embed=embed)
         except Exception as e:
             logging.error(f"Discord API Error. Error in leaderboard: {e}")
@@ -388,6 +375,7 @@ class Roulette(commands.Cog):
                 (guild_id, target.id, target.display_name, wins, losses, streak, plays),
             )
             conn.commit()
+            self._invalidate_cached(guild_id)
             embed = discord.Embed(
                 title="✅ Stats Updated",
                 description=(
@@ -418,64 +406,7 @@ class Roulette(commands.Cog):
     async def server_stats(self, interaction: discord.Interaction):
         try:
             guild_id = interaction.guild.id
-            cursor.execute(
-                "SELECT SUM(wins), SUM(losses), SUM(plays) FROM roulette_players WHERE guild_id = ?",
-                (guild_id,),
-            )
-            result = cursor.fetchone()
-            total_wins, total_losses, total_plays = result if result else (0, 0, 0)
-            cursor.execute(
-                "SELECT COUNT(*) FROM roulette_players WHERE guild_id = ?", (guild_id,)
-            )
-            total_players = cursor.fetchone()[0]
-
-            if total_plays == 0:
-                embed = discord.Embed(
-                    title="Server Roulette Statistics",
-                    description="No data available yet for this server. Start playing to generate statistics!",
-                    color=discord.Color.red(),
-                )
-                await interaction.response.send_message(embed=embed)
-                return
-
-            mystery_outcomes = total_plays - (total_wins + total_losses)
-            win_prob = total_wins / total_plays
-            loss_prob = total_losses / total_plays
-            mystery_prob = mystery_outcomes / total_plays
-
-            future_plays = 1000
-            projected_wins = win_prob * future_plays
-            projected_losses = loss_prob * future_plays
-            projected_mystery = mystery_prob * future_plays
-
-            embed = discord.Embed(
-                title="🏰 Server Roulette Statistics 🏰",
-                color=discord.Color.blurple(),
-            )
-            embed.add_field(name="Total Plays", value=total_plays, inline=False)
-            embed.add_field(name="Total Wins", value=total_wins, inline=True)
-            embed.add_field(name="Total Losses", value=total_losses, inline=True)
-            embed.add_field(
-                name="Total Mystery Outcomes", value=mystery_outcomes, inline=True
-            )
-            embed.add_field(name="Total Players", value=total_players, inline=False)
-            embed.add_field(
-                name="Outcome Probabilities",
-                value=(
-                    f"Win: {win_prob*100:.1f}%\nLoss: {loss_prob*100:.1f}%\nMystery: {mystery_prob*100:.1f}%"
-                ),
-                inline=False,
-            )
-            embed.add_field(
-                name="Projections (Next 1,000 Plays)",
-                value=(
-                    f"Projected Wins: {projected_wins:.0f}\nProjected Losses: {projected_losses:.0f}\nProjected Mystery: {projected_mystery:.0f}"
-                ),
-                inline=False,
-            )
-            embed.set_footer(
-                text="These projections are based on the current outcome probabilities in this server."
-            )
+            embed = self._server_stats_embed(guild_id)
             await interaction.response.send_message(embed=embed)
             audit_log(
                 f"{interaction.user.name} (ID: {interaction.user.id}) viewed server-specific roulette statistics in guild ID {guild_id}."
@@ -492,6 +423,75 @@ class Roulette(commands.Cog):
             )
             await interaction.response.send_message(embed=error_embed)
 
+    def _server_stats_embed(self, guild_id: int) -> discord.Embed:
+        cached = response_cache.get("roulette_server_stats", guild_id)
+        if cached is not None:
+            return discord.Embed.from_dict(cached)
+        cursor.execute(
+            "SELECT SUM(wins), SUM(losses), SUM(plays) FROM roulette_players WHERE guild_id = ?",
+            (guild_id,),
+        )
+        result = cursor.fetchone()
+        total_wins, total_losses, total_plays = result if result else (0, 0, 0)
+        cursor.execute(
+            "SELECT COUNT(*) FROM roulette_players WHERE guild_id = ?", (guild_id,)
+        )
+        total_players = cursor.fetchone()[0]
+
+        if total_plays == 0:
+            embed = discord.Embed(
+                title="Server Roulette Statistics",
+                description="No data available yet for this server. Start playing to generate statistics!",
+                color=discord.Color.red(),
+            )
+            response_cache.set("roulette_server_stats", guild_id, embed.to_dict())
+            return embed
+
+        mystery_outcomes = total_plays - (total_wins + total_losses)
+        win_prob = total_wins / total_plays
+        loss_prob = total_losses / total_plays
+        mystery_prob = mystery_outcomes / total_plays
+
+        future_plays = 1000
+        projected_wins = win_prob * future_plays
+        projected_losses = loss_prob * future_plays
+        projected_mystery = mystery_prob * future_plays
+
+        embed = discord.Embed(
+            title="🏰 Server Roulette Statistics 🏰",
+            color=discord.Color.blurple(),
+        )
+        embed.add_field(name="Total Plays", value=total_plays, inline=False)
+        embed.add_field(name="Total Wins", value=total_wins, inline=True)
+        embed.add_field(name="Total Losses", value=total_losses, inline=True)
+        embed.add_field(
+            name="Total Mystery Outcomes", value=mystery_outcomes, inline=True
+        )
+        embed.add_field(name="Total Players", value=total_players, inline=False)
+        embed.add_field(
+            name="Outcome Probabilities",
+            value=(
+                f"Win: {win_prob*100:.1f}%\nLoss: {loss_prob*100:.1f}%\nMystery: {mystery_prob*100:.1f}%"
+            ),
+            inline=False,
+        )
+        embed.add_field(
+            name="Projections (Next 1,000 Plays)",
+            value=(
+                f"Projected Wins: {projected_wins:.0f}\nProjected Losses: {projected_losses:.0f}\nProjected Mystery: {projected_mystery:.0f}"
+            ),
+            inline=False,
+        )
+        embed.set_footer(
+            text="These projections are based on the current outcome probabilities in this server."
+        )
+        response_cache.set("roulette_server_stats", guild_id, embed.to_dict())
+        return embed
+
+    def _invalidate_cached(self, guild_id: int) -> None:
+        response_cache.invalidate("roulette_leaderboard", guild_id)
+        response_cache.invalidate("roulette_server_stats", guild_id)
+
     def update_stats(
         self, guild_id: int, user_id: int, outcome: str, username: str
     ) -> None:
@@ -517,6 +517,7 @@ class Roulette(commands.Cog):
                 (guild_id, user_id, username, wins, losses, streak, plays),
             )
             conn.commit()
+            self._invalidate_cached(guild_id)
         except Exception as e:
             logging.error(
                 f"Discord API Error. Error updating stats for user {user_id} in guild {guild_id}: {e}"
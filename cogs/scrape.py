@@ -5,11 +5,11 @@ from discord import app_commands
 from discord.ext import commands
 import asyncio
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
-import requests  # For API requests
 import unicodedata
 import string
 
+from utils.http import acquire_http_client, release_http_client
+
 
 def audit_log(message: str):
     """Append a timestamped message to the audit log file."""
@@ -34,8 +34,13 @@ class Scrape(commands.Cog):
         # Load the config file with UTF-8 encoding.
         with open("config.yaml", "r", encoding="utf-8") as config_file:
             self.config = yaml.safe_load(config_file)
+        # Shared pooled client; released again in cog_unload.
+        self.http = acquire_http_client(self.config)
         audit_log("Scrape cog initialised and configuration loaded successfully.")
 
+    async def cog_unload(self):
+        await release_http_client()
+
     @commands.Cog.listener()
     async def on_ready(self):
         logging.info(f"\033[96mScrape\033[0m cog synced successfully.")
@@ -52,8 +57,7 @@ class Scrape(commands.Cog):
         )
         try:
             audit_log("Starting scraping process via /scrape command.")
-            # Run the scraper asynchronously in a separate thread.
-            new_entries = await asyncio.to_thread(self.run_scraper)
+            new_entries = await self.run_scraper()
             audit_log(
                 f"{interaction.user.name} (ID: {interaction.user.id}) retrieved {len(new_entries)} new entries from the website."
             )
@@ -85,16 +89,15 @@ class Scrape(commands.Cog):
             )
             await self.safe_followup_send(interaction, embed=error_embed)
 
-    def run_scraper(self):
+    async def run_scraper(self):
         logging.info("Running scraper using Seated API...")
         audit_log("Starting scraper: Requesting event data from Seated API.")
         new_entries = []
         try:
             # API endpoint that returns event data (powered by Seated)
             url = "https://cdn.seated.com/api/tour/deb5e9f0-4af5-413c-a24b-1b22f11513b2?include=tour-events"
-            response = requests.get(url)
-            response.raise_for_status()  # Raise an exception for bad responses
-            data = response.json()
+            # Shared client: pooled connections, default timeout and retries.
+            data = await self.http.get_json(url)
             logging.debug(f"Full API response: {data}")  # Debug: log entire response
 
             # Extract events from the "included" array where type is "tour-events"
@@ -167,6 +170,9 @@ class Scrape(commands.Cog):
         - If it's a single date, set the event from 7:00 PM to 11:00 PM.
         - If it's a range, set the start time to 8:00 AM on the first day and the end time to 11:00 PM on the last day.
         """
+        # Deferred: zoneinfo is only needed when an event is actually scheduled.
+        from zoneinfo import ZoneInfo
+
         try:
             tz = ZoneInfo("Europe/London")
             if "-" in formatted_date:
@@ -3,11 +3,11 @@ import logging
 import yaml
 from discord import app_commands
 from discord.ext import commands
-import aiohttp
-import asyncio
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
+from utils.http import HTTPStatusError, acquire_http_client, release_http_client
+
 
 def audit_log(message: str):
     """Append a timestamped message to the audit log file."""
@@ -108,8 +108,14 @@ class TrackDetails(commands.Cog):
             "itunes",
         }
 
+        # Shared pooled client; released again in cog_unload.
+        self.http = acquire_http_client(self.config)
+
         audit_log("TrackDetails cog initialised and configuration loaded successfully.")
 
+    async def cog_unload(self):
+        await release_http_client()
+
     @commands.Cog.listener()
     async def on_ready(self):
         logging.info("\033[96mTrackDetails\033[0m cog synced successfully.")
@@ -128,10 +134,10 @@ class TrackDetails(commands.Cog):
             f"{interaction.user.name} (ID: {interaction.user.id}) invoked /track with URL: {url}"
         )
 
-        api_url = f"{self.api_base}?url={url}"
-
         try:
-            data = await self.fetch_json(api_url, timeout=self.timeout_seconds)
+            data = await self.fetch_json(
+                self.api_base, params={"url": url}, timeout=self.timeout_seconds
+            )
             if not data:
                 await self.send_error(
                     interaction,
@@ -259,17 +265,19 @@ class TrackDetails(commands.Cog):
         more = len(items) - max_items
         return f"{shown} +{more} more"
 
-    async def fetch_json(self, url: str, timeout: int = 10) -> Optional[Dict[str, Any]]:
-        timeout_cfg = aiohttp.ClientTimeout(total=timeout)
-        async with aiohttp.ClientSession(timeout=timeout_cfg) as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    logging.error(
-                        f"Songlink API responded with status {resp.status}: {text[:200]}"
-                    )
-                    raise RuntimeError(f"API status {resp.status}")
-                return await resp.json()
+    async def fetch_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: int = 10,
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            return await self.http.get_json(url, params=params, timeout=timeout)
+        except HTTPStatusError as e:
+            logging.error(
+                f"Songlink API responded with status {e.status}: {e.body}"
+            )
+            raise RuntimeError(f"API status {e.status}")
 
     def build_platform_buttons(
         self, links_by_platform: Dict[str, Dict[str, Any]]
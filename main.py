@@ -6,9 +6,12 @@ import os
 import yaml
 import asyncio
 import logging
+import time
 from dotenv import load_dotenv
 import datetime
 
+from utils.metrics import metrics
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -139,10 +142,16 @@ async def on_message(message):
 # Load all cogs
 async def load_cogs():
     """Loads all .py files in the 'cogs' folder as extensions."""
+    started = time.perf_counter()
     for filename in os.listdir("./cogs"):
         if filename.endswith(".py"):
-            await bot.load_extension(f"cogs.{filename[:-3]}")
+            # Import plus setup() time per cog; see benchmarks/import_time.py for a breakdown.
+            with metrics.timer(f"startup.{filename[:-3]}"):
+                await bot.load_extension(f"cogs.{filename[:-3]}")
             audit_log(f"Loaded cog: {filename[:-3]}")
+    elapsed = time.perf_counter() - started
+    metrics.observe("startup.load_cogs", elapsed)
+    logging.info(f"Loaded all cogs in {elapsed:.2f}s.")
 
 
 async def main():
@@ -0,0 +1 @@
+"""Shared helpers used by several cogs. Nothing in here is loaded as an extension."""
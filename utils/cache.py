@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from utils.metrics import metrics
+
+
+class ResponseCache:
+    """
+    Small TTL cache for read-only command responses.
+
+    Entries are grouped by (command, guild_id) and keyed within the group by the
+    command's arguments, so a write path can drop everything a command cached for
+    one guild (or for every guild) without knowing the arguments. Invalidation on
+    write is the main mechanism; the TTL is only a backstop for changes that do
+    not go through a write path, such as member renames.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 512):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._groups: Dict[Tuple[str, Optional[int]], Dict[Hashable, Tuple[float, Any]]] = {}
+        self._size = 0
+
+    def get(self, command: str, guild_id: Optional[int], args: Hashable = ()) -> Any:
+        """Return the cached value, or None on a miss or when the entry has expired."""
+        now = time.monotonic()
+        with self._lock:
+            group = self._groups.get((command, guild_id))
+            entry = group.get(args) if group else None
+            if entry is not None and entry[0] > now:
+                metrics.incr(f"cache.{command}.hits")
+                return entry[1]
+            if entry is not None:
+                del group[args]
+                self._size -= 1
+        metrics.incr(f"cache.{command}.misses")
+        return None
+
+    def set(
+        self,
+        command: str,
+        guild_id: Optional[int],
+        value: Any,
+        args: Hashable = (),
+        ttl: Optional[float] = None,
+    ) -> None:
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if self._size >= self.max_entries:
+                self._evict_expired()
+            if self._size >= self.max_entries:
+                # Still full of live entries: start over rather than track recency.
+                self._groups.clear()
+                self._size = 0
+            group = self._groups.setdefault((command, guild_id), {})
+            if args not in group:
+                self._size += 1
+            group[args] = (expires, value)
+
+    def invalidate(self, command: str, guild_id: Optional[int] = None) -> None:
+        """Drop a command's entries for one guild, or for every guild when guild_id is None."""
+        with self._lock:
+            if guild_id is not None:
+                keys = [(command, guild_id)]
+            else:
+                keys = [k for k in self._groups if k[0] == command]
+            for key in keys:
+                group = self._groups.pop(key, None)
+                if group:
+                    self._size -= len(group)
+                    metrics.incr(f"cache.{command}.invalidations")
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for key in list(self._groups):
+            group = self._groups[key]
+            for args in [a for a, (exp, _) in group.items() if exp <= now]:
+                del group[args]
+                self._size -= 1
+            if not group:
+                del self._groups[key]
+
+
+# Process-wide cache shared by every cog, so write paths in one cog can
+# invalidate responses cached by another and entries survive /reload.
+response_cache = ResponseCache()
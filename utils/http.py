@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from utils.metrics import metrics
+
+# Statuses worth retrying: rate limited or a transient upstream failure.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HTTPStatusError(Exception):
+    """Raised when a third-party API answers with a non-retryable or final bad status."""
+
+    def __init__(self, status: int, url: str, body: str = ""):
+        super().__init__(f"HTTP {status} from {url}")
+        self.status = status
+        self.url = url
+        self.body = body
+
+
+class HTTPClient:
+    """
+    One long-lived aiohttp session shared by every cog that calls third-party APIs.
+
+    The connector keeps connections alive and pools them, caches DNS lookups and
+    caps concurrent connections per host. Every request has a default timeout and
+    transient failures are retried with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        *,
+        total_timeout: float = 15.0,
+        connect_timeout: float = 5.0,
+        limit: int = 100,
+        limit_per_host: int = 8,
+        dns_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+    ):
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout, connect=connect_timeout
+        )
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.retries = max(0, retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so it binds to the running event loop.
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_ttl,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={"User-Agent": "ParlourCaretaker (Discord bot)"},
+            )
+        return self._session
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Full-jitter exponential backoff, honouring Retry-After when the server sends one."""
+        if retry_after:
+            try:
+                return min(self.backoff_max, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    async def get_json(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """GET a URL and decode the JSON body, retrying transient failures."""
+        session = self._get_session()
+        request_timeout = (
+            aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        )
+        host = urlsplit(url).hostname or "unknown"
+
+        for attempt in range(self.retries + 1):
+            started = time.perf_counter()
+            retry_after: Optional[str] = None
+            try:
+                metrics.incr("http.requests")
+                async with session.get(
+                    url, params=params, timeout=request_timeout
+                ) as resp:
+                    if resp.status == 200:
+                        data = await resp.json(content_type=None)
+                        metrics.observe(f"http.{host}", time.perf_counter() - started)
+                        return data
+                    body = await resp.text()
+                    if resp.status not in RETRY_STATUSES or attempt >= self.retries:
+                        metrics.incr("http.errors")
+                        raise HTTPStatusError(resp.status, url, body[:200])
+                    retry_after = resp.headers.get("Retry-After")
+                    logging.warning(
+                        f"HTTP {resp.status} from {host}, retrying (attempt {attempt + 1}/{self.retries})."
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= self.retries:
+                    metrics.incr("http.errors")
+                    raise
+                logging.warning(
+                    f"HTTP request to {host} failed ({e!r}), retrying (attempt {attempt + 1}/{self.retries})."
+                )
+            metrics.incr("http.retries")
+            await asyncio.sleep(self._backoff(attempt, retry_after))
+
+        # Unreachable: the final attempt either returns or raises.
+        raise HTTPStatusError(0, url)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# ------------------------------------------------------------
+# Shared instance, reference counted by the cogs that use it
+# ------------------------------------------------------------
+_client: Optional[HTTPClient] = None
+_users = 0
+
+
+def acquire_http_client(config: Optional[Dict[str, Any]] = None) -> HTTPClient:
+    """
+    Return the shared client, creating it on first use. Call release_http_client()
+    from cog_unload so the session is closed once the last user is gone.
+    Settings come from the optional 'http' section of config.yaml.
+    """
+    global _client, _users
+    if _client is None:
+        cfg = (config or {}).get("http", {}) or {}
+        _client = HTTPClient(
+            total_timeout=float(cfg.get("timeout_seconds", 15)),
+            connect_timeout=float(cfg.get("connect_timeout_seconds", 5)),
+            limit_per_host=int(cfg.get("limit_per_host", 8)),
+            dns_ttl=int(cfg.get("dns_cache_seconds", 300)),
+            retries=int(cfg.get("retries", 3)),
+        )
+    _users += 1
+    return _client
+
+
+async def release_http_client() -> None:
+    global _client, _users
+    _users = max(0, _users - 1)
+    if _users == 0 and _client is not None:
+        client, _client = _client, None
+        await client.close()
@@ -0,0 +1,90 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List, Tuple
+
+# Counter increments are also kept per RATE_BUCKET seconds for the last RATE_WINDOW
+# seconds, so /metrics can show current rates rather than lifetime averages.
+RATE_WINDOW = 60
+RATE_BUCKET = 5
+
+
+class Metrics:
+    """
+    Minimal in-process metrics registry.
+
+    Holds counters, gauges and timings in memory so background jobs and hot paths
+    can report what they are doing without any external service. Values are
+    surfaced through the /metrics command. Safe to call from worker threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self.timings: Dict[str, Dict[str, float]] = {}
+        # Ring of (bucket number, counter increments in that bucket).
+        self._buckets: List[Tuple[int, Dict[str, int]]] = [
+            (-1, {}) for _ in range(RATE_WINDOW // RATE_BUCKET)
+        ]
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+            number = int(time.monotonic() // RATE_BUCKET)
+            index = number % len(self._buckets)
+            stamp, bucket = self._buckets[index]
+            if stamp != number:
+                bucket = {}
+                self._buckets[index] = (number, bucket)
+            bucket[name] = bucket.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self.gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record one duration sample, keeping count, total, last and max."""
+        with self._lock:
+            t = self.timings.setdefault(
+                name, {"count": 0, "total": 0.0, "last": 0.0, "max": 0.0}
+            )
+            t["count"] += 1
+            t["total"] += seconds
+            t["last"] = seconds
+            if seconds > t["max"]:
+                t["max"] = seconds
+
+    @contextmanager
+    def timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def _recent_counts(self) -> Dict[str, int]:
+        """Counter increments over roughly the last RATE_WINDOW seconds (lock held)."""
+        number = int(time.monotonic() // RATE_BUCKET)
+        recent: Dict[str, int] = {}
+        for stamp, bucket in self._buckets:
+            if number - stamp < len(self._buckets):
+                for name, amount in bucket.items():
+                    recent[name] = recent.get(name, 0) + amount
+        return recent
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "uptime": time.time() - self.started_at,
+                "counters": dict(self.counters),
+                "recent_counters": self._recent_counts(),
+                "rate_window": RATE_WINDOW,
+                "gauges": dict(self.gauges),
+                "timings": {k: dict(v) for k, v in self.timings.items()},
+            }
+
+
+# Process-wide registry shared by every cog.
+metrics = Metrics()
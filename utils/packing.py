@@ -0,0 +1,54 @@
+import zlib
+from typing import Iterable, Iterator, Tuple
+
+# First byte of every packed blob, so the layout can change without breaking old rows.
+FORMAT_VERSION = 1
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def pack_pairs(pairs: Iterable[Tuple[int, int]]) -> bytes:
+    """
+    Pack (key, value) pairs of non-negative ints, sorted by key, into a compact blob.
+
+    Keys are stored as the difference from the previous key and every number as an
+    unsigned LEB128 varint, then the whole stream is zlib-compressed. Sorted
+    Discord snowflakes shrink from 8 bytes each to a few.
+    """
+    out = bytearray()
+    previous = 0
+    for key, value in pairs:
+        if key < previous or value < 0:
+            raise ValueError("pairs must be sorted by key and non-negative")
+        _write_varint(out, key - previous)
+        _write_varint(out, value)
+        previous = key
+    return bytes([FORMAT_VERSION]) + zlib.compress(bytes(out))
+
+
+def unpack_pairs(blob: bytes) -> Iterator[Tuple[int, int]]:
+    """Yield the (key, value) pairs stored by pack_pairs, in key order."""
+    if not blob or blob[0] != FORMAT_VERSION:
+        raise ValueError("unknown packed format")
+    data = zlib.decompress(blob[1:])
+    key = 0
+    numbers = []
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        numbers.append(value)
+        value = 0
+        shift = 0
+        if len(numbers) == 2:
+            key += numbers[0]
+            yield key, numbers[1]
+            numbers.clear()
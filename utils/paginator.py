@@ -0,0 +1,158 @@
+import logging
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional
+
+import discord
+
+from utils.metrics import metrics
+
+PageFactory = Callable[[int], Awaitable[discord.Embed]]
+
+
+class JumpToPageModal(discord.ui.Modal, title="Jump to page"):
+    def __init__(self, view: "LazyPagedView"):
+        super().__init__()
+        self.view = view
+        self.page = discord.ui.TextInput(
+            label=f"Page number (1-{view.page_count})",
+            placeholder=str(view.index + 1),
+            min_length=1,
+            max_length=len(str(view.page_count)),
+        )
+        self.add_item(self.page)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        try:
+            number = int(str(self.page.value).strip())
+        except ValueError:
+            await interaction.response.send_message(
+                "Please enter a page number.", ephemeral=True
+            )
+            return
+        self.view.index = min(max(number, 1), self.view.page_count) - 1
+        await self.view._show(interaction)
+
+
+class LazyPagedView(discord.ui.View):
+    """
+    Button view that paginates through pages rendered on demand. Restricted to the requesting user.
+
+    Takes a page count and an async factory that builds page `i` (0-based), so a
+    long list only costs the pages someone actually opens. Recently visited pages
+    are kept in a small LRU so paging back and forth does not rebuild them.
+    """
+
+    def __init__(
+        self,
+        user_id: int,
+        page_count: int,
+        page_factory: PageFactory,
+        timeout: Optional[float] = 120,
+        cache_size: int = 8,
+    ):
+        super().__init__(timeout=timeout)
+        self.user_id = user_id
+        self.page_count = max(1, page_count)
+        self.page_factory = page_factory
+        self.cache_size = max(1, cache_size)
+        self.index = 0
+        self._cache: "OrderedDict[int, discord.Embed]" = OrderedDict()
+        if self.page_count <= 2:
+            # Nothing to jump to.
+            self.remove_item(self.jump)
+        self._update_button_states()
+
+    @classmethod
+    def from_pages(
+        cls, user_id: int, pages: List[discord.Embed], timeout: Optional[float] = 120
+    ) -> "LazyPagedView":
+        """Wrap an already built list of embeds."""
+
+        async def factory(index: int) -> discord.Embed:
+            return pages[index]
+
+        return cls(user_id, len(pages), factory, timeout=timeout, cache_size=1)
+
+    async def get_page(self, index: int) -> discord.Embed:
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            metrics.incr("paginator.page_hits")
+            return self._cache[index]
+        metrics.incr("paginator.page_renders")
+        embed = await self.page_factory(index)
+        self._cache[index] = embed
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return embed
+
+    async def send(
+        self, interaction: discord.Interaction, ephemeral: bool = True
+    ) -> None:
+        """Render the first page and send it with this view, as a response or a followup."""
+        embed = await self.get_page(self.index)
+        view = self if self.page_count > 1 else discord.utils.MISSING
+        if interaction.response.is_done():
+            await interaction.followup.send(embed=embed, view=view, ephemeral=ephemeral)
+        else:
+            await interaction.response.send_message(
+                embed=embed, view=view, ephemeral=ephemeral
+            )
+
+    def _update_button_states(self):
+        at_start = self.index == 0
+        at_end = self.index >= self.page_count - 1
+        self.first.disabled = at_start
+        self.prev.disabled = at_start
+        self.next.disabled = at_end
+        self.last.disabled = at_end
+        self.jump.label = f"{self.index + 1}/{self.page_count}"
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message(
+                "Only the requester can use these buttons.", ephemeral=True
+            )
+            return False
+        return True
+
+    async def _show(self, interaction: discord.Interaction):
+        self._update_button_states()
+        try:
+            embed = await self.get_page(self.index)
+        except Exception as e:
+            logging.error(f"Failed to render page {self.index + 1}: {e}")
+            embed = discord.Embed(
+                title="Error",
+                description="This page could not be loaded. Please try again.",
+                color=discord.Color.red(),
+            )
+        try:
+            await interaction.response.edit_message(embed=embed, view=self)
+        except discord.InteractionResponded:
+            await interaction.edit_original_response(embed=embed, view=self)
+
+    @discord.ui.button(label="⏮ First", style=discord.ButtonStyle.secondary)
+    async def first(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.index = 0
+        await self._show(interaction)
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def prev(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.index > 0:
+            self.index -= 1
+        await self._show(interaction)
+
+    @discord.ui.button(label="1/1", style=discord.ButtonStyle.primary)
+    async def jump(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(JumpToPageModal(self))
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.index < self.page_count - 1:
+            self.index += 1
+        await self._show(interaction)
+
+    @discord.ui.button(label="Last ⏭", style=discord.ButtonStyle.secondary)
+    async def last(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.index = self.page_count - 1
+        await self._show(interaction)
@@ -0,0 +1,43 @@
+import heapq
+import math
+import random
+from typing import Iterable, List, Optional, Tuple
+
+
+def new_draw_seed() -> int:
+    """A fresh 64-bit seed from the OS, to be logged so a draw can be replayed."""
+    return random.SystemRandom().getrandbits(64)
+
+
+def weighted_sample_without_replacement(
+    weighted: Iterable[Tuple[int, float]],
+    k: int,
+    rng: Optional[random.Random] = None,
+) -> List[int]:
+    """
+    Pick up to k distinct items, each draw proportional to its weight among those left.
+
+    Uses exponential keys (Efraimidis-Spirakis): every item gets the key
+    log(u) / weight for a uniform u, and the k largest keys win. This gives the
+    same distribution as repeatedly drawing one ticket and removing all of the
+    winner's tickets, but streams the input once in O(n log k) time and O(k)
+    memory. Winners are returned in draw order. Items with weight <= 0 never win.
+
+    Pass a seeded random.Random to make a draw reproducible; the result then
+    depends only on the seed and on the order of the input.
+    """
+    if k <= 0:
+        return []
+    rng = rng or random.Random()
+    heap: List[Tuple[float, int, int]] = []
+    for position, (item, weight) in enumerate(weighted):
+        if weight <= 0:
+            continue
+        # 1 - random() lies in (0, 1], so the log is always defined.
+        key = math.log(1.0 - rng.random()) / weight
+        entry = (key, position, item)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, entry)
+    return [item for _, _, item in sorted(heap, reverse=True)]